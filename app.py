@@ -1,8 +1,6 @@
+import importlib
+
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
 
 # --------------------------------------------------
 # Page config
@@ -13,971 +11,42 @@ st.set_page_config(
     page_icon="🌿"
 )
 
-# --------------------------------------------------
-# Load data with proper error handling
-# --------------------------------------------------
-@st.cache_data
-def load_data():
-    try:
-        # Load main fusion dataset
-        fusion = pd.read_csv("fusion_multimodal_dataset.csv")
-        model_results = pd.read_csv("model_results_summary.csv")
-        feature_importance = pd.read_csv("feature_importance.csv", index_col=0)  # Fix: Set first column as index
-        
-        # Load Western Ghats specific data
-        audio_species = pd.read_csv("data/audio_species_richness_WESTERN_GHATS.csv")
-        audio_summary = pd.read_csv("data/audio_signal_summary_WESTERN_GHATS.csv")
-        gbif_data = pd.read_csv("data/gbif_biodiversity_yearly_WESTERN_GHATS.csv")
-        
-        # Load species stress indicators if available
-        try:
-            species_stress = pd.read_csv("data/species_stress_indicators_WESTERN_GHATS.csv")
-        except FileNotFoundError:
-            species_stress = None
-        
-        return fusion, model_results, feature_importance, audio_species, audio_summary, gbif_data, species_stress
-        
-    except FileNotFoundError as e:
-        st.error(f"Data file not found: {e}")
-        st.error("Please run the notebooks first to generate the required data files.")
-        st.stop()
-
-fusion, model_results, feature_importance, audio_species, audio_summary, gbif_data, species_stress = load_data()
-
-# --------------------------------------------------
-# Sidebar
-# --------------------------------------------------
-st.sidebar.title("🌿 EcoFusionAI")
-st.sidebar.markdown("**Western Ghats Biodiversity Monitoring**")
-
-section = st.sidebar.radio(
-    "Navigate Dashboard",
-    [
-        "🏠 Overview",
-        "📈 Biodiversity Trends",
-        "🚨 Early Warning System",
-        "🤖 ML Model Insights",
-        "🛰️ NDVI Regional Analysis"
-    ]
-)
-
-# Add data summary in sidebar
-st.sidebar.markdown("---")
-st.sidebar.markdown("**📋 Data Summary:**")
-st.sidebar.markdown(f"• **Temporal Coverage:** {fusion.year.min()}-{fusion.year.max()}")
-st.sidebar.markdown(f"• **Bird Species:** {len(audio_species)} (Western Ghats)")
-st.sidebar.markdown(f"• **GBIF Records:** {len(gbif_data)} yearly summaries")
-st.sidebar.markdown(f"• **Audio Signal:** {audio_summary['audio_signal_strength'].iloc[0]:.3f}")
-
-# Add GBIF citation in sidebar
-st.sidebar.markdown("---")
-st.sidebar.markdown("**📚 Data Citation:**")
-st.sidebar.markdown("GBIF.org (28 January 2026)")
-st.sidebar.markdown("[GBIF Occurrence Download](https://doi.org/10.15468/dl.zdxvtf)")
-st.sidebar.markdown("*Herbarium of French Institute of Pondicherry*")
-
-# --------------------------------------------------
-# Overview
-# --------------------------------------------------
-if section == "🏠 Overview":
-    st.title("🌿 EcoFusionAI – Multimodal Biodiversity Early Warning System")
-    
-    st.markdown("""
-    ### 🎯 **Research Objective**
-    **EcoFusionAI** is a research-grade, multimodal early-warning system that detects biodiversity stress trends in the **Western Ghats biodiversity hotspot** using:
-    
-    - 🛰️ **Satellite vegetation health (NDVI)** – Environmental monitoring (2018-2024)
-    - 🦅 **Species occurrence trends (GBIF)** – Long-term biodiversity baseline (1990-2024) 
-    - 🔊 **Bird acoustic activity (BirdCLEF)** – Regional biodiversity indicator (163 species)
-    
-    ### 🧬 **Scientific Approach**
-    All data sources are **geographically filtered to Western Ghats region** (8.0-21.0°N, 73.0-77.5°E) ensuring meaningful ecological correlations and scientific validity.
-    """)
-    
-    # Key metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric(
-            "📅 Analysis Period", 
-            f"{fusion.year.min()}-{fusion.year.max()}",
-            f"{len(fusion)} years"
-        )
-    
-    with col2:
-        st.metric(
-            "🦜 Bird Species", 
-            f"{len(audio_species)}",
-            "Western Ghats filtered"
-        )
-    
-    with col3:
-        st.metric(
-            "📊 GBIF Records", 
-            f"{len(gbif_data)}",
-            "Yearly summaries"
-        )
-    
-    with col4:
-        current_stress = fusion['eco_stress_index'].iloc[-1]
-        stress_status = "🔴 High" if current_stress > 0.6 else "🟡 Medium" if current_stress > 0.4 else "🟢 Low"
-        st.metric(
-            "⚠️ Current Stress", 
-            f"{current_stress:.3f}",
-            stress_status
-        )
-    
-    # Navigation guide
-    st.markdown("---")
-    st.info("""
-    **🔍 Navigation Guide:**
-    
-    📈 **Biodiversity Trends** - Long-term species patterns
-    
-    🚨 **Early Warning** - Stress detection system
-    
-    🤖 **ML Insights** - Model performance & features
-    
-    🛰️ **NDVI Analysis** - Regional vegetation health
-    """)
-
-# --------------------------------------------------
-# Scientific Methodology
-# --------------------------------------------------
-elif section == "📊 Scientific Methodology":
-    st.title("🔬 Scientific Methodology & Data Integration")
-    
-    st.markdown("""
-    ### 🧠 **Temporal Alignment Strategy**
-    
-    Our approach addresses the challenge of integrating data sources with different temporal characteristics:
-    """)
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **🛰️ NDVI (Environmental)**
-        - **Period:** 2018-2024 (7 years)
-        - **Resolution:** High temporal
-        - **Purpose:** Recent environmental trends
-        - **Source:** MODIS satellite data
-        """)
-    
-    with col2:
-        st.markdown("""
-        **🦅 GBIF (Biodiversity)**
-        - **Period:** 1990-2024 (35 years)
-        - **Resolution:** Low temporal
-        - **Purpose:** Long-term baseline
-        - **Source:** Herbarium specimens
-        """)
-    
-    with col3:
-        st.markdown("""
-        **� Audio (Acoustic)**
-        - **Period:** Regional summary
-        - **Resolution:** Spatial proxy
-        - **Purpose:** Biodiversity indicator
-        - **Source:** BirdCLEF recordings
-        """)
-    
-    st.markdown("---")
-    
-    # Methodology explanation
-    st.markdown("""
-    ### 🔄 **Data Fusion Process**
-    
-    **Step 1: Long-term Baseline**
-    - Keep full GBIF dataset (1990-2024) for statistical reliability
-    - Herbarium data provides credible biodiversity trends over decades
-    
-    **Step 2: Temporal Alignment**
-    - Align GBIF with NDVI period (2018-2024) during fusion analysis
-    - Preserves both long-term credibility and recent environmental relevance
-    
-    **Step 3: Multimodal Integration**
-    - Combine aligned datasets with regional audio signal
-    - Create composite eco-stress index for early warning
-    """)
-    
-    # Show actual data alignment
-    st.subheader("📈 Data Alignment Visualization")
-    
-    fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 10))
-    
-    # GBIF long-term trend
-    ax1.plot(gbif_data['year'], gbif_data['species_per_1000_occ'], 'b-o', alpha=0.7, label='Full GBIF Dataset')
-    ax1.axvspan(2018, 2024, alpha=0.2, color='green', label='Fusion Period')
-    ax1.set_title('GBIF Biodiversity Trends (Long-term Baseline)')
-    ax1.set_ylabel('Species per 1000 Occurrences')
-    ax1.legend()
-    ax1.grid(alpha=0.3)
-    
-    # NDVI recent trend
-    ndvi_data = pd.read_csv("data/ndvi_temporal_dataset_POINT_SAMPLING.csv")
-    ndvi_yearly = ndvi_data.groupby('year')['ndvi_mean'].mean().reset_index()
-    ax2.plot(ndvi_yearly['year'], ndvi_yearly['ndvi_mean'], 'g-o', alpha=0.7, label='NDVI Trends')
-    ax2.set_title('NDVI Environmental Trends (Recent Period)')
-    ax2.set_ylabel('NDVI Mean')
-    ax2.legend()
-    ax2.grid(alpha=0.3)
-    
-    # Fusion result
-    ax3.plot(fusion['year'], fusion['eco_stress_index'], 'r-o', alpha=0.7, label='Eco-Stress Index')
-    ax3.axhline(y=0.5, color='orange', linestyle='--', alpha=0.7, label='Medium Risk Threshold')
-    ax3.set_title('Multimodal Fusion Result (Early Warning Index)')
-    ax3.set_ylabel('Stress Index')
-    ax3.set_xlabel('Year')
-    ax3.legend()
-    ax3.grid(alpha=0.3)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    
-    # Scientific justification
-    st.markdown("---")
-    st.markdown("""
-    ### 🎯 **Scientific Justification**
-    
-    **❓ "Why not restrict GBIF to 2018-2024?"**
-    
-    **✅ Answer:** Herbarium records are not sampled uniformly every year. Restricting to only recent years would reduce statistical reliability. Our approach computes biodiversity indicators from long-term data but aligns them with recent environmental trends during fusion - preserving both credibility and comparability.
-    
-    **Key Benefits:**
-    - 📊 **Statistical Reliability:** Long-term GBIF baseline prevents sampling bias
-    - 🌿 **Environmental Relevance:** Recent NDVI trends capture current conditions  
-    - 🔬 **Scientific Rigor:** Temporal alignment during analysis (not preprocessing)
-    - 🎓 **Thesis Defense:** Demonstrates sophisticated understanding of ecological data
-    """)
-    
-    # Data quality metrics
-    st.subheader("📋 Data Quality Summary")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **🛰️ NDVI Quality**
-        - ✅ Cloud-masked MODIS data
-        - ✅ Point sampling approach
-        - ✅ Western Ghats filtered
-        - ✅ 7-year temporal coverage
-        """)
-    
-    with col2:
-        st.markdown("""
-        **🦅 GBIF Quality**
-        - ✅ Curated herbarium specimens
-        - ✅ Geographic filtering applied
-        - ✅ Sampling bias correction
-        - ✅ 25,023 total records
-        """)
-    
-    with col3:
-        st.markdown("""
-        **🔊 Audio Quality**
-        - ✅ 163 Western Ghats species
-        - ✅ 2,175 recordings analyzed
-        - ✅ Regional biodiversity proxy
-        - ✅ Species-specific indicators
-        """)
-
-# --------------------------------------------------
-# Biodiversity Trends
-# --------------------------------------------------
-elif section == "📈 Biodiversity Trends":
-    st.title("📈 Long-Term Biodiversity Trends Analysis")
-    
-    st.markdown("""
-    ### 🔍 **GBIF Biodiversity Patterns (1990-2024)**
-    
-    This analysis shows **sampling-corrected species richness** from the Herbarium of French Institute of Pondicherry, 
-    filtered specifically for the Western Ghats region.
-    """)
-    
-    # Main biodiversity trend
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-    
-    # Full GBIF trend
-    ax1.plot(gbif_data["year"], gbif_data["species_per_1000_occ"], 'b-o', linewidth=2, markersize=6)
-    ax1.axvspan(2018, 2024, alpha=0.2, color='green', label='Fusion Analysis Period')
-    ax1.set_title("Long-term Biodiversity Baseline (Full GBIF Dataset)", fontsize=14, fontweight='bold')
-    ax1.set_ylabel("Species per 1000 Occurrences")
-    ax1.grid(alpha=0.3)
-    ax1.legend()
-    
-    # Fusion period detail
-    fusion_years = fusion["year"]
-    fusion_biodiversity = fusion["species_per_1000_occ"]
-    ax2.plot(fusion_years, fusion_biodiversity, 'g-o', linewidth=3, markersize=8, label='Fusion Period')
-    ax2.set_title("Biodiversity Trends in Fusion Analysis Period (2018-2024)", fontsize=14, fontweight='bold')
-    ax2.set_ylabel("Species per 1000 Occurrences")
-    ax2.set_xlabel("Year")
-    ax2.grid(alpha=0.3)
-    ax2.legend()
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    
-    # Key insights
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        trend_change = ((fusion_biodiversity.iloc[-1] - fusion_biodiversity.iloc[0]) / fusion_biodiversity.iloc[0]) * 100
-        st.metric(
-            "📊 Trend (2018-2024)", 
-            f"{trend_change:+.1f}%",
-            "Change in species richness"
-        )
-    
-    with col2:
-        peak_year = gbif_data.loc[gbif_data['species_per_1000_occ'].idxmax(), 'year']
-        peak_value = gbif_data['species_per_1000_occ'].max()
-        st.metric(
-            "🏔️ Peak Biodiversity", 
-            f"{int(peak_year)}",
-            f"{peak_value:.2f} species/1000 occ"
-        )
-    
-    with col3:
-        recent_avg = fusion_biodiversity.mean()
-        historical_avg = gbif_data['species_per_1000_occ'].mean()
-        comparison = ((recent_avg - historical_avg) / historical_avg) * 100
-        st.metric(
-            "📈 Recent vs Historical", 
-            f"{comparison:+.1f}%",
-            "Fusion period vs full baseline"
-        )
-    
-    # Scientific interpretation
-    st.markdown("---")
-    st.markdown("""
-    ### 🧬 **Scientific Interpretation**
-    
-    **✅ Sampling Bias Correction Applied**
-    - Uses "species per 1000 occurrences" metric to normalize for observation effort
-    - Accounts for varying collection intensity across years
-    - Reflects true biodiversity patterns, not sampling artifacts
-    
-    **🔍 Key Observations:**
-    - **Long-term baseline** provides statistical credibility for biodiversity trends
-    - **Recent period** shows specific patterns relevant to current conservation needs
-    - **Herbarium data** captures botanical diversity with high taxonomic accuracy
-    
-    **🎯 Conservation Implications:**
-    - Identifies periods of biodiversity stress requiring intervention
-    - Provides baseline for measuring conservation success
-    - Supports evidence-based policy decisions for Western Ghats protection
-    """)
-    
-    # Detailed statistics
-    st.subheader("📊 Statistical Summary")
-    
-    # Create summary table
-    summary_data = {
-        'Period': ['Full Baseline (1990-2024)', 'Fusion Analysis (2018-2024)'],
-        'Years': [len(gbif_data), len(fusion)],
-        'Mean Species/1000': [gbif_data['species_per_1000_occ'].mean(), fusion_biodiversity.mean()],
-        'Min Species/1000': [gbif_data['species_per_1000_occ'].min(), fusion_biodiversity.min()],
-        'Max Species/1000': [gbif_data['species_per_1000_occ'].max(), fusion_biodiversity.max()],
-        'Std Deviation': [gbif_data['species_per_1000_occ'].std(), fusion_biodiversity.std()]
-    }
-    
-    summary_df = pd.DataFrame(summary_data)
-    summary_df = summary_df.round(3)
-    st.dataframe(summary_df, use_container_width=True)
-
-# --------------------------------------------------
-# Early Warning System
-# --------------------------------------------------
-elif section == "🚨 Early Warning System":
-    st.title("🚨 Biodiversity Early Warning System")
-    
-    st.markdown("""
-    ### ⚠️ **Eco-Stress Index Overview**
-    
-    The **Eco-Stress Index** combines multiple biodiversity stress indicators into a single actionable metric 
-    for conservation planning and early intervention.
-    """)
-    
-    # Main stress index visualization
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-    
-    # Stress index over time
-    colors = ['red' if x > 0.6 else 'orange' if x > 0.4 else 'green' for x in fusion['eco_stress_index']]
-    ax1.plot(fusion["year"], fusion["eco_stress_index"], 'k-', linewidth=2, alpha=0.7)
-    ax1.scatter(fusion["year"], fusion["eco_stress_index"], c=colors, s=100, alpha=0.8, edgecolors='black')
-    ax1.axhline(0.6, color="red", linestyle="--", alpha=0.7, label="🔴 High Risk Threshold")
-    ax1.axhline(0.4, color="orange", linestyle="--", alpha=0.7, label="🟡 Medium Risk Threshold")
-    ax1.set_title("Eco-Stress Index Trend (2018-2024)", fontsize=14, fontweight='bold')
-    ax1.set_ylabel("Stress Index (0 = Healthy, 1 = Critical)")
-    ax1.legend()
-    ax1.grid(alpha=0.3)
-    ax1.set_ylim(0, 1)
-    
-    # Component breakdown
-    components = ['NDVI Stress', 'Audio Signal Loss', 'Sampling Pressure']
-    ndvi_stress = 1 - fusion['ndvi_mean']
-    audio_stress = 1 - fusion['audio_signal_strength'] 
-    sampling_stress = fusion['occurrences'] / fusion['occurrences'].max()
-    
-    ax2.plot(fusion["year"], ndvi_stress * 0.5, 'g-o', label='Environmental (50%)', alpha=0.7)
-    ax2.plot(fusion["year"], audio_stress * 0.3, 'b-s', label='Acoustic (30%)', alpha=0.7)
-    ax2.plot(fusion["year"], sampling_stress * 0.2, 'purple', marker='^', label='Sampling (20%)', alpha=0.7)
-    ax2.set_title("Stress Index Components", fontsize=14, fontweight='bold')
-    ax2.set_ylabel("Component Contribution")
-    ax2.set_xlabel("Year")
-    ax2.legend()
-    ax2.grid(alpha=0.3)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    
-    # Current status assessment
-    latest = fusion.iloc[-1]
-    latest_year = int(latest.year)
-    latest_stress = latest.eco_stress_index
-    
-    st.markdown("---")
-    st.subheader(f"🎯 Current Status Assessment ({latest_year})")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if latest_stress > 0.6:
-            st.error(f"🔴 **HIGH RISK** detected in {latest_year}")
-            st.markdown("**Immediate conservation action required**")
-        elif latest_stress > 0.4:
-            st.warning(f"🟡 **MEDIUM RISK** detected in {latest_year}")
-            st.markdown("**Enhanced monitoring recommended**")
-        else:
-            st.success(f"🟢 **LOW RISK** in {latest_year}")
-            st.markdown("**Continue current conservation efforts**")
-    
-    with col2:
-        st.metric(
-            "Current Stress Level",
-            f"{latest_stress:.3f}",
-            f"{'High' if latest_stress > 0.6 else 'Medium' if latest_stress > 0.4 else 'Low'} Risk"
-        )
-    
-    with col3:
-        # Calculate trend
-        if len(fusion) > 1:
-            trend = fusion['eco_stress_index'].iloc[-1] - fusion['eco_stress_index'].iloc[-2]
-            trend_direction = "↗️ Increasing" if trend > 0.05 else "↘️ Decreasing" if trend < -0.05 else "➡️ Stable"
-            st.metric(
-                "Trend Direction",
-                trend_direction,
-                f"{trend:+.3f} change"
-            )
-    
-    # Stress index formula explanation
-    st.markdown("---")
-    st.subheader("🔬 Stress Index Methodology")
-    
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        st.markdown("""
-        **Formula:** `Eco-Stress Index = (1-NDVI)*0.5 + (1-Audio)*0.3 + (Sampling)*0.2`
-        
-        **Components:**
-        - **🌿 Environmental Stress (50%):** Vegetation health decline (1 - NDVI)
-        - **🔊 Acoustic Signal Loss (30%):** Reduced bird activity indicator
-        - **📊 Sampling Pressure (20%):** Observation effort normalization
-        
-        **Interpretation:**
-        - **0.0 - 0.4:** 🟢 Low stress - ecosystem stable
-        - **0.4 - 0.6:** 🟡 Medium stress - enhanced monitoring needed
-        - **0.6 - 1.0:** 🔴 High stress - immediate intervention required
-        """)
-    
-    with col2:
-        st.info("""
-        **🎯 Conservation Actions:**
-        
-        **🔴 High Risk:**
-        - Immediate habitat protection
-        - Species-specific interventions
-        - Enhanced monitoring protocols
-        
-        **🟡 Medium Risk:**
-        - Preventive conservation measures
-        - Habitat connectivity improvement
-        - Regular biodiversity assessments
-        
-        **🟢 Low Risk:**
-        - Continue current efforts
-        - Long-term monitoring
-        - Sustainable management
-        """)
-    
-    # Historical risk periods
-    st.subheader("📅 Historical Risk Assessment")
-    
-    risk_summary = []
-    for _, row in fusion.iterrows():
-        year = int(row['year'])
-        stress = row['eco_stress_index']
-        if stress > 0.6:
-            risk_level = "🔴 High Risk"
-        elif stress > 0.4:
-            risk_level = "🟡 Medium Risk"
-        else:
-            risk_level = "🟢 Low Risk"
-        risk_summary.append({'Year': year, 'Stress Index': f"{stress:.3f}", 'Risk Level': risk_level})
-    
-    risk_df = pd.DataFrame(risk_summary)
-    st.dataframe(risk_df, use_container_width=True)
-
-# --------------------------------------------------
-# ML Model Insights
-# --------------------------------------------------
-elif section == "🤖 ML Model Insights":
-    st.title("🤖 Machine Learning Model Analysis")
-    
-    st.markdown("""
-    ### 🔍 **Model Performance Overview**
-    
-    Our multimodal approach uses two complementary machine learning models to understand 
-    biodiversity-environment relationships in the Western Ghats.
-    """)
-    
-    # Model performance comparison
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("📊 Model Performance Metrics")
-        
-        # Enhanced model results display
-        model_display = model_results.copy()
-        model_display['RMSE'] = model_display['RMSE'].round(4)
-        model_display['R2'] = model_display['R2'].round(4)
-        
-        # Add performance interpretation
-        for idx, row in model_display.iterrows():
-            if row['R2'] < 0:
-                model_display.loc[idx, 'Interpretation'] = "Expected (small dataset)"
-            elif row['R2'] < 0.3:
-                model_display.loc[idx, 'Interpretation'] = "Weak relationship"
-            elif row['R2'] < 0.7:
-                model_display.loc[idx, 'Interpretation'] = "Moderate relationship"
-            else:
-                model_display.loc[idx, 'Interpretation'] = "Strong relationship"
-        
-        st.dataframe(model_display, use_container_width=True)
-        
-        # Performance context
-        st.info("""
-        **📝 Performance Context:**
-        
-        ⚠️ **Negative R² is expected** due to small sample size (7 years)
-        
-        ✅ **Methodology is scientifically valid** - proof-of-concept system
-        
-        🎯 **Focus on feature importance** rather than prediction accuracy
-        """)
-    
-    with col2:
-        st.subheader("🎯 Model Comparison")
-        
-        # Create performance visualization
-        fig, ax = plt.subplots(figsize=(8, 6))
-        
-        models = model_results['Model']
-        r2_scores = model_results['R2']
-        colors = ['skyblue', 'lightcoral']
-        
-        bars = ax.bar(models, r2_scores, color=colors, alpha=0.7, edgecolor='black')
-        ax.set_title("Model Performance Comparison", fontsize=12, fontweight='bold')
-        ax.set_ylabel("R² Score")
-        ax.grid(axis='y', alpha=0.3)
-        ax.axhline(y=0, color='red', linestyle='--', alpha=0.5, label='Baseline')
-        
-        # Add value labels on bars
-        for bar, score in zip(bars, r2_scores):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.01 if height >= 0 else height - 0.03,
-                   f'{score:.3f}', ha='center', va='bottom' if height >= 0 else 'top', fontweight='bold')
-        
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        st.pyplot(fig)
-        
-        # Model insights
-        best_model = model_results.loc[model_results['R2'].idxmax(), 'Model']
-        st.success(f"🏆 **Best Performing Model:** {best_model}")
-        
-        if 'Random Forest' in best_model:
-            st.markdown("✅ **Nonlinear ecological relationships detected**")
-        else:
-            st.markdown("📊 **Linear relationships dominate**")
-    
-    # Feature importance analysis
-    st.markdown("---")
-    st.subheader("🔍 Feature Importance Analysis")
-    
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        # Feature importance visualization
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        # Sort features by importance
-        feature_imp_sorted = feature_importance.sort_values('importance', ascending=True)
-        
-        colors = ['#2E8B57', '#4682B4', '#DAA520', '#CD853F']
-        bars = ax.barh(range(len(feature_imp_sorted)), feature_imp_sorted['importance'], 
-                      color=colors[:len(feature_imp_sorted)], alpha=0.8, edgecolor='black')
-        
-        ax.set_yticks(range(len(feature_imp_sorted)))
-        ax.set_yticklabels(feature_imp_sorted.index)
-        ax.set_xlabel("Importance Score")
-        ax.set_title("Feature Importance - Drivers of Biodiversity Change", fontsize=12, fontweight='bold')
-        ax.grid(axis='x', alpha=0.3)
-        
-        # Add percentage labels
-        total_importance = feature_imp_sorted['importance'].sum()
-        for i, (bar, importance) in enumerate(zip(bars, feature_imp_sorted['importance'])):
-            percentage = (importance / total_importance) * 100
-            ax.text(bar.get_width() + 0.01, bar.get_y() + bar.get_height()/2,
-                   f'{percentage:.1f}%', ha='left', va='center', fontweight='bold')
-        
-        plt.tight_layout()
-        st.pyplot(fig)
-    
-    with col2:
-        st.markdown("**🎯 Key Insights:**")
-        
-        # Get top feature
-        top_feature = feature_importance.loc[feature_importance['importance'].idxmax()]
-        top_feature_name = str(top_feature.name)  # Convert to string to avoid AttributeError
-        top_importance = top_feature['importance']
-        
-        st.metric(
-            "🏆 Most Important Driver",
-            top_feature_name.replace('_', ' ').title(),
-            f"{(top_importance/feature_importance['importance'].sum())*100:.1f}%"
-        )
-        
-        # Ecological interpretation
-        if 'ndvi' in top_feature_name.lower():
-            st.success("🌿 **Environmental factors dominate** biodiversity patterns")
-            st.markdown("**Implication:** Vegetation health is the primary driver of species richness changes")
-        elif 'audio' in top_feature_name.lower():
-            st.info("🔊 **Acoustic signals are key** biodiversity indicators")
-            st.markdown("**Implication:** Bird activity strongly correlates with ecosystem health")
-        elif 'occurrence' in top_feature_name.lower():
-            st.warning("📊 **Sampling effort significantly affects** biodiversity measures")
-            st.markdown("**Implication:** Observation bias correction is crucial")
-        
-        # Feature ranking
-        st.markdown("**📊 Feature Ranking:**")
-        for i, (feature, row) in enumerate(feature_importance.sort_values('importance', ascending=False).iterrows(), 1):
-            percentage = (row['importance'] / feature_importance['importance'].sum()) * 100
-            st.markdown(f"{i}. **{feature.replace('_', ' ').title()}** ({percentage:.1f}%)")
-    
-    # Scientific implications
-    st.markdown("---")
-    st.subheader("🧬 Scientific Implications")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        **🌿 Environmental Dominance**
-        
-        If NDVI features rank highest:
-        - Vegetation health drives biodiversity
-        - Climate/habitat quality is primary factor
-        - Conservation should focus on habitat protection
-        """)
-    
-    with col2:
-        st.markdown("""
-        **🔊 Acoustic Indicators**
-        
-        If audio features are important:
-        - Bird activity reflects ecosystem health
-        - Acoustic monitoring is valuable
-        - Species-specific conservation needed
-        """)
-    
-    with col3:
-        st.markdown("""
-        **📊 Sampling Effects**
-        
-        If occurrence features dominate:
-        - Observer bias significantly affects results
-        - Data collection standardization needed
-        - Statistical corrections are crucial
-        """)
-    
-    # Model limitations and future work
-    st.markdown("---")
-    st.subheader("⚠️ Model Limitations & Future Directions")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        **🚧 Current Limitations:**
-        - Small temporal dataset (7 years)
-        - Limited to Western Ghats region
-        - Prototype-level system
-        - Audio signal aggregated regionally
-        - Point sampling approach for NDVI
-        """)
-    
-    with col2:
-        st.markdown("""
-        **🚀 Future Enhancements:**
-        - Expanded temporal coverage
-        - Real-time satellite integration
-        - Species-specific audio analysis
-        - Deep learning for audio signals
-        - Habitat fragmentation metrics
-        """)
-
-# --------------------------------------------------
-# NDVI Regional Analysis
-# --------------------------------------------------
-elif section == "🛰️ NDVI Regional Analysis":
-    st.title("🛰️ NDVI Regional Analysis - Environmental Monitoring")
-    
-    st.markdown("""
-    ### 🌿 **Vegetation Health Monitoring**
-    
-    This section shows **Normalized Difference Vegetation Index (NDVI)** trends across different 
-    Western Ghats regions, providing the environmental foundation for our multimodal analysis.
-    """)
-    
-    # Load NDVI data
-    try:
-        ndvi_raw = pd.read_csv("data/ndvi_temporal_dataset_POINT_SAMPLING.csv")
-        
-        # Regional analysis
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            st.subheader("📊 Regional NDVI Trends")
-            
-            # Region selector
-            regions = sorted(ndvi_raw['region'].unique())
-            selected_regions = st.multiselect(
-                "Select regions to analyze:",
-                regions,
-                default=regions[:3] if len(regions) > 3 else regions
-            )
-        
-        with col2:
-            st.subheader("📋 Analysis Options")
-            
-            show_aggregated = st.checkbox("Show aggregated trend", value=True)
-            show_individual = st.checkbox("Show individual regions", value=True)
-            
-            # NDVI interpretation guide
-            st.info("""
-            **🌿 NDVI Interpretation:**
-            - **0.8-1.0:** Dense vegetation
-            - **0.6-0.8:** Moderate vegetation  
-            - **0.4-0.6:** Sparse vegetation
-            - **0.2-0.4:** Very sparse/stressed
-            - **<0.2:** Bare soil/water
-            """)
-        
-        if selected_regions:
-            # Filter data
-            filtered_data = ndvi_raw[ndvi_raw['region'].isin(selected_regions)]
-            
-            # Create comprehensive visualization
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-            
-            # 1. Individual region trends
-            if show_individual:
-                for i, region in enumerate(selected_regions):
-                    region_data = filtered_data[filtered_data['region'] == region]
-                    ax1.plot(region_data['year'], region_data['ndvi_mean'], 
-                            marker='o', linewidth=2, label=region, alpha=0.8)
-                
-                ax1.set_title("NDVI Trends by Region", fontsize=12, fontweight='bold')
-                ax1.set_ylabel("NDVI Mean")
-                ax1.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-                ax1.grid(alpha=0.3)
-            
-            # 2. Aggregated trend (used in fusion)
-            if show_aggregated:
-                yearly_ndvi = filtered_data.groupby('year')['ndvi_mean'].mean().reset_index()
-                ax2.plot(yearly_ndvi['year'], yearly_ndvi['ndvi_mean'], 
-                        'g-o', linewidth=3, markersize=8, label='Aggregated NDVI')
-                ax2.set_title("Aggregated NDVI Trend (Used in Fusion)", fontsize=12, fontweight='bold')
-                ax2.set_ylabel("NDVI Mean")
-                ax2.legend()
-                ax2.grid(alpha=0.3)
-            
-            # 3. NDVI variability
-            for region in selected_regions:
-                region_data = filtered_data[filtered_data['region'] == region]
-                ax3.plot(region_data['year'], region_data['ndvi_std'], 
-                        marker='s', linewidth=2, label=f"{region} (std)", alpha=0.7)
-            
-            ax3.set_title("NDVI Variability by Region", fontsize=12, fontweight='bold')
-            ax3.set_ylabel("NDVI Standard Deviation")
-            ax3.set_xlabel("Year")
-            ax3.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-            ax3.grid(alpha=0.3)
-            
-            # 4. Regional comparison (latest year)
-            latest_year = filtered_data['year'].max()
-            latest_data = filtered_data[filtered_data['year'] == latest_year]
-            
-            bars = ax4.bar(latest_data['region'], latest_data['ndvi_mean'], 
-                          color='green', alpha=0.7, edgecolor='black')
-            ax4.set_title(f"Regional NDVI Comparison ({int(latest_year)})", fontsize=12, fontweight='bold')
-            ax4.set_ylabel("NDVI Mean")
-            ax4.tick_params(axis='x', rotation=45)
-            ax4.grid(axis='y', alpha=0.3)
-            
-            # Add value labels on bars
-            for bar, value in zip(bars, latest_data['ndvi_mean']):
-                ax4.text(bar.get_x() + bar.get_width()/2., bar.get_height() + 0.01,
-                        f'{value:.3f}', ha='center', va='bottom', fontweight='bold')
-            
-            plt.tight_layout()
-            st.pyplot(fig)
-            
-            # Regional statistics
-            st.markdown("---")
-            st.subheader("📊 Regional Statistics Summary")
-            
-            # Calculate comprehensive statistics
-            regional_stats = filtered_data.groupby('region').agg({
-                'ndvi_mean': ['mean', 'min', 'max', 'std'],
-                'ndvi_std': 'mean',
-                'num_samples': 'mean'
-            }).round(3)
-            
-            # Flatten column names
-            regional_stats.columns = ['Mean_NDVI', 'Min_NDVI', 'Max_NDVI', 'NDVI_Variability', 
-                                    'Avg_Internal_Std', 'Avg_Samples']
-            
-            # Add health assessment
-            regional_stats['Health_Status'] = regional_stats['Mean_NDVI'].apply(
-                lambda x: '🟢 Excellent' if x > 0.7 else '🟡 Good' if x > 0.6 else '🟠 Moderate' if x > 0.5 else '🔴 Poor'
-            )
-            
-            st.dataframe(regional_stats, use_container_width=True)
-            
-            # Key insights
-            st.markdown("---")
-            st.subheader("🔍 Environmental Insights")
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                healthiest = regional_stats['Mean_NDVI'].idxmax()
-                healthiest_value = regional_stats.loc[healthiest, 'Mean_NDVI']
-                st.metric(
-                    "🌿 Healthiest Region",
-                    healthiest,
-                    f"{healthiest_value:.3f} NDVI"
-                )
-            
-            with col2:
-                most_stressed = regional_stats['Mean_NDVI'].idxmin()
-                stressed_value = regional_stats.loc[most_stressed, 'Mean_NDVI']
-                st.metric(
-                    "⚠️ Most Stressed Region",
-                    most_stressed,
-                    f"{stressed_value:.3f} NDVI"
-                )
-            
-            with col3:
-                most_variable = regional_stats['NDVI_Variability'].idxmax()
-                variable_value = regional_stats.loc[most_variable, 'NDVI_Variability']
-                st.metric(
-                    "📊 Most Variable Region",
-                    most_variable,
-                    f"{variable_value:.3f} std"
-                )
-            
-            # Temporal analysis
-            st.subheader("📈 Temporal Trends Analysis")
-            
-            # Calculate trends for each region
-            trend_analysis = []
-            for region in selected_regions:
-                region_data = filtered_data[filtered_data['region'] == region].sort_values('year')
-                if len(region_data) > 1:
-                    # Simple linear trend
-                    years = region_data['year'].values
-                    ndvi_values = region_data['ndvi_mean'].values
-                    trend_slope = np.polyfit(years, ndvi_values, 1)[0]
-                    
-                    # Trend interpretation
-                    if trend_slope > 0.01:
-                        trend_status = "🟢 Improving"
-                    elif trend_slope < -0.01:
-                        trend_status = "🔴 Declining"
-                    else:
-                        trend_status = "🟡 Stable"
-                    
-                    trend_analysis.append({
-                        'Region': region,
-                        'Trend_Slope': f"{trend_slope:.4f}",
-                        'Trend_Status': trend_status,
-                        'Total_Change': f"{(ndvi_values[-1] - ndvi_values[0]):.3f}",
-                        'Percent_Change': f"{((ndvi_values[-1] - ndvi_values[0]) / ndvi_values[0] * 100):+.1f}%"
-                    })
-            
-            if trend_analysis:
-                trend_df = pd.DataFrame(trend_analysis)
-                st.dataframe(trend_df, use_container_width=True)
-            
-            # Connection to fusion analysis
-            st.markdown("---")
-            st.subheader("🔗 Connection to Multimodal Analysis")
-            
-            st.markdown("""
-            **🔄 From Regional NDVI to Ecosystem Monitoring:**
-            
-            1. **Regional Extraction:** Individual NDVI trends shown above
-            2. **Temporal Aggregation:** Combined into yearly ecosystem-wide signal
-            3. **Multimodal Fusion:** Integrated with biodiversity and acoustic data
-            4. **Early Warning:** Contributes to composite eco-stress index
-            
-            **🎯 Key Contribution:** NDVI provides the **environmental foundation** for understanding 
-            biodiversity stress patterns in the Western Ghats ecosystem.
-            """)
-            
-        else:
-            st.warning("Please select at least one region to analyze.")
-            
-    except FileNotFoundError:
-        st.error("NDVI data not found. Please run Notebook 1 first to generate NDVI temporal dataset.")
-    except Exception as e:
-        st.error(f"Error loading NDVI data: {e}")
-        st.info("Please ensure all required data files are available.")
-
-# --------------------------------------------------
-# Footer
-# --------------------------------------------------
-st.markdown("---")
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.markdown("**🌿 EcoFusionAI**")
-    st.markdown("Research-grade multimodal early-warning system")
-
-with col2:
-    st.markdown("**🎓 Academic Project**")
-    st.markdown("Final Year BE - Computer Engineering (SPPU)")
-
-with col3:
-    st.markdown("**📊 Data Sources**")
-    st.markdown("GBIF • MODIS • BirdCLEF")
-
-st.markdown("---")
-st.caption("🔬 Scientific methodology aligned with temporal data characteristics | 🌍 Western Ghats biodiversity hotspot focus")
\ No newline at end of file
+from ecofusion import tracing  # noqa: E402 (after page config)
+from ecofusion.data import pin_snapshot  # noqa: E402
+from ecofusion.layout import render_footer, render_sidebar_summary, render_timing_panel  # noqa: E402
+from ecofusion.pages import NAVIGATION, PAGES  # noqa: E402
+
+# Per-rerun timings are shown with ?debug=1 in the URL or ECOFUSION_TRACE=1
+show_timings = "debug" in st.query_params or tracing.is_enabled()
+
+with tracing.capture(enabled=show_timings) as rerun_spans, tracing.span("app.rerun"):
+    # One data version for the whole rerun, even if the watcher swaps in a new one meanwhile
+    with tracing.span("app.pin_snapshot"):
+        snapshot = pin_snapshot()
+
+    # --------------------------------------------------
+    # Sidebar
+    # --------------------------------------------------
+    st.sidebar.title("🌿 EcoFusionAI")
+    st.sidebar.markdown("**Western Ghats Biodiversity Monitoring**")
+
+    section = st.sidebar.radio("Navigate Dashboard", NAVIGATION)
+
+    with tracing.span("app.sidebar_summary"):
+        render_sidebar_summary(snapshot)
+
+    # --------------------------------------------------
+    # Selected page
+    # --------------------------------------------------
+    with tracing.span("app.import_page", page=PAGES[section]):
+        page = importlib.import_module(PAGES[section])
+    with tracing.span(f"page.{PAGES[section].rsplit('.', 1)[-1]}"):
+        page.render()
+
+    # --------------------------------------------------
+    # Footer
+    # --------------------------------------------------
+    render_footer()
+
+if show_timings:
+    render_timing_panel(rerun_spans)
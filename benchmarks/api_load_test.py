@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+EcoFusionAI Query API Load Test
+Starts the read-only API (ecofusion.api) in its own process and drives it
+with many concurrent keep-alive clients for a fixed duration. Clients request
+a mix of /stress, /ndvi, /richness and /risk queries; a configurable share of
+requests revalidate with If-None-Match (expecting 304). Reports sustained
+requests per second, latency percentiles per endpoint and the status mix.
+
+Usage:
+    python benchmarks/api_load_test.py --clients 64 --duration 20
+    python benchmarks/api_load_test.py --synthetic --regions 2000 --years 40 --revalidate 0.8 --json api.json
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from latency import percentile  # benchmarks/latency.py, next to this script
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(port, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+            connection.request("GET", "/version")
+            response = connection.getresponse()
+            body = json.loads(response.read())
+            connection.close()
+            return body
+        except (ConnectionError, OSError):
+            time.sleep(0.2)
+    raise TimeoutError(f"API did not start on port {port}")
+
+
+def query_mix(port, rng, n_queries=200, richness_regions=()):
+    """Distinct URLs partner tools would ask for: regions × year windows × formats
+
+    /richness is partitioned by the pipeline's NDVI regions, so its region
+    filters come from those partitions rather than the NDVI table.
+    """
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    connection.request("GET", "/ndvi")
+    ndvi = json.loads(connection.getresponse().read())
+    connection.close()
+    regions = sorted({row[0] for row in ndvi["data"]})
+    years = sorted({row[1] for row in ndvi["data"]})
+
+    urls = ["/stress", "/risk", "/richness", "/ndvi"]
+    while len(urls) < n_queries:
+        first = rng.choice(years)
+        window = f"year_from={first}&year_to={min(first + rng.randint(0, 5), years[-1])}"
+        endpoint = rng.choice(["/stress", "/ndvi", "/ndvi", "/risk"] + (["/richness"] if richness_regions else []))
+        region = rng.choice(richness_regions if endpoint == "/richness" else regions)
+        fmt = "&format=arrow" if rng.random() < 0.2 else ""
+        urls.append(f"{endpoint}?region={region}&{window}{fmt}")
+    return urls
+
+
+def run_client(client_id, args, port, urls, deadline, results, lock):
+    rng = random.Random(args.seed + client_id)
+    etags = {}
+    samples = []
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    while time.perf_counter() < deadline:
+        url = rng.choice(urls)
+        headers = {}
+        if url in etags and rng.random() < args.revalidate:
+            headers["If-None-Match"] = etags[url]
+        start = time.perf_counter()
+        try:
+            connection.request("GET", url, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+            status = response.status
+        except (ConnectionError, http.client.HTTPException, OSError):
+            connection.close()
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            status, body = "error", b""
+        elapsed = time.perf_counter() - start
+        if status == 200:
+            etags[url] = response.getheader("ETag")
+        samples.append((url.split("?")[0], status, elapsed, len(body)))
+    connection.close()
+    with lock:
+        results.extend(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=32, help="concurrent keep-alive clients")
+    parser.add_argument("--duration", type=float, default=15, help="seconds of sustained load")
+    parser.add_argument("--revalidate", type=float, default=0.5, help="share of repeat requests sent with If-None-Match")
+    parser.add_argument("--queries", type=int, default=200, help="distinct URLs in the request mix")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--synthetic", action="store_true", help="serve generated data")
+    parser.add_argument("--regions", type=int, default=100)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--species", type=int, default=500)
+    parser.add_argument("--json", type=Path, help="write the raw report to this file")
+    args = parser.parse_args()
+
+    print("🚀 EcoFusionAI Query API Load Test")
+    print("=" * 60)
+
+    env = {**os.environ, "ECOFUSION_RELOAD_INTERVAL": "0"}
+    if args.synthetic:
+        root = Path(tempfile.mkdtemp(prefix="ecofusion_api_"))
+        env["ECOFUSION_DATA_ROOT"] = str(root)
+        os.environ["ECOFUSION_DATA_ROOT"] = str(root)
+        from ecofusion.synthetic import write_dashboard_dataset
+
+        write_dashboard_dataset(root, args.regions, args.years, args.species, args.seed)
+        print(f"🧪 Synthetic data: {args.regions} regions × {args.years} years → {root}")
+
+    port = free_port()
+    server = subprocess.Popen([sys.executable, "-m", "ecofusion.api", "--port", str(port)], cwd=REPO_ROOT, env=env,
+                              stdout=subprocess.DEVNULL)
+    try:
+        version = wait_ready(port)["version"]
+        from ecofusion import partitioned  # after ECOFUSION_DATA_ROOT is set
+
+        richness_regions = (partitioned.partition_values("gbif_region_yearly", "region")
+                            if partitioned.committed_ns("gbif_region_yearly") is not None else [])
+        urls = query_mix(port, random.Random(args.seed), args.queries, richness_regions)
+        print(f"🌐 Server on port {port}, data version {version}; {len(urls)} distinct queries, "
+              f"{args.clients} clients for {args.duration:.0f} s")
+
+        results, lock = [], threading.Lock()
+        deadline = time.perf_counter() + args.duration
+        threads = [threading.Thread(target=run_client, args=(i, args, port, urls, deadline, results, lock))
+                   for i in range(args.clients)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait()
+
+    by_endpoint = defaultdict(list)
+    statuses = defaultdict(int)
+    for endpoint, status, seconds, size in results:
+        by_endpoint[endpoint].append(seconds)
+        statuses[str(status)] += 1
+    report = {
+        "config": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        "data_version": version,
+        "requests": len(results),
+        "wall_s": wall,
+        "requests_per_s": len(results) / wall,
+        "statuses": dict(statuses),
+        "bytes": sum(size for *_, size in results),
+        "endpoints": {},
+    }
+    print(f"\n📊 {len(results)} requests in {wall:.1f} s → {report['requests_per_s']:.0f} req/s "
+          f"({', '.join(f'{s}: {n}' for s, n in sorted(statuses.items()))})")
+    print(f"  {'endpoint':<12}{'n':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for endpoint, seconds in sorted(by_endpoint.items()):
+        stats = {"n": len(seconds), "p50_ms": percentile(seconds, 50) * 1000,
+                 "p95_ms": percentile(seconds, 95) * 1000, "p99_ms": percentile(seconds, 99) * 1000}
+        report["endpoints"][endpoint] = stats
+        print(f"  {endpoint:<12}{stats['n']:>8}{stats['p50_ms']:>9.2f}{stats['p95_ms']:>9.2f}{stats['p99_ms']:>9.2f}")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"💾 Report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+EcoFusionAI NDVI Cube Benchmark
+Generates a seeded synthetic stack of 16-day NDVI composites (time × y × x)
+and compares the chunked int16 cube (ecofusion/cube.py) with float storage:
+bytes on disk for CSV, float64 and float32 .npy and the cube, then bytes read
+and wall time for a single-date map, a pixel time series, a region window
+over all dates and the whole stack. Random selections (strided, reversed and
+empty slices included) are first checked against numpy indexing.
+
+Float arrays are read through a memory map, so they are charged only the
+4 KiB pages a selection touches; the CSV is charged the whole file, as
+loading it into a DataFrame reads it all.
+
+Usage:
+    python benchmarks/cube_benchmark.py
+    python benchmarks/cube_benchmark.py --times 92 --height 2048 --width 1024 --chunks 8 128 128
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+PAGE = 4096
+
+
+def touched_pages(array, key):
+    """Bytes of the 4 KiB pages a selection of a C-ordered array touches"""
+    offsets = np.arange(array.size, dtype=np.int64).reshape(array.shape)[key].ravel() * array.itemsize
+    return len(np.unique(offsets // PAGE)) * PAGE
+
+
+def timed(function, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def random_key(rng, shape, max_span=64):
+    """Ints and slices (any step, possibly reversed or empty) over at most max_span positions per axis"""
+    key = []
+    for size in shape:
+        if rng.random() < 0.2:
+            key.append(int(rng.integers(-size, size)))
+            continue
+        start = int(rng.integers(-size - 2, size + 2))
+        stop = start + int(rng.integers(-max_span, max_span + 1))
+        step = int(rng.choice([1, 1, 2, 3, -1, -2, -5]))
+        key.append(slice(rng.choice([start, None]), rng.choice([stop, None]) if abs(step) > 1 else stop, step))
+    return tuple(key)
+
+
+def check_selections(cube, raw, n, rng):
+    """cube.read_raw(key) == raw[key] (numpy indexing of the encoded stack) for n random selections"""
+    for _ in range(n):
+        key = random_key(rng, raw.shape)
+        expected = raw[key]
+        values = cube.read_raw(key)
+        if values.shape != expected.shape or not np.array_equal(values, expected):
+            raise AssertionError(f"cube selection {key} does not match numpy indexing")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--times", type=int, default=46, help="composites (23 per year)")
+    parser.add_argument("--height", type=int, default=1024)
+    parser.add_argument("--width", type=int, default=1024)
+    parser.add_argument("--chunks", type=int, nargs=3, metavar=("T", "Y", "X"))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--checks", type=int, default=400, help="random selections compared with numpy indexing")
+    parser.add_argument("--json", type=Path, help="write the raw report to this file")
+    args = parser.parse_args()
+
+    from ecofusion.cube import DEFAULT_CHUNKS, encode, open_cube, write_cube
+    from ecofusion.synthetic import synthetic_ndvi_cube
+
+    print("🚀 EcoFusionAI NDVI Cube Benchmark")
+    print("=" * 50)
+    chunks = tuple(args.chunks or DEFAULT_CHUNKS)
+    stack = synthetic_ndvi_cube(args.times, args.height, args.width, np.random.default_rng(args.seed))
+    print(f"🧪 {args.times} × {args.height} × {args.width} stack, {np.isnan(stack).mean():.0%} cloud, "
+          f"chunks {chunks}")
+
+    report = {"shape": list(stack.shape), "chunks": list(chunks), "storage_mb": {}, "reads": {}}
+    with tempfile.TemporaryDirectory(prefix="ecofusion_cube_") as directory:
+        directory = Path(directory)
+        np.save(directory / "float64.npy", stack.astype(np.float64))
+        np.save(directory / "float32.npy", stack)
+        # CSV size is extrapolated from the first two dates (one row per pixel and date)
+        rows, cols = np.indices(stack.shape[1:])
+        sample = directory / "sample.csv"
+        with sample.open("w") as handle:
+            handle.write("t,y,x,ndvi\n")
+            for t in range(min(2, len(stack))):
+                np.savetxt(handle, np.column_stack([np.full(rows.size, t), rows.ravel(), cols.ravel(),
+                                                    stack[t].ravel()]), fmt=["%d", "%d", "%d", "%.6f"], delimiter=",")
+        csv_bytes = sample.stat().st_size * len(stack) / min(2, len(stack))
+
+        start = time.perf_counter()
+        write_cube(directory / "cube", stack, chunks=chunks)
+        write_seconds = time.perf_counter() - start
+        cube_bytes = open_cube(directory / "cube").stored_bytes()
+        report["storage_mb"] = {"csv": csv_bytes / 1e6, "float64": stack.size * 8 / 1e6,
+                                "float32": stack.size * 4 / 1e6, "cube": cube_bytes / 1e6}
+        report["cube_write_seconds"] = write_seconds
+
+        print(f"\n💾 Storage (cube written in {write_seconds:.1f} s)")
+        for name, megabytes in report["storage_mb"].items():
+            print(f"  {name:<10}{megabytes:10.1f} MB{report['storage_mb']['float64'] / megabytes:8.1f}× vs float64")
+
+        t, y, x = len(stack) // 2, args.height // 2, args.width // 2
+        queries = {
+            "map": (t, slice(None), slice(None)),
+            "pixel series": (slice(None), y, x),
+            "region window": (slice(None), slice(y, y + 100), slice(x, x + 100)),
+            "whole stack": (slice(None),),
+        }
+        start = time.perf_counter()
+        check_selections(open_cube(directory / "cube"), encode(stack), args.checks, np.random.default_rng(args.seed))
+        print(f"\n✅ {args.checks} random selections match numpy indexing ({time.perf_counter() - start:.1f} s)")
+
+        float64 = np.load(directory / "float64.npy", mmap_mode="r")
+        float32 = np.load(directory / "float32.npy", mmap_mode="r")
+        print(f"\n📖 Reads (bytes read from disk, best of 3){'':>4}{'float64':>10}{'float32':>10}{'cube':>10}"
+              f"{'cube ms':>9}{'float64 ms':>12}")
+        for name, key in queries.items():
+            def read_cube():
+                cube = open_cube(directory / "cube")  # cold chunk cache
+                return cube[key], cube
+
+            cube_seconds, (values, cube) = timed(read_cube)
+            float_seconds, expected = timed(lambda: np.array(float64[key], np.float32))
+            assert np.allclose(values, expected, atol=6e-5, equal_nan=True)
+            result = {"float64_mb": touched_pages(float64, key) / 1e6, "float32_mb": touched_pages(float32, key) / 1e6,
+                      "cube_mb": cube.bytes_read / 1e6, "cube_chunks": cube.chunks_read,
+                      "cube_ms": cube_seconds * 1000, "float64_ms": float_seconds * 1000}
+            report["reads"][name] = result
+            print(f"  {name:<42}{result['float64_mb']:9.2f}M{result['float32_mb']:9.2f}M{result['cube_mb']:9.2f}M"
+                  f"{result['cube_ms']:9.1f}{result['float64_ms']:12.1f}")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"\n💾 Report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
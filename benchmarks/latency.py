@@ -0,0 +1,13 @@
+"""
+Helpers shared by the benchmark harnesses (imported as a sibling module of the scripts)
+"""
+
+
+def percentile(values, q):
+    """q-th percentile (0-100) with linear interpolation between ranks; NaN for no values"""
+    ordered = sorted(values)
+    if not ordered:
+        return float("nan")
+    rank = (len(ordered) - 1) * q / 100
+    low, high = int(rank), min(int(rank) + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+EcoFusionAI Concurrent-Session Load Test
+Drives many scripted dashboard sessions at once with Streamlit's AppTest and
+reports per-section render latency (p50/p95/p99), CPU time and peak RSS.
+
+Each session visits every section and exercises the NDVI widgets
+(region selection, aggregated/individual toggles). With --synthetic the
+dashboard is pointed at a generated data root so regions/years can be scaled
+until it breaks.
+
+Usage:
+    python benchmarks/load_test.py --sessions 50 --concurrency 50
+    python benchmarks/load_test.py --synthetic --regions 2000 --years 40 --select 25
+    python benchmarks/load_test.py --charts matplotlib   # server-side PNG charts, for comparison
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from ecofusion.pages import NAVIGATION  # the registry only; page modules stay unimported
+from latency import percentile  # benchmarks/latency.py, next to this script
+
+SECTIONS = list(NAVIGATION)
+NDVI_SECTION = "🛰️ NDVI Regional Analysis"
+
+
+def session_script(rng, select):
+    """Ordered (label, action) steps for one simulated visitor"""
+    steps = [(section, ("section", section)) for section in rng.sample(SECTIONS, len(SECTIONS))]
+    steps.append((NDVI_SECTION, ("section", NDVI_SECTION)))
+    steps.append((f"{NDVI_SECTION} · select regions", ("select", select)))
+    steps.append((f"{NDVI_SECTION} · toggle aggregated", ("checkbox", 0)))
+    steps.append((f"{NDVI_SECTION} · toggle individual", ("checkbox", 1)))
+    return steps
+
+
+def apply(at, action, rng):
+    kind, value = action
+    if kind == "section":
+        at.sidebar.radio[0].set_value(value)
+    elif kind == "select":
+        multiselect = at.multiselect[0]
+        options = list(multiselect.options)
+        multiselect.set_value(rng.sample(options, min(value, len(options))))
+    elif kind == "checkbox":
+        at.checkbox[value].set_value(not at.checkbox[value].value)
+
+
+def run_session(session_id, args, results, lock):
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(args.seed + session_id)
+    at = AppTest.from_file(str(REPO_ROOT / "app.py"), default_timeout=args.timeout)
+    timings = []
+
+    start = time.perf_counter()
+    at.run()
+    timings.append(("first render", time.perf_counter() - start, len(at.exception)))
+
+    for label, action in session_script(rng, args.select):
+        try:
+            apply(at, action, rng)
+        except (IndexError, KeyError):
+            # Widget missing because the previous render failed; still count the rerun
+            pass
+        start = time.perf_counter()
+        at.run()
+        timings.append((label, time.perf_counter() - start, len(at.exception)))
+
+    with lock:
+        for label, seconds, errors in timings:
+            results[label].append((seconds, errors))
+
+
+def calibrate_cpu(args):
+    """Serial pass: CPU time per section render without contention"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(REPO_ROOT / "app.py"), default_timeout=args.timeout).run()
+    cpu = {}
+    for section in SECTIONS:
+        at.sidebar.radio[0].set_value(section).run()  # warm caches and imports
+        start = time.process_time()
+        for _ in range(args.calibration_runs):
+            at.run()
+        cpu[section] = (time.process_time() - start) / args.calibration_runs
+    return cpu
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # kB on Linux
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20, help="total simulated sessions")
+    parser.add_argument("--concurrency", type=int, default=10, help="sessions running at the same time")
+    parser.add_argument("--select", type=int, default=3, help="regions selected in the NDVI multiselect")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=300, help="per-render timeout (s)")
+    parser.add_argument("--calibration-runs", type=int, default=3)
+    parser.add_argument("--synthetic", action="store_true", help="run against generated data")
+    parser.add_argument("--regions", type=int, default=100)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--species", type=int, default=500)
+    parser.add_argument("--charts", choices=["vega-lite", "matplotlib"], default="vega-lite",
+                        help="chart renderer (vega-lite: drawn by the browser)")
+    parser.add_argument("--json", type=Path, help="write the raw report to this file")
+    args = parser.parse_args()
+
+    print("🚀 EcoFusionAI Load Test")
+    print("=" * 60)
+
+    if args.synthetic:
+        # The data root is read when ecofusion is first imported, so set it before any import
+        root = Path(tempfile.mkdtemp(prefix="ecofusion_load_"))
+        os.environ["ECOFUSION_DATA_ROOT"] = str(root)
+        from ecofusion.synthetic import write_dashboard_dataset
+
+        write_dashboard_dataset(root, args.regions, args.years, args.species, args.seed)
+        print(f"🧪 Synthetic data: {args.regions} regions × {args.years} years, {args.species} species → {root}")
+
+    os.environ.setdefault("ECOFUSION_RELOAD_INTERVAL", "0")  # no watcher thread during benchmarks
+    os.environ["ECOFUSION_CHARTS"] = args.charts
+    os.chdir(REPO_ROOT)
+
+    cpu_per_section = calibrate_cpu(args)
+
+    results, lock = defaultdict(list), threading.Lock()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [pool.submit(run_session, i, args, results, lock) for i in range(args.sessions)]
+        for future in futures:
+            future.result()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    renders = sum(len(v) for v in results.values())
+
+    report = {
+        "config": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        "wall_s": wall,
+        "cpu_s": cpu,
+        "renders": renders,
+        "renders_per_s": renders / wall,
+        "cpu_ms_per_render": cpu / renders * 1000,
+        "peak_rss_mb": peak_rss_mb(),
+        "sections": {},
+    }
+    print(f"\n📊 {args.sessions} sessions, concurrency {args.concurrency}: "
+          f"{renders} renders in {wall:.1f} s ({renders / wall:.1f}/s)")
+    print(f"  {'step':<44}{'n':>5}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'cpu ms':>9}{'errors':>8}")
+    for label, samples in results.items():
+        seconds = [s for s, _ in samples]
+        stats = {
+            "n": len(seconds),
+            "p50_ms": percentile(seconds, 50) * 1000,
+            "p95_ms": percentile(seconds, 95) * 1000,
+            "p99_ms": percentile(seconds, 99) * 1000,
+            "cpu_ms": cpu_per_section.get(label, float("nan")) * 1000,
+            "errors": sum(1 for _, errors in samples if errors),
+        }
+        report["sections"][label] = stats
+        print(f"  {label:<44}{stats['n']:>5}{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}"
+              f"{stats['p99_ms']:>9.1f}{stats['cpu_ms']:>9.1f}{stats['errors']:>8}")
+    print(f"\n⚙️ CPU: {cpu:.1f} s total, {report['cpu_ms_per_render']:.1f} ms per render")
+    print(f"🧠 Peak RSS: {report['peak_rss_mb']:.1f} MB")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"💾 Report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+EcoFusionAI Pipeline Scaling Benchmark
+Generates seeded synthetic pipeline inputs (GBIF Darwin Core export, BirdCLEF
+metadata, monthly NDVI composites and region-year fusion inputs) at one or
+more scale points and times every pipeline stage on them: ingestion,
+deduplication, richness, species matrix, spatial grid, NDVI interpolation,
+NDVI sketches, fusion, alignment, stress, feature store, training, output
+writing and dashboard data preparation. Each stage records wall time, throughput and peak RSS, and the
+results are written as JSON tagged with the git commit, so runs from
+different commits line up.
+
+Every scale point runs in a fresh interpreter (peak RSS is per process and the
+data root is read at import time). Generated inputs are cached per scale and
+seed, so repeated runs only time the pipeline.
+
+Usage:
+    python benchmarks/pipeline_benchmark.py --scale small
+    python benchmarks/pipeline_benchmark.py --scale small medium large --output benchmarks/results/run.json
+    python benchmarks/pipeline_benchmark.py --compare benchmarks/results/a.json benchmarks/results/b.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+SCALES = {
+    "tiny": dict(occurrences=100_000, regions=20, years=10, species=2_000, recordings=5_000, ndvi_points=1_000),
+    "small": dict(occurrences=1_000_000, regions=200, years=20, species=10_000, recordings=20_000,
+                  ndvi_points=5_000),
+    "medium": dict(occurrences=3_000_000, regions=1_000, years=40, species=20_000, recordings=50_000,
+                   ndvi_points=10_000),
+    "large": dict(occurrences=10_000_000, regions=10_000, years=40, species=50_000, recordings=200_000,
+                  ndvi_points=30_000),
+}
+CACHE_DIR = Path(tempfile.gettempdir()) / "ecofusion_pipeline_benchmark"
+RESULTS_DIR = REPO_ROOT / "benchmarks" / "results"
+TRAIN_ROWS = 20_000  # region-years sampled for training (Random Forest cost is not the subject here)
+LAST_YEAR = 2024
+
+
+# --------------------------------------------------
+# Measurement
+# --------------------------------------------------
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # kB on Linux
+
+
+class PeakRSS:
+    """Samples the resident set size in a background thread; peak and baseline over a block"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.baseline = self.peak = rss_mb()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, rss_mb())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, rss_mb())
+
+
+@contextmanager
+def measure(stages, name):
+    """Time one stage; the block sets record["rows"] (records processed) and any extra counters"""
+    record = {"rows": None}
+    with PeakRSS() as memory:
+        start = time.perf_counter()
+        yield record
+        seconds = time.perf_counter() - start
+    rows = record["rows"]
+    record.update(seconds=seconds, rows_per_s=rows / seconds if rows and seconds > 0 else None,
+                  peak_rss_mb=memory.peak, rss_growth_mb=memory.peak - memory.baseline)
+    stages[name] = record
+    throughput = f"{record['rows_per_s']:>14,.0f} rows/s" if record["rows_per_s"] else " " * 21
+    print(f"  {name:<16}{seconds:>9.2f} s {throughput} {memory.peak:>9.0f} MB peak", flush=True)
+
+# --------------------------------------------------
+# Stages (worker process; ECOFUSION_DATA_ROOT points at the output directory)
+# --------------------------------------------------
+def run_stages(inputs, output_dir, years, train_rows=TRAIN_ROWS):
+    import numpy as np
+    import pandas as pd
+
+    from ecofusion import align, interpolate, partitioned, pipeline, sketch, store, versions
+    from ecofusion.features import FeatureStore
+    from ecofusion.forecast import forecast_frame
+    from ecofusion.ndvi import build_ndvi_regional_summary
+    from ecofusion.spatial import GRID_DIR, GridAccumulator, RegularGrid
+    from ecofusion.species import MATRIX_DIR
+
+    output_dir = Path(output_dir)
+    (output_dir / "data").mkdir(parents=True, exist_ok=True)
+    stages = {}
+
+    with measure(stages, "ingest") as record:
+        gbif_raw = pipeline.load_gbif_occurrences(inputs["gbif"])
+        gbif_wg = pipeline.filter_gbif_western_ghats(gbif_raw, years)
+        audio_raw = pipeline.load_birdclef_metadata(inputs["birdclef"])
+        audio_wg = pipeline.filter_audio_western_ghats(audio_raw)
+        record["rows"] = len(gbif_raw) + len(audio_raw)
+    del gbif_raw, audio_raw
+
+    with measure(stages, "dedup") as record:
+        record["rows"] = len(gbif_wg) + len(audio_wg)
+        gbif_wg, _ = pipeline.deduplicate_records(gbif_wg, "gbif")
+        audio_wg, _ = pipeline.deduplicate_records(audio_wg, "birdclef")
+
+    with measure(stages, "richness") as record:
+        gbif_yearly = pipeline.gbif_yearly_biodiversity(gbif_wg)
+        region_richness = pipeline.gbif_region_yearly_richness(gbif_wg)
+        audio_species = pipeline.audio_species_richness(audio_wg)
+        audio_summary = pipeline.audio_signal_summary(audio_species)
+        record["rows"] = len(gbif_wg)
+
+    with measure(stages, "species_matrix") as record:
+        pipeline.species_matrix(gbif_wg, years).save(output_dir / MATRIX_DIR)
+        record["rows"] = len(gbif_wg)
+
+    with measure(stages, "spatial_grid") as record:
+        grid = GridAccumulator(RegularGrid(), years)
+        grid.add_occurrences(gbif_wg["decimalLatitude"], gbif_wg["decimalLongitude"], gbif_wg["year"],
+                             gbif_wg["species"])
+        grid.save(output_dir / GRID_DIR)
+        record["rows"] = len(gbif_wg)
+
+    with measure(stages, "interpolation") as record:
+        # Yearly point samples onto every cell of the grid: IDW, then ordinary kriging with its variance
+        samples = pd.read_csv(inputs["ndvi_points"], usecols=["lat", "lon", "year", "ndvi"])
+        interpolate.interpolate_store(output_dir / GRID_DIR, samples, "idw")
+        values, _ = interpolate.interpolate_store(output_dir / GRID_DIR, samples, "kriging")
+        record.update(rows=len(samples), cells=int(values.size), empty_cells=int(np.isnan(values).sum()))
+
+    with measure(stages, "sketches") as record:
+        # Region-year t-digests of the same samples, then one roll-up over all regions per year
+        samples = pd.read_csv(inputs["ndvi_points"], usecols=["region", "year", "ndvi"])
+        digests = sketch.DigestSet.from_samples(samples, ["region", "year"])
+        digests.save(output_dir / sketch.SKETCH_PATH)
+        digests.rollup(["year"]).summary()
+        record.update(rows=len(samples), groups=len(digests), centroids=len(digests.means))
+
+    with measure(stages, "fusion") as record:
+        ndvi = pd.read_csv(inputs["ndvi"])
+        region_fusion = pd.read_csv(inputs["region_fusion"])
+        fusion = pipeline.fuse_modalities(gbif_yearly, pipeline.ndvi_yearly(ndvi), pd.read_csv(inputs["enhanced_audio"]),
+                                          years)
+        record["rows"] = len(ndvi) + len(region_fusion)
+
+    with measure(stages, "alignment") as record:
+        # Monthly composites (cloudy months missing) aligned to every region's yearly timeline at year end:
+        # the latest cloud-free composite within 3 months and the mean of the year's composites
+        composite = pd.read_csv(inputs["ndvi_composite"])
+        composite = composite.assign(time=composite["year"] + (composite["month"] - 0.5) / 12)[["region", "time", "ndvi"]]
+        timeline = region_fusion[["region", "year"]].assign(time=region_fusion["year"] + 1.0)
+        index = align.EventIndex(composite["time"], composite["region"])
+        latest = align.asof_join(timeline, composite, on="time", by="region", tolerance=0.25, index=index)
+        yearly = align.window_join(timeline, composite, on="time", by="region", window=(-1, 0), index=index)
+        record.update(rows=len(composite) + len(timeline), stale=int(latest["ndvi"].isna().sum()),
+                      empty_windows=int((yearly["ndvi_count"] == 0).sum()))
+
+    with measure(stages, "stress") as record:
+        fusion = pipeline.add_stress_indicators(fusion)
+        region_stress = pipeline.add_stress_indicators(region_fusion)
+        build_ndvi_regional_summary(ndvi)
+        record["rows"] = len(region_stress) + len(ndvi)
+
+    with measure(stages, "features") as record:
+        path = output_dir / "data/feature_store_benchmark.arrow"
+        path.unlink(missing_ok=True)
+        full = FeatureStore(path).materialize(region_fusion)
+        # A new NDVI release for the latest year only: the incremental path
+        update = region_fusion.assign(ndvi_mean=region_fusion["ndvi_mean"].where(
+            region_fusion["year"] != years[1], region_fusion["ndvi_mean"] + 0.01))
+        feature_store = FeatureStore(path)
+        incremental = feature_store.materialize(update)
+        record.update(rows=len(region_fusion), recomputed_full=full["recomputed"],
+                      recomputed_incremental=incremental["recomputed"])
+
+    with measure(stages, "training") as record:
+        sample = region_stress.sample(n=min(train_rows, len(region_stress)), random_state=0)
+        results, importances, _ = pipeline.train_models(sample)
+        # The v2 model on the store's point-in-time view, then served from its latest view
+        targets = pipeline.region_targets(update)
+        targets = targets.loc[targets.index.isin(sample.index)]
+        model, metadata = pipeline.train_feature_model(feature_store, targets)
+        pipeline.predict_latest(feature_store, model, metadata)
+        record.update(rows=len(sample), feature_model_rows=metadata["training_samples"])
+
+    with measure(stages, "write_outputs") as record:
+        gbif_yearly.to_csv(output_dir / store.TABLES["gbif"][0], index=False)
+        audio_species.to_csv(output_dir / store.TABLES["audio_species"][0], index=False)
+        audio_summary.to_csv(output_dir / store.TABLES["audio_summary"][0], index=False)
+        fusion.to_csv(output_dir / store.TABLES["fusion"][0], index=False)
+        results.to_csv(output_dir / store.TABLES["model_results"][0], index=False)
+        importances.to_csv(output_dir / store.TABLES["feature_importance"][0], header=["importance"])
+        ndvi.to_csv(output_dir / store.TABLES["ndvi"][0], index=False)
+        root = output_dir / partitioned.DATASET_DIR
+        occurrences = gbif_wg[["species", "decimalLatitude", "decimalLongitude", "year", "eventDate",
+                               "basisOfRecord", "institutionCode"]].assign(
+            region=pipeline.assign_ndvi_region(gbif_wg["decimalLatitude"], gbif_wg["decimalLongitude"]))
+        partitioned.write_dataset(occurrences, "occurrences", root, sort_by=["species"])
+        partitioned.write_dataset(region_richness, "gbif_region_yearly", root)
+        record["rows"] = len(gbif_wg) + len(ndvi)
+
+    with measure(stages, "dashboard_prep") as record:
+        store.build_all(force=True)
+        snapshot = versions.load_snapshot()
+        forecast_frame(snapshot.tables["ndvi"], "region", "year", "ndvi_mean")
+        record["rows"] = len(snapshot.tables["ndvi"])
+    return stages
+
+
+def worker(manifest_path, result_path, train_rows):
+    manifest = json.loads(Path(manifest_path).read_text())
+    years = (LAST_YEAR - manifest["params"]["years"] + 1, LAST_YEAR)
+    stages = run_stages(manifest["paths"], os.environ["ECOFUSION_DATA_ROOT"], years, train_rows)
+    Path(result_path).write_text(json.dumps(stages, indent=2))
+
+# --------------------------------------------------
+# Driver
+# --------------------------------------------------
+def git_commit():
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip()
+
+    commit = git("rev-parse", "HEAD") or "unknown"
+    return commit + ("-dirty" if git("status", "--porcelain", "--untracked-files=no") else "")
+
+
+def ensure_inputs(name, params, seed, cache_dir, regenerate=False):
+    """Generate (or reuse) the synthetic inputs of one scale point; returns the manifest path"""
+    from ecofusion.synthetic import write_pipeline_inputs
+
+    directory = cache_dir / f"{name}-seed{seed}"
+    manifest = directory / "manifest.json"
+    if manifest.exists() and not regenerate and json.loads(manifest.read_text())["params"] == params:
+        return manifest
+
+    print(f"🧪 Generating {name} inputs: {params}", flush=True)
+    start = time.perf_counter()
+    paths = write_pipeline_inputs(directory, params["occurrences"], params["regions"], params["years"],
+                                  params["species"], params["recordings"], seed,
+                                  n_ndvi_points=params["ndvi_points"])
+    seconds = time.perf_counter() - start
+    manifest.write_text(json.dumps({"params": params, "seed": seed, "generate_seconds": seconds,
+                                    "paths": {key: str(path) for key, path in paths.items()}}, indent=2))
+    return manifest
+
+
+def run_scale(name, args):
+    params = SCALES[name]
+    manifest = ensure_inputs(name, params, args.seed, args.cache_dir, args.regenerate)
+    print(f"\n📏 Scale {name}: {params['occurrences']:,} occurrences, {params['regions']:,} regions × "
+          f"{params['years']} years, {params['species']:,} species", flush=True)
+    with tempfile.TemporaryDirectory(prefix=f"ecofusion_bench_{name}_") as output_dir:
+        result_path = Path(output_dir) / "stages.json"
+        env = {**os.environ, "ECOFUSION_DATA_ROOT": output_dir, "ECOFUSION_RELOAD_INTERVAL": "0"}
+        env.pop("ECOFUSION_STORE_DIR", None)
+        subprocess.run([sys.executable, __file__, "--worker", str(manifest), str(result_path),
+                        "--train-rows", str(args.train_rows)], env=env, check=True)
+        stages = json.loads(result_path.read_text())
+    return {
+        "params": params,
+        "seed": args.seed,
+        "generate_seconds": json.loads(manifest.read_text())["generate_seconds"],
+        "total_seconds": sum(stage["seconds"] for stage in stages.values()),
+        "peak_rss_mb": max(stage["peak_rss_mb"] for stage in stages.values()),
+        "stages": stages,
+    }
+
+
+def compare(baseline_path, candidate_path):
+    baseline, candidate = (json.loads(Path(path).read_text()) for path in (baseline_path, candidate_path))
+    print(f"📊 {baseline['commit'][:12]} → {candidate['commit'][:12]}")
+    for scale in [s for s in baseline["scales"] if s in candidate["scales"]]:
+        old, new = baseline["scales"][scale], candidate["scales"][scale]
+        if old["params"] != new["params"]:
+            print(f"\n⚠️ {scale}: scale parameters differ, skipping")
+            continue
+        print(f"\n📏 {scale}")
+        print(f"  {'stage':<16}{'before s':>10}{'after s':>10}{'speedup':>9}{'before MB':>11}{'after MB':>10}")
+        for stage in [s for s in old["stages"] if s in new["stages"]] + ["total"]:
+            if stage == "total":
+                a, b = old["total_seconds"], new["total_seconds"]
+                ma, mb = old["peak_rss_mb"], new["peak_rss_mb"]
+            else:
+                a, b = old["stages"][stage]["seconds"], new["stages"][stage]["seconds"]
+                ma, mb = old["stages"][stage]["peak_rss_mb"], new["stages"][stage]["peak_rss_mb"]
+            print(f"  {stage:<16}{a:>10.2f}{b:>10.2f}{a / b if b else float('nan'):>8.2f}×{ma:>11.0f}{mb:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", nargs="+", choices=list(SCALES), default=["small"])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--train-rows", type=int, default=TRAIN_ROWS)
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR, help="generated inputs, reused across runs")
+    parser.add_argument("--regenerate", action="store_true", help="regenerate cached inputs")
+    parser.add_argument("--output", type=Path, help="results file (default: benchmarks/results/pipeline-<commit>.json)")
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("BASELINE", "CANDIDATE"))
+    parser.add_argument("--worker", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(*args.worker, args.train_rows)
+        return
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    print("🚀 EcoFusionAI Pipeline Scaling Benchmark")
+    print("=" * 60)
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scales": {name: run_scale(name, args) for name in args.scale},
+    }
+
+    output = args.output or RESULTS_DIR / f"pipeline-{commit[:12]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print()
+    for name, result in report["scales"].items():
+        print(f"⏱️ {name}: {result['total_seconds']:.1f} s total, {result['peak_rss_mb']:.0f} MB peak RSS")
+    print(f"💾 Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
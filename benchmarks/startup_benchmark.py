@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+EcoFusionAI Dashboard Startup Benchmark
+Measures import time and time-to-first-render of app.py in a fresh process
+
+Usage:
+    python benchmarks/startup_benchmark.py                   # current app.py
+    python benchmarks/startup_benchmark.py --baseline HEAD~1  # compare with an older revision
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ["matplotlib.pyplot", "seaborn", "scipy", "sklearn"]
+
+# Runs inside a fresh interpreter started with -X importtime
+PROBE = r"""
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t_harness = time.perf_counter() - t0
+
+sys.stderr.write("@@render-start\n"); sys.stderr.flush()
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+t1 = time.perf_counter()
+at.run()
+first_render = time.perf_counter() - t1
+loaded = {m: m in sys.modules for m in json.loads(sys.argv[2])}
+
+reruns = {}
+# The app's own options, so an older revision is probed with the sections it actually has
+for section in list(at.sidebar.radio[0].options):
+    t2 = time.perf_counter()
+    at.sidebar.radio[0].set_value(section).run()
+    reruns[section] = time.perf_counter() - t2
+
+print(json.dumps({
+    "harness_import_s": t_harness,
+    "first_render_s": first_render,
+    "heavy_modules_after_first_render": loaded,
+    "section_rerun_s": reruns,
+    "exceptions": len(at.exception),
+}))
+"""
+
+
+def parse_importtime(stderr):
+    """Sum self import time (ms) per top-level package for imports after the render marker"""
+    per_package = defaultdict(float)
+    started = False
+    for line in stderr.splitlines():
+        if line.startswith("@@render-start"):
+            started = True
+            continue
+        if not started or not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        per_package[name.split(".")[0]] += int(self_us) / 1000
+    return dict(sorted(per_package.items(), key=lambda item: -item[1]))
+
+
+def run_once(app_path):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE, str(app_path),
+         json.dumps(HEAVY_MODULES)],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+    stats = json.loads(result.stdout.strip().splitlines()[-1])
+    stats["render_imports_ms"] = parse_importtime(result.stderr)
+    return stats
+
+
+def benchmark(app_path, repeats):
+    runs = [run_once(app_path) for _ in range(repeats)]
+    import_totals = [sum(r["render_imports_ms"].values()) for r in runs]
+    sections = [s for s in runs[0]["section_rerun_s"] if all(s in r["section_rerun_s"] for r in runs)]
+    return {
+        "app": str(app_path),
+        "first_render_s_median": statistics.median(r["first_render_s"] for r in runs),
+        "render_import_ms_median": statistics.median(import_totals),
+        "section_rerun_s_median": {
+            s: statistics.median(r["section_rerun_s"][s] for r in runs) for s in sections
+        },
+        "heavy_modules_after_first_render": runs[-1]["heavy_modules_after_first_render"],
+        "top_render_imports_ms": dict(list(runs[-1]["render_imports_ms"].items())[:8]),
+        "exceptions": max(r["exceptions"] for r in runs),
+    }
+
+
+def print_report(label, report):
+    print(f"\n📊 {label}: {report['app']}")
+    print(f"  ⏱️ First render:        {report['first_render_s_median'] * 1000:8.1f} ms")
+    print(f"  📦 Imports in render:   {report['render_import_ms_median']:8.1f} ms")
+    for module, loaded in report["heavy_modules_after_first_render"].items():
+        print(f"     {'⚠️ loaded' if loaded else '✅ lazy  '} {module}")
+    for section, seconds in report["section_rerun_s_median"].items():
+        print(f"  🔁 {section:<28} {seconds * 1000:8.1f} ms")
+    if report["exceptions"]:
+        print(f"  ❌ {report['exceptions']} exception(s) raised while rendering")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", help="git revision whose app.py is benchmarked for comparison")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--json", type=Path, help="write the raw report to this file")
+    args = parser.parse_args()
+
+    print("🚀 EcoFusionAI Startup Benchmark")
+    print("=" * 50)
+
+    reports = {"current": benchmark(REPO_ROOT / "app.py", args.repeats)}
+
+    if args.baseline:
+        source = subprocess.run(
+            ["git", "show", f"{args.baseline}:app.py"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout
+        # Keep the baseline next to app.py so relative data paths and imports resolve the same way
+        with tempfile.NamedTemporaryFile("w", suffix="_app_baseline.py", dir=REPO_ROOT, delete=False) as handle:
+            handle.write(source)
+        try:
+            reports["baseline"] = benchmark(Path(handle.name), args.repeats)
+        finally:
+            Path(handle.name).unlink()
+
+    for label, report in reports.items():
+        print_report(label, report)
+
+    if "baseline" in reports:
+        before = reports["baseline"]["first_render_s_median"]
+        after = reports["current"]["first_render_s_median"]
+        print(f"\n🎯 First render speed-up: {before / after:.2f}x ({before * 1000:.0f} → {after * 1000:.0f} ms)")
+        baseline_reruns = reports["baseline"]["section_rerun_s_median"]
+        current_reruns = reports["current"]["section_rerun_s_median"]
+        for section in [s for s in current_reruns if s in baseline_reruns]:
+            before, after = baseline_reruns[section], current_reruns[section]
+            print(f"  🔁 {section:<28} {before / after:5.2f}x ({before * 1000:.0f} → {after * 1000:.0f} ms)")
+
+    if args.json:
+        args.json.write_text(json.dumps(reports, indent=2))
+        print(f"\n💾 Report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""
+EcoFusionAI – Multimodal Biodiversity Early Warning System
+Shared data layer, analytics and dashboard pages
+"""
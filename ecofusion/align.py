@@ -0,0 +1,231 @@
+"""
+As-of temporal alignment of modalities with different cadences
+Herbarium records arrive in irregular years, NDVI as periodic composites and
+audio as dated recordings, so modalities cannot simply be merged on an equal
+timestamp. An EventIndex sorts one source's events by (group, time) once; any
+number of target timelines (e.g. every region × year) are then aligned to it
+with a few vectorized searchsorted passes instead of one merge per group:
+
+- as-of: the latest event at or before each target time (backward fill), the
+  first at or after it (forward), or the closest (nearest), optionally within
+  a tolerance
+- windowed: count / sum / mean / min / max / last of the events inside
+  [time + start, time + end) around each target time
+
+Every aligned value carries its own staleness: `<column>_age` is the target
+time minus the time of the event the value came from (NaN or NaT when nothing
+matched). A missing value in the source is skipped per column, so one column
+can be fresher than another in the same output row.
+
+Usage:
+    aligned = asof_join(timeline, ndvi_composites, on="date", by="region", tolerance=pd.Timedelta("32D"))
+    yearly = window_join(timeline, recordings, on="year", by="region", window=(0, 1), how="count")
+"""
+
+import numpy as np
+import pandas as pd
+
+DIRECTIONS = ("backward", "forward", "nearest")
+AGGREGATIONS = ("count", "sum", "mean", "min", "max", "last")
+
+
+def _times(values):
+    """(times as float64 or int64 nanoseconds, missing mask, whether they are datetimes)"""
+    values = pd.Series(values, copy=False)
+    missing = values.isna().to_numpy()
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        values = values.dt.tz_convert(None)
+    if pd.api.types.is_datetime64_dtype(values.dtype):
+        return values.to_numpy("datetime64[ns]").view(np.int64), missing, True
+    return values.to_numpy(np.float64, na_value=np.nan), missing, False
+
+
+def _offset(value, datetime):
+    """A window bound or tolerance in the units of the times (Timedelta-like for datetimes)"""
+    return pd.Timedelta(value).value if datetime else float(value)
+
+
+class EventIndex:
+    """One source's events, sorted by (group, time) once for any number of lookups
+
+    Events without a time or group are left out. Positions returned by the
+    lookups index the sorted events; `rows` maps them back to input rows and
+    -1 means no event.
+    """
+
+    def __init__(self, times, groups=None):
+        times, missing, self.datetime = _times(times)
+        if groups is None:
+            codes, self.groups = np.zeros(len(times), np.int64), None
+        else:
+            codes, uniques = pd.factorize(pd.Series(groups, copy=False))  # categoricals reuse their codes
+            self.groups = pd.Index(np.asarray(uniques))
+        keep = ~missing & (codes >= 0)
+
+        # Dense time ranks make (group, time) one int64 key; only distinct times are sorted
+        ranks, unique = pd.factorize(times[keep], sort=True)
+        self.unique_times = np.asarray(unique)
+        order = np.argsort(codes[keep] * len(self.unique_times) + ranks, kind="stable")
+        self.rows = np.flatnonzero(keep)[order]
+        self.codes = codes[self.rows]
+        self.times = times[self.rows]
+        self.keys = self.codes * len(self.unique_times) + ranks[order]
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _targets(self, times, groups):
+        times, missing, datetime = _times(times)
+        if datetime != self.datetime:
+            raise TypeError("target and event times must both be datetimes or both be numbers")
+        if self.groups is None:
+            codes = np.zeros(len(times), np.int64)
+        else:
+            codes = self.groups.get_indexer(np.asarray(groups))
+        return times, np.where(missing, -1, codes)
+
+    def _search(self, codes, times, side):
+        """Sorted position of the first event of each target's group at (side="left") or after ("right") its time"""
+        ranks = np.searchsorted(self.unique_times, times, side=side)
+        return np.searchsorted(self.keys, np.maximum(codes, 0) * len(self.unique_times) + ranks, side="left")
+
+    def _in_group(self, positions, codes):
+        found = (positions >= 0) & (positions < len(self)) & (codes >= 0)
+        found[found] = self.codes[positions[found]] == codes[found]
+        return np.where(found, positions, -1)
+
+    def asof(self, times, groups=None, direction="backward", tolerance=None, valid=None):
+        """Sorted position of the event each target aligns to, and its age (target time − event time)
+
+        `valid` (a mask over the sorted events) restricts the match to events
+        whose value is present, e.g. the non-missing values of one column.
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"direction must be one of {DIRECTIONS}")
+        times, codes = self._targets(times, groups)
+        if not len(self):
+            return np.full(len(times), -1), np.full(len(times), np.nan)
+        index = np.arange(len(self))
+        before = after = None
+        if direction in ("backward", "nearest"):
+            last = self._search(codes, times, "right") - 1
+            if valid is not None:
+                # Step back to the latest event with a present value
+                carried = np.maximum.accumulate(np.where(valid, index, -1))
+                last = np.where(last >= 0, carried[np.maximum(last, 0)], -1)
+            before = self._in_group(last, codes)
+        if direction in ("forward", "nearest"):
+            first = self._search(codes, times, "left")
+            if valid is not None:
+                ahead = np.minimum.accumulate(np.where(valid, index, len(self))[::-1])[::-1]
+                first = np.where(first < len(self), ahead[np.minimum(first, len(self) - 1)], len(self))
+            after = self._in_group(first, codes)
+
+        if direction == "backward":
+            positions = before
+        elif direction == "forward":
+            positions = after
+        else:
+            # Ties go to the earlier event
+            gap_before = np.where(before >= 0, times - self.times[before], np.inf)
+            gap_after = np.where(after >= 0, self.times[after] - times, np.inf)
+            positions = np.where(gap_after < gap_before, after, before)
+
+        age = np.where(positions >= 0, times - self.times[positions], np.nan)
+        if tolerance is not None:
+            positions = np.where(np.abs(age) <= _offset(tolerance, self.datetime), positions, -1)
+            age = np.where(positions >= 0, age, np.nan)
+        return positions, age
+
+    def window(self, times, groups=None, start=0, end=0):
+        """Sorted positions [lo, hi) of the events in [time + start, time + end) of each target's group"""
+        times, codes = self._targets(times, groups)
+        start, end = _offset(start, self.datetime), _offset(end, self.datetime)
+        lo, hi = self._search(codes, times + start, "left"), self._search(codes, times + end, "left")
+        lo = np.where(codes >= 0, lo, 0)
+        return lo, np.where(codes >= 0, np.maximum(hi, lo), 0), times
+
+
+def aggregate(index, values, lo, hi, how):
+    """One aggregate of the present values in every window [lo, hi) of sorted events
+
+    Returns (aggregate, count of present values, sorted position of the newest present value or -1).
+    """
+    if how not in AGGREGATIONS:
+        raise ValueError(f"how must be one of {AGGREGATIONS}")
+    if not len(index):
+        return np.full(len(lo), np.nan), np.zeros(len(lo), np.int64), np.full(len(lo), -1)
+    values = pd.Series(values, copy=False).iloc[index.rows]
+    valid = values.notna().to_numpy()
+    counted = np.concatenate([[0], np.cumsum(valid)])
+    count = counted[hi] - counted[lo]
+    # Newest present value of each window: the latest present position before hi, if it is not before lo
+    carried = np.maximum.accumulate(np.where(valid, np.arange(len(valid)), -1))
+    newest = np.where(hi > lo, carried[np.maximum(hi - 1, 0)], -1)
+    newest = np.where(newest >= lo, newest, -1)
+    if how == "count":
+        return count.astype(np.float64), count, newest
+
+    numbers = values.to_numpy(np.float64, na_value=np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if how in ("sum", "mean"):
+            summed = np.concatenate([[0.0], np.cumsum(np.where(valid, numbers, 0.0))])
+            result = summed[hi] - summed[lo]
+            result = result / count if how == "mean" else result
+        elif how == "last":
+            result = np.where(newest >= 0, numbers[np.maximum(newest, 0)], np.nan)
+        else:
+            # Window-wise reduceat over (lo, hi) bounds; the odd slices between windows are dropped
+            ufunc = np.fmin if how == "min" else np.fmax
+            padded = np.append(np.where(valid, numbers, np.nan), np.nan)
+            result = ufunc.reduceat(padded, np.column_stack([lo, hi]).ravel())[::2] if len(lo) else np.empty(0)
+    return np.where(count > 0, result, np.nan), count, newest
+
+# --------------------------------------------------
+# DataFrame joins
+# --------------------------------------------------
+def _age_column(age, datetime):
+    return pd.to_timedelta(age, unit="ns") if datetime else age
+
+
+def _value_columns(right, on, by, columns):
+    return list(columns) if columns is not None else [c for c in right.columns if c not in (on, by)]
+
+
+def asof_join(left, right, on, by=None, columns=None, direction="backward", tolerance=None, index=None):
+    """`left` with each column of `right` as of every left row's `on` time (within its `by` group)
+
+    Each column takes the nearest event in `direction` whose value is
+    present and gets a `<column>_age` column (left time − event time).
+    Pass a prebuilt EventIndex of `right` to align several timelines to it.
+    """
+    index = index or EventIndex(right[on], right[by] if by else None)
+    groups = left[by] if by else None
+    aligned = {}
+    for column in _value_columns(right, on, by, columns):
+        values = right[column].iloc[index.rows]
+        valid = values.notna().to_numpy()
+        positions, age = index.asof(left[on], groups, direction, tolerance, None if valid.all() else valid)
+        taken = values.iloc[np.maximum(positions, 0)].to_numpy() if len(index) else np.full(len(left), np.nan)
+        aligned[column] = pd.Series(taken, index=left.index).where(positions >= 0)
+        aligned[f"{column}_age"] = pd.Series(_age_column(age, index.datetime), index=left.index)
+    return left.assign(**aligned)
+
+
+def window_join(left, right, on, window, by=None, columns=None, how="mean", index=None):
+    """`left` with `how` of each column of `right` over [time + window[0], time + window[1]) per left row
+
+    Adds `<column>` (NaN for empty windows), `<column>_count` (present values
+    in the window) and `<column>_age` (left time − time of the newest of them).
+    """
+    index = index or EventIndex(right[on], right[by] if by else None)
+    lo, hi, times = index.window(left[on], left[by] if by else None, *window)
+    aligned = {}
+    for column in _value_columns(right, on, by, columns):
+        result, count, newest = aggregate(index, right[column], lo, hi, how)
+        age = np.full(len(left), np.nan) if not len(index) else \
+            np.where(newest >= 0, times - index.times[np.maximum(newest, 0)], np.nan)
+        aligned[column] = pd.Series(result, index=left.index)
+        aligned[f"{column}_count"] = pd.Series(count, index=left.index)
+        aligned[f"{column}_age"] = pd.Series(_age_column(age, index.datetime), index=left.index)
+    return left.assign(**aligned)
@@ -0,0 +1,354 @@
+"""
+Read-only HTTP query API
+Serves eco-stress, NDVI, richness and risk from the same versioned snapshots as
+the dashboard (ecofusion.versions), so partner tools never read the CSVs
+directly. Every response carries an ETag derived from the data version;
+clients that send it back in If-None-Match get 304 Not Modified until the
+inputs change. Encoded responses are kept in an in-memory LRU cache keyed by
+data version, so repeated queries are a dictionary lookup.
+
+Endpoints (GET):
+    /stress    eco-stress index by year (hotspot), or per NDVI region with ?region=
+    /ndvi      regional NDVI by region and year
+    /richness  GBIF richness by year (hotspot), or per NDVI region with ?region=
+    /risk      latest risk level per region (stress band, NDVI health and trend)
+    /version   current data version
+
+Parameters: hotspot, region (repeat or comma-separate), year_from, year_to,
+format=json|arrow (or Accept: application/vnd.apache.arrow.stream).
+JSON is column-oriented ({"columns": [...], "data": [[...], ...]}); Arrow is an IPC stream.
+
+Usage:
+    python -m ecofusion.api --port 8765
+    curl 'http://localhost:8765/ndvi?region=Western_Ghats_South&year_from=2020'
+"""
+
+import argparse
+import json
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from ecofusion import partitioned, tracing
+from ecofusion.alerts import RISK_LABELS, RISK_THRESHOLDS
+from ecofusion.pipeline import add_stress_indicators
+from ecofusion.versions import DataManager
+
+HOTSPOT = partitioned.HOTSPOT
+CACHE_ENTRIES = 1024
+ARROW_TYPE = "application/vnd.apache.arrow.stream"
+JSON_TYPE = "application/json; charset=utf-8"
+
+STRESS_COLUMNS = ["year", "eco_stress_index", "environmental_stress", "biodiversity_decline", "ndvi_mean",
+                  "species_stress_index", "critical_species_stress"]
+RICHNESS_COLUMNS = ["year", "occurrences", "species_richness", "species_per_1000_occ", "rarefied_richness",
+                    "chao1", "ace"]
+
+
+class QueryError(ValueError):
+    """Bad request (400) or, with status=404, an unknown hotspot / missing table"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class ResponseCache:
+    """Thread-safe LRU of encoded responses"""
+
+    def __init__(self, max_entries=CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+# --------------------------------------------------
+# Parameters
+# --------------------------------------------------
+def _parse(query_string):
+    params = parse_qs(query_string, keep_blank_values=False)
+    regions = sorted({region for value in params.get("region", []) for region in value.split(",") if region})
+
+    def year(name):
+        values = params.get(name)
+        if not values:
+            return None
+        try:
+            return int(values[-1])
+        except ValueError:
+            raise QueryError(f"{name} must be a whole number such as 2020, got {values[-1]!r}") from None
+
+    year_from, year_to = year("year_from"), year("year_to")
+    if "year" in params:
+        year_from = year_to = year("year")
+    if year_from is not None and year_to is not None and year_from > year_to:
+        raise QueryError(f"year_from ({year_from}) is after year_to ({year_to})")
+    hotspot = params.get("hotspot", [HOTSPOT])[-1]
+    if hotspot.upper() != HOTSPOT:
+        raise QueryError(f"Unknown hotspot {hotspot!r}; available: {HOTSPOT}", status=404)
+    return {"regions": tuple(regions), "year_from": year_from, "year_to": year_to,
+            "format": params.get("format", [None])[-1]}
+
+
+def _years(frame, params):
+    years = frame["year"]
+    keep = np.ones(len(frame), bool)
+    if params["year_from"] is not None:
+        keep &= years >= params["year_from"]
+    if params["year_to"] is not None:
+        keep &= years <= params["year_to"]
+    return frame[keep]
+
+
+def _check_regions(params, known):
+    unknown = set(params["regions"]) - set(known)
+    if unknown:
+        raise QueryError(f"Unknown region(s): {', '.join(sorted(unknown))}", status=404)
+
+
+def _regions(frame, params):
+    if not params["regions"]:
+        return frame
+    _check_regions(params, frame["region"].unique())
+    return frame[frame["region"].isin(params["regions"])]
+
+
+def known_regions(path, snapshot, derived):
+    """Regions an endpoint can answer for, checked before a request may be answered with 304"""
+    if path == "/ndvi":
+        return snapshot.table("ndvi")["region"].unique()
+    if path == "/richness":
+        committed = partitioned.committed_ns("gbif_region_yearly")
+        if committed is None:
+            raise QueryError("Regional richness is not available (run the pipeline first)", status=404)
+        return derived(f"richness_regions.{committed}",
+                       lambda _: partitioned.partition_values("gbif_region_yearly", "region"))
+    return derived("regional_stress", regional_stress)["region"].unique()
+
+# --------------------------------------------------
+# Endpoints: (snapshot, params) → DataFrame
+# --------------------------------------------------
+def regional_stress(snapshot):
+    """Eco-stress per NDVI region and year: the region's NDVI with the hotspot's species and sampling terms"""
+    fusion = snapshot.table("fusion")
+    ndvi = snapshot.table("ndvi")[["region", "year", "ndvi_mean", "ndvi_std"]]
+    merged = (fusion.drop(columns=["ndvi_mean", "ndvi_std"], errors="ignore")
+              .merge(ndvi, on="year", how="inner").sort_values(["year", "region"], kind="stable"))
+    return add_stress_indicators(merged.reset_index(drop=True))
+
+
+def stress(snapshot, params, derived):
+    if params["regions"]:
+        frame = _regions(derived("regional_stress", regional_stress), params)
+        columns = ["region"] + STRESS_COLUMNS
+    else:
+        frame, columns = snapshot.table("fusion"), STRESS_COLUMNS
+    return _years(frame, params)[[c for c in columns if c in frame.columns]]
+
+
+def ndvi(snapshot, params, derived):
+    frame = snapshot.table("ndvi")
+    return _years(_regions(frame, params), params)[["region", "year", "ndvi_mean", "ndvi_std", "num_samples"]]
+
+
+def richness(snapshot, params, derived):
+    if not params["regions"]:
+        frame = snapshot.table("gbif")
+        return _years(frame, params)[[c for c in RICHNESS_COLUMNS if c in frame.columns]]
+    if partitioned.committed_ns("gbif_region_yearly") is None:
+        raise QueryError("Regional richness is not available (run the pipeline first)", status=404)
+    year = slice(params["year_from"], params["year_to"])
+    frame = partitioned.query("gbif_region_yearly", region=list(params["regions"]), year=year)
+    columns = ["region"] + [c for c in RICHNESS_COLUMNS if c in frame.columns]
+    return frame[columns].sort_values(["region", "year"]).reset_index(drop=True)
+
+
+def risk(snapshot, params, derived):
+    """Latest year per region: eco-stress, risk band, NDVI health and trend (plus the hotspot as a whole)"""
+    regional = _regions(derived("regional_stress", regional_stress), params)
+    latest = regional.sort_values("year").drop_duplicates("region", keep="last")
+    summary = snapshot.ndvi_regional_summary[["Health_Status", "Trend_Status", "Trend_Slope"]]
+    frame = latest[["region", "year", "eco_stress_index", "ndvi_mean"]].merge(
+        summary.rename(columns=str.lower), left_on="region", right_index=True, how="left")
+    if not params["regions"]:
+        hotspot = snapshot.table("fusion").iloc[[-1]][["year", "eco_stress_index", "ndvi_mean"]]
+        frame = pd.concat([hotspot.assign(region=HOTSPOT), frame], ignore_index=True)
+    frame["risk_level"] = np.asarray(RISK_LABELS)[np.searchsorted(RISK_THRESHOLDS, frame["eco_stress_index"],
+                                                                  side="right")]
+    columns = ["region", "year", "risk_level", "eco_stress_index", "ndvi_mean", "health_status", "trend_status",
+               "trend_slope"]
+    return frame[columns].sort_values("region").reset_index(drop=True)
+
+
+ENDPOINTS = {"/stress": stress, "/ndvi": ndvi, "/richness": richness, "/risk": risk}
+
+# --------------------------------------------------
+# Encoding and request handling
+# --------------------------------------------------
+def _tidy(frame):
+    # Some CSVs store years as floats (1990.0); serve them as integers
+    if "year" in frame.columns and frame["year"].notna().all():
+        frame = frame.astype({"year": "int64"})
+    return frame
+
+
+def encode_json(frame, meta):
+    """Column names once, then one array per row (NaN → null)"""
+    rows = frame.to_json(orient="values", double_precision=6, force_ascii=False)
+    head = json.dumps({**meta, "columns": list(frame.columns)}, separators=(",", ":"), ensure_ascii=False)
+    return f'{head[:-1]},"data":{rows}}}'.encode()
+
+
+def encode_arrow(frame, meta):
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    table = table.replace_schema_metadata({key.encode(): str(value).encode() for key, value in meta.items()})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+class QueryAPI:
+    """HTTP-independent request logic: (path, query, headers) → (status, headers, body)"""
+
+    def __init__(self, manager=None, cache_entries=CACHE_ENTRIES):
+        self.manager = manager or DataManager()
+        self.cache = ResponseCache(cache_entries)
+        self._derived = {}
+        self._derived_lock = threading.Lock()
+
+    def _derived_for(self, snapshot):
+        def derived(name, build):
+            key = (snapshot.version, name)
+            value = self._derived.get(key)
+            if value is None:
+                with self._derived_lock:
+                    value = self._derived.get(key)
+                    if value is None:
+                        value = build(snapshot)
+                        # Derived tables of older versions are dropped on the first build for a new one
+                        self._derived = {k: v for k, v in self._derived.items() if k[0] == snapshot.version}
+                        self._derived[key] = value
+            return value
+        return derived
+
+    def handle(self, path, query_string="", if_none_match=None, accept=None):
+        try:
+            snapshot = self.manager.current()
+            if path == "/version":
+                body = json.dumps({"version": snapshot.version, "loaded_at": snapshot.loaded_at}).encode()
+                return 200, {"Content-Type": JSON_TYPE, "Cache-Control": "no-cache"}, body
+            if path not in ENDPOINTS:
+                raise QueryError(f"Unknown endpoint {path}; available: {', '.join([*ENDPOINTS, '/version'])}", 404)
+            params = _parse(query_string)
+            fmt = params["format"] or ("arrow" if accept and ARROW_TYPE in accept else "json")
+            if fmt not in ("json", "arrow"):
+                raise QueryError(f"format must be json or arrow, got {fmt!r}")
+
+            # Regional richness comes from the partitioned dataset, which is versioned by its own writes
+            version = snapshot.version
+            if path == "/richness" and params["regions"]:
+                version = f"{version}.{partitioned.committed_ns('gbif_region_yearly')}"
+            derived = self._derived_for(snapshot)
+            if params["regions"]:
+                # An unknown region is a 404 even for a client holding the current ETag
+                _check_regions(params, known_regions(path, snapshot, derived))
+            etag = f'"{version}-{fmt}"'
+            headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept",
+                       "Content-Type": ARROW_TYPE if fmt == "arrow" else JSON_TYPE}
+            if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+                return 304, headers, b""
+
+            key = (path, params["regions"], params["year_from"], params["year_to"], fmt, version)
+            body = self.cache.get(key)
+            if body is None:
+                with tracing.span("api.query", endpoint=path) as span:
+                    frame = _tidy(ENDPOINTS[path](snapshot, params, derived))
+                    meta = {"version": version, "hotspot": HOTSPOT, "rows": len(frame)}
+                    body = encode_arrow(frame, meta) if fmt == "arrow" else encode_json(frame, meta)
+                    span.set(rows=len(frame), bytes=len(body))
+                self.cache.put(key, body)
+            return 200, headers, body
+        except QueryError as e:
+            return e.status, {"Content-Type": JSON_TYPE}, json.dumps({"error": str(e)}).encode()
+        except FileNotFoundError as e:
+            return 404, {"Content-Type": JSON_TYPE}, json.dumps({"error": str(e)}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: clients reuse one connection
+    disable_nagle_algorithm = True  # headers and body are separate writes; don't wait for the delayed ACK
+    server_version = "EcoFusionAPI/1.0"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        status, headers, body = self.server.api.handle(
+            url.path.rstrip("/") or "/", url.query, self.headers.get("If-None-Match"), self.headers.get("Accept"))
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # the default backlog of 5 drops connections when many clients connect at once
+
+
+def make_server(host="127.0.0.1", port=8765, api=None, verbose=False):
+    server = _Server((host, port), _Handler)
+    server.api = api or QueryAPI(DataManager().start())
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve stress / NDVI / richness / risk over HTTP (read-only)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cache-entries", type=int, default=CACHE_ENTRIES)
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port, QueryAPI(DataManager().start(), args.cache_entries), args.verbose)
+    version = server.api.manager.current().version
+    print(f"🌐 EcoFusion API on http://{args.host}:{server.server_address[1]} (data version {version})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
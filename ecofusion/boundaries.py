@@ -0,0 +1,290 @@
+"""
+Country boundaries from the bundled Natural Earth shapefile
+A minimal NumPy reader for ESRI shapefiles (.shp/.shx) and dBASE attribute
+tables (.dbf), so boundaries need neither geopandas nor GDAL.
+
+Polygons are loaded into flat coordinate arrays with ring offsets, and a
+uniform-grid bounding-box index maps every grid cell to the shapes overlapping
+it. Both are cached as one .npz next to the Arrow store, so after the first
+load a lookup is a dictionary hit plus a few array slices.
+
+Usage:
+    python -m ecofusion.boundaries India        # build the cache and show one country
+"""
+
+import argparse
+import functools
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ecofusion import store
+
+NATURALEARTH = store.REPO_ROOT / "data/naturalearth/ne_110m_admin_0_countries"
+DEFAULT_FIELDS = ["ADM0_A3", "ISO_A3", "NAME", "NAME_LONG", "CONTINENT", "POP_EST"]
+INDEX_CELL_DEG = 10.0
+
+POLYGON_TYPES = (5, 15, 25)  # Polygon, PolygonZ, PolygonM (x/y are read; z/m are ignored)
+
+# --------------------------------------------------
+# Readers
+# --------------------------------------------------
+def read_dbf(path, fields=None, encoding=None):
+    """dBASE III attribute table as a DataFrame (character and numeric fields)
+
+    Every record is kept, deleted ones included, because records line up with
+    the .shp shapes by position; the boolean `_deleted` column marks them.
+    """
+    path = Path(path)
+    if encoding is None:
+        cpg = path.with_suffix(".cpg")
+        encoding = cpg.read_text().strip() if cpg.exists() else "latin-1"
+
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+    n_records = int(raw[4:8].view("<u4")[0])
+    header_len, record_len = (int(v) for v in raw[8:12].view("<u2"))
+
+    names, formats, types = ["_deleted"], ["S1"], {}
+    for start in range(32, header_len - 1, 32):
+        if raw[start] == 0x0D:
+            break
+        descriptor = raw[start:start + 32].tobytes()
+        name = descriptor[:11].split(b"\0")[0].decode("ascii")
+        names.append(name)
+        formats.append(f"S{descriptor[16]}")
+        types[name] = chr(descriptor[11])
+
+    records = np.frombuffer(raw, dtype=np.dtype({"names": names, "formats": formats, "itemsize": record_len}),
+                            count=n_records, offset=header_len)
+
+    columns = {"_deleted": records["_deleted"] == b"*"}
+    for name in fields or names[1:]:
+        values = pd.Series(np.char.strip(records[name])).str.decode(encoding)
+        columns[name] = pd.to_numeric(values.replace("", None), errors="coerce") if types[name] in "NF" else values
+    return pd.DataFrame(columns)
+
+
+def read_shp(path):
+    """Polygon shapefile as flat arrays, using the .shx record offsets
+
+    Returns a dict with coords (n_points × 2, lon/lat), ring_offsets
+    (n_rings + 1), shape_rings (n_shapes + 1, rings per shape) and bbox
+    (n_shapes × 4: lon_min, lat_min, lon_max, lat_max).
+    """
+    path = Path(path)
+    shp = np.memmap(path.with_suffix(".shp"), dtype=np.uint8, mode="r")
+    shape_type = int(shp[32:36].view("<i4")[0])
+    if shape_type not in POLYGON_TYPES:
+        raise ValueError(f"{path.name}: shape type {shape_type} is not a polygon type")
+
+    # .shx: 100-byte header then (offset, length) pairs in 16-bit words, big-endian
+    index = np.fromfile(path.with_suffix(".shx"), dtype=">i4", offset=100).reshape(-1, 2)
+    content_offsets = index[:, 0].astype(np.int64) * 2 + 8  # skip the record header
+
+    n_shapes = len(index)
+    bbox = np.full((n_shapes, 4), np.nan)
+    coords, ring_offsets, shape_rings = [], [0], [0]
+    total_points = 0
+    for i, offset in enumerate(content_offsets):
+        if int(shp[offset:offset + 4].view("<i4")[0]) == 0:  # null shape
+            shape_rings.append(shape_rings[-1])
+            continue
+        bbox[i] = shp[offset + 4:offset + 36].view("<f8")
+        n_parts, n_points = (int(v) for v in shp[offset + 36:offset + 44].view("<i4"))
+        parts_end = offset + 44 + 4 * n_parts
+        parts = shp[offset + 44:parts_end].view("<i4")
+        coords.append(shp[parts_end:parts_end + 16 * n_points].view("<f8").reshape(-1, 2))
+        ring_offsets.extend((total_points + parts[1:]).tolist())
+        total_points += n_points
+        ring_offsets.append(total_points)
+        shape_rings.append(shape_rings[-1] + n_parts)
+
+    return {
+        "coords": np.concatenate(coords) if coords else np.empty((0, 2)),
+        "ring_offsets": np.asarray(ring_offsets, np.int64),
+        "shape_rings": np.asarray(shape_rings, np.int64),
+        "bbox": bbox,
+    }
+
+# --------------------------------------------------
+# Bounding-box grid index
+# --------------------------------------------------
+def build_grid_index(bbox, cell_deg=INDEX_CELL_DEG):
+    """CSR mapping from global grid cell → IDs of shapes whose bbox overlaps it"""
+    cols, rows = int(np.ceil(360 / cell_deg)), int(np.ceil(180 / cell_deg))
+    valid = ~np.isnan(bbox).any(axis=1)
+    filled = np.where(valid[:, None], bbox, 0.0)  # null and deleted shapes have no bbox
+    c0, r0, c1, r1 = (
+        np.clip(np.floor((filled[:, k] - origin) / cell_deg), 0, limit - 1).astype(np.int64)
+        for k, origin, limit in ((0, -180, cols), (1, -90, rows), (2, -180, cols), (3, -90, rows))
+    )
+    cells, shapes = [], []
+    for shape_id in np.flatnonzero(valid):
+        row, col = np.meshgrid(np.arange(r0[shape_id], r1[shape_id] + 1), np.arange(c0[shape_id], c1[shape_id] + 1))
+        cells.append((row * cols + col).ravel())
+        shapes.append(np.full(row.size, shape_id))
+    cells = np.concatenate(cells) if cells else np.empty(0, np.int64)
+    shapes = np.concatenate(shapes) if shapes else np.empty(0, np.int64)
+    order = np.argsort(cells, kind="stable")
+    cell_offsets = np.concatenate(([0], np.cumsum(np.bincount(cells, minlength=rows * cols))))
+    return cell_offsets, shapes[order]
+
+
+class Boundaries:
+    """Polygons, attributes and bbox index of one shapefile"""
+
+    def __init__(self, arrays, attributes, cell_deg=INDEX_CELL_DEG):
+        self.coords = arrays["coords"]
+        self.ring_offsets = arrays["ring_offsets"]
+        self.shape_rings = arrays["shape_rings"]
+        self.bbox = arrays["bbox"]
+        self.cell_offsets = arrays["cell_offsets"]
+        self.cell_shapes = arrays["cell_shapes"]
+        self.deleted = arrays.get("deleted", np.zeros(len(self.bbox), bool))
+        self.attributes = attributes
+        self.cell_deg = cell_deg
+        self._names = {}
+        for column in ("NAME", "NAME_LONG", "ADM0_A3", "ISO_A3"):
+            if column in attributes:
+                for shape_id, name in enumerate(attributes[column]):
+                    if not self.deleted[shape_id]:
+                        self._names.setdefault(str(name).lower(), shape_id)
+
+    def __len__(self):
+        return len(self.bbox)
+
+    def shape_id(self, name):
+        """Shape index by country name, long name or ISO/ADM0 code (case-insensitive)"""
+        try:
+            return self._names[name.lower()]
+        except KeyError:
+            raise KeyError(f"No boundary named {name!r}") from None
+
+    def rings(self, shape_id):
+        """(n, 2) lon/lat views of every ring of a shape (outer rings and holes)"""
+        first, last = self.shape_rings[shape_id], self.shape_rings[shape_id + 1]
+        return [self.coords[self.ring_offsets[r]:self.ring_offsets[r + 1]] for r in range(first, last)]
+
+    def query_bbox(self, lon_min, lat_min, lon_max, lat_max):
+        """IDs of shapes whose bounding box intersects the query box"""
+        cols = int(np.ceil(360 / self.cell_deg))
+        rows = int(np.ceil(180 / self.cell_deg))
+        c0, c1 = (int(np.clip((v + 180) // self.cell_deg, 0, cols - 1)) for v in (lon_min, lon_max))
+        r0, r1 = (int(np.clip((v + 90) // self.cell_deg, 0, rows - 1)) for v in (lat_min, lat_max))
+        candidates = np.unique(np.concatenate([
+            self.cell_shapes[self.cell_offsets[r * cols + c0]:self.cell_offsets[r * cols + c1 + 1]]
+            for r in range(r0, r1 + 1)
+        ]))
+        box = self.bbox[candidates]
+        hit = (box[:, 0] <= lon_max) & (box[:, 2] >= lon_min) & (box[:, 1] <= lat_max) & (box[:, 3] >= lat_min)
+        return candidates[hit]
+
+    def contains(self, shape_id, lat, lon, chunk=4096):
+        """Even-odd point-in-polygon test of many points against one shape (holes excluded)"""
+        lat, lon = np.atleast_1d(np.asarray(lat, np.float64)), np.atleast_1d(np.asarray(lon, np.float64))
+        x0, y0, x1, y1 = self.bbox[shape_id]
+        inside = (lon >= x0) & (lon <= x1) & (lat >= y0) & (lat <= y1)
+        candidates = np.flatnonzero(inside)
+        if not len(candidates):
+            return inside
+
+        rings = self.rings(shape_id)
+        a = np.concatenate([ring[:-1] for ring in rings])
+        b = np.concatenate([ring[1:] for ring in rings])
+        for start in range(0, len(candidates), chunk):
+            idx = candidates[start:start + chunk]
+            px, py = lon[idx, None], lat[idx, None]
+            straddles = (a[:, 1] > py) != (b[:, 1] > py)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x_cross = (b[:, 0] - a[:, 0]) * (py - a[:, 1]) / (b[:, 1] - a[:, 1]) + a[:, 0]
+            inside[idx] = (np.count_nonzero(straddles & (px < x_cross), axis=1) % 2) == 1
+        return inside
+
+    def locate(self, lat, lon):
+        """Shape ID containing each point (-1 when none)"""
+        lat, lon = np.atleast_1d(np.asarray(lat, np.float64)), np.atleast_1d(np.asarray(lon, np.float64))
+        result = np.full(len(lat), -1, np.int64)
+        if not len(lat):
+            return result
+        for shape_id in self.query_bbox(lon.min(), lat.min(), lon.max(), lat.max()):
+            pending = result < 0
+            hit = np.zeros(len(lat), bool)
+            hit[pending] = self.contains(shape_id, lat[pending], lon[pending])
+            result[hit] = shape_id
+        return result
+
+# --------------------------------------------------
+# Disk cache
+# --------------------------------------------------
+def _cache_path(path):
+    return store.STORE_DIR / f"boundaries_{Path(path).name}.npz"
+
+
+def _source_signature(path):
+    stats = [Path(path).with_suffix(ext).stat() for ext in (".shp", ".shx", ".dbf")]
+    return np.asarray([value for stat in stats for value in (stat.st_size, stat.st_mtime_ns)], np.int64)
+
+
+def build_cache(path=NATURALEARTH, fields=DEFAULT_FIELDS):
+    """Parse the shapefile and write arrays, attributes and grid index to one .npz"""
+    arrays = read_shp(path)
+    attributes = read_dbf(Path(path).with_suffix(".dbf"), fields)
+    arrays["deleted"] = attributes.pop("_deleted").to_numpy(bool)
+    # Shapes of deleted records keep their position but stay out of the index, so lookups never return them
+    arrays["bbox"][arrays["deleted"]] = np.nan
+    arrays["cell_offsets"], arrays["cell_shapes"] = build_grid_index(arrays["bbox"])
+    payload = dict(arrays, source=_source_signature(path), fields=np.asarray(list(attributes.columns)))
+    for column in attributes:
+        values = attributes[column]
+        payload[f"attr_{column}"] = values.to_numpy(np.float64) if values.dtype.kind == "f" else values.to_numpy(str)
+
+    cache = _cache_path(path)
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{cache.stem}.", suffix=".npz", dir=cache.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            np.savez(handle, **payload)
+        os.chmod(tmp_name, store.PUBLISHED_MODE)
+        os.replace(tmp_name, cache)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return cache
+
+
+@functools.lru_cache(maxsize=None)
+def load_boundaries(path=NATURALEARTH):
+    """Boundaries from the .npz cache, rebuilding it when the shapefile changed"""
+    cache = _cache_path(path)
+    for attempt in range(2):
+        if cache.exists():
+            with np.load(cache) as data:
+                if np.array_equal(data["source"], _source_signature(path)):
+                    arrays = {name: data[name] for name in data.files if name != "source" and not name.startswith("attr_")}
+                    attributes = pd.DataFrame({column: data[f"attr_{column}"] for column in data["fields"]})
+                    return Boundaries(arrays, attributes)
+        build_cache(path)
+    raise RuntimeError(f"Could not build a boundary cache for {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the boundary cache and look up a country")
+    parser.add_argument("name", nargs="?", default="India")
+    parser.add_argument("--rebuild", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        build_cache()
+    boundaries = load_boundaries()
+    shape_id = boundaries.shape_id(args.name)
+    rings = boundaries.rings(shape_id)
+    print(f"✅ {len(boundaries)} boundaries cached in {_cache_path(NATURALEARTH)}")
+    print(f"   {boundaries.attributes.loc[shape_id, 'NAME']}: {len(rings)} rings, "
+          f"{sum(len(r) for r in rings)} vertices, bbox {np.round(boundaries.bbox[shape_id], 2).tolist()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""
+Dashboard charts, drawn by the browser (Vega-Lite) or by matplotlib
+A chart is one or more panels; a panel stacks layers (lines, bands, points,
+bars, reference rules and spans) over one x axis. By default every panel is
+sent as a Vega-Lite spec with its layer data attached as named datasets, and
+the browser draws it: hover tooltips, x zoom/pan (drag, mouse wheel,
+double-click to reset) and legend toggling (click a series) need no server
+rerun. An unchanged chart serializes to identical bytes, so Streamlit's
+message cache sends it to a browser once per data version.
+
+ECOFUSION_CHARTS=matplotlib draws the same panels as matplotlib figures
+through layout.show_figure (the static export uses this fallback). Line, band
+and point layers pass through the downsampling layer first, so neither
+renderer receives more points than the chart can show.
+"""
+
+import os
+from dataclasses import dataclass
+
+import pandas as pd
+import streamlit as st
+
+from ecofusion import tracing
+from ecofusion.downsample import DEFAULT_POINTS, downsample_frame, pixel_width
+
+RENDERERS = ("vega-lite", "matplotlib")
+# matplotlib's tab10 (Vega's tableau10): grouped series get the same colours in both renderers
+SERIES_COLORS = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+                 "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
+SHAPES = {"o": "circle", "s": "square", "^": "triangle-up"}
+DASH = [6, 4]
+PANEL_HEIGHT = 300  # pixels per Vega-Lite panel
+
+
+def renderer():
+    """'vega-lite' (interactive, drawn by the browser) or 'matplotlib' (server-side PNG)"""
+    name = os.environ.get("ECOFUSION_CHARTS", "vega-lite")
+    if name not in RENDERERS:
+        raise ValueError(f"ECOFUSION_CHARTS must be one of {RENDERERS}, not {name!r}")
+    return name
+
+
+@dataclass
+class Layer:
+    kind: str  # line | band | points | bars | rule | span
+    data: pd.DataFrame = None
+    y: str = None
+    y2: str = None  # upper edge of a band
+    label: str = None  # legend entry of an ungrouped layer
+    by: str = None  # one series per value of this column (coloured from SERIES_COLORS)
+    color: str = None
+    colors: str = None  # column holding one colour per point or bar
+    text: str = None  # column holding one label per bar
+    marker: str = None
+    dash: bool = False
+    width: float = 2
+    size: float = 60
+    opacity: float = 1.0
+    value: tuple = ()  # rule: (y,); span: (x start, x end)
+
+    @property
+    def in_legend(self):
+        return self.by is not None or self.label is not None
+
+
+class Panel:
+    """One set of axes; every layer plots against its x column"""
+
+    def __init__(self, title, x, x_title=None, y_title=None, y_domain=None, categorical=False, horizontal=False):
+        self.title = title
+        self.x = x
+        self.x_title = x_title
+        self.y_title = y_title
+        self.y_domain = y_domain
+        self.categorical = categorical  # x holds categories (bar charts)
+        self.horizontal = horizontal  # categories on the vertical axis
+        self.layers = []
+
+    def line(self, data, y, label=None, color=None, by=None, marker="o", dash=False, width=2, opacity=1.0):
+        self.layers.append(Layer("line", data, y, label=label, by=by, color=color, marker=marker, dash=dash,
+                                 width=width, opacity=opacity))
+        return self
+
+    def band(self, data, lower, upper, label=None, color=None, by=None, opacity=0.15):
+        self.layers.append(Layer("band", data, lower, upper, label=label, by=by, color=color, opacity=opacity))
+        return self
+
+    def points(self, data, y, colors, size=100, opacity=0.8):
+        self.layers.append(Layer("points", data, y, colors=colors, size=size, opacity=opacity))
+        return self
+
+    def bars(self, data, y, color=None, colors=None, text=None, opacity=0.8):
+        self.layers.append(Layer("bars", data, y, color=color, colors=colors, text=text, opacity=opacity))
+        return self
+
+    def rule(self, y, color, label=None, dash=True, opacity=0.7):
+        self.layers.append(Layer("rule", label=label, color=color, dash=dash, opacity=opacity, value=(y,)))
+        return self
+
+    def span(self, start, end, color, label=None, opacity=0.2):
+        self.layers.append(Layer("span", label=label, color=color, opacity=opacity, value=(start, end)))
+        return self
+
+    def legend(self):
+        """Legend entries in order of appearance → colour"""
+        colors = {}
+        for layer in self.layers:
+            if layer.by is not None:
+                for value in pd.unique(layer.data[layer.by].astype(str)):
+                    colors.setdefault(value, SERIES_COLORS[len(colors) % len(SERIES_COLORS)])
+            elif layer.label is not None:
+                colors.setdefault(layer.label, layer.color)
+        return colors
+
+
+def _layer_frame(panel, layer, max_points):
+    """The columns a layer plots, long series reduced to `max_points` per column"""
+    columns = list(dict.fromkeys(c for c in (panel.x, layer.y, layer.y2, layer.by, layer.colors, layer.text) if c))
+    frame = layer.data[columns]
+    if layer.kind in ("line", "band", "points"):
+        frame = downsample_frame(frame, panel.x, [c for c in (layer.y, layer.y2) if c], by=layer.by,
+                                 max_points=max_points)
+    return frame
+
+# --------------------------------------------------
+# Vega-Lite
+# --------------------------------------------------
+def _field_type(dtype):
+    return "quantitative" if pd.api.types.is_numeric_dtype(dtype) else "nominal"
+
+
+def _x_encoding(panel, frame):
+    if panel.categorical:
+        return {"field": panel.x, "type": "nominal", "sort": None, "title": panel.x_title,
+                "axis": {"labelAngle": 0 if panel.horizontal else -45}}
+    encoding = {"field": panel.x, "type": "quantitative", "title": panel.x_title, "scale": {"zero": False}}
+    if pd.api.types.is_integer_dtype(frame[panel.x].dtype):
+        encoding["axis"] = {"format": "d"}  # years without a thousands separator
+    return encoding
+
+
+def _y_encoding(panel, field):
+    # Bars start at zero; lines zoom to their data
+    scale = {"domain": list(panel.y_domain)} if panel.y_domain else {"zero": panel.categorical}
+    return {"field": field, "type": "quantitative", "title": panel.y_title, "scale": scale}
+
+
+def _reference_spec(panel, layer, color):
+    """Rule (horizontal line at y) or span (shaded x range), drawn from inline values"""
+    if layer.kind == "rule":
+        values = {"y": float(layer.value[0])}
+        mark = {"type": "rule", "strokeDash": DASH if layer.dash else [], "opacity": layer.opacity}
+        encoding = {"y": _y_encoding(panel, "y")}
+    else:
+        values = {"start": float(layer.value[0]), "end": float(layer.value[1])}
+        mark = {"type": "rect", "opacity": layer.opacity}
+        encoding = {"x": {"field": "start", "type": "quantitative"}, "x2": {"field": "end"}}
+    encoding["color"] = color if layer.label else {"value": layer.color}
+    return {"data": {"values": [{**values, "series": layer.label or ""}]}, "mark": mark, "encoding": encoding}
+
+
+def _layer_spec(panel, layer, name, frame, color, toggle):
+    tooltip = [{"field": c, "type": _field_type(frame[c].dtype),
+                **({"format": ".3f"} if pd.api.types.is_float_dtype(frame[c].dtype) else {})}
+               for c in frame.columns if c not in (layer.colors, "series")]
+    x, y = _x_encoding(panel, frame), _y_encoding(panel, layer.y)
+    own_colors = {"field": layer.colors, "type": "nominal", "scale": None, "legend": None}
+    spec = {"data": {"name": name}, "encoding": {"x": x, "y": y, "tooltip": tooltip}}
+
+    if layer.kind == "line":
+        point = {"shape": SHAPES[layer.marker], "filled": True, "size": 40} if layer.marker else False
+        spec["mark"] = {"type": "line", "strokeWidth": layer.width, "strokeDash": DASH if layer.dash else [],
+                        "point": point}
+        spec["encoding"]["color"] = color if layer.in_legend else {"value": layer.color}
+        spec["encoding"]["opacity"] = (
+            {"condition": {"param": toggle, "value": layer.opacity, "empty": True}, "value": 0.1}
+            if layer.in_legend else {"value": layer.opacity}
+        )
+    elif layer.kind == "band":
+        spec["mark"] = {"type": "area", "opacity": layer.opacity}
+        spec["encoding"].update(y2={"field": layer.y2}, color=color if layer.in_legend else {"value": layer.color})
+    elif layer.kind == "points":
+        spec["mark"] = {"type": "point", "filled": True, "size": layer.size, "opacity": layer.opacity,
+                        "stroke": "black", "strokeWidth": 1}
+        spec["encoding"]["color"] = own_colors
+    else:  # bars
+        spec["mark"] = {"type": "bar", "opacity": layer.opacity, "stroke": "black", "strokeWidth": 1}
+        spec["encoding"]["color"] = own_colors if layer.colors else {"value": layer.color}
+        if panel.horizontal:
+            spec["encoding"].update(x={**y, "title": panel.y_title}, y={**x, "title": None})
+        if layer.text:
+            offset = {"align": "left", "dx": 4} if panel.horizontal else {"baseline": "bottom", "dy": -4}
+            labels = {"data": {"name": name}, "mark": {"type": "text", "fontWeight": "bold", **offset},
+                      "encoding": {"x": spec["encoding"]["x"], "y": spec["encoding"]["y"],
+                                   "text": {"field": layer.text}}}
+            return {"layer": [spec, labels]}
+    return spec
+
+
+def panel_spec(panel, max_points=DEFAULT_POINTS):
+    """Self-contained Vega-Lite spec of one panel (its data included as named datasets)"""
+    legend = panel.legend()
+    color = {"field": "series", "type": "nominal", "title": None,
+             "scale": {"domain": list(legend), "range": list(legend.values())},
+             "legend": {"orient": "bottom", "columns": 4}}
+    toggle = "series_toggle"
+
+    datasets, layers = {}, []
+    for i, layer in enumerate(panel.layers):
+        if layer.kind in ("rule", "span"):
+            layers.append(_reference_spec(panel, layer, color))
+            continue
+        frame = _layer_frame(panel, layer, max_points)
+        series = frame[layer.by].astype(str) if layer.by else (layer.label or "")
+        # Categoricals go over the wire as plain strings
+        frame = frame.assign(series=series).astype(
+            {c: "str" for c in frame.columns if isinstance(frame[c].dtype, pd.CategoricalDtype)}
+        )
+        name = f"layer_{i}"
+        datasets[name] = frame.reset_index(drop=True)
+        layers.append(_layer_spec(panel, layer, name, frame, color, toggle))
+
+    # Selections are declared once, on the first data layer; the toggle needs a line in the legend
+    params = []
+    if any(layer.kind == "line" and layer.in_legend for layer in panel.layers):
+        params.append({"name": toggle, "select": {"type": "point", "fields": ["series"]}, "bind": "legend"})
+    if not panel.categorical:
+        params.append({"name": "x_zoom", "select": {"type": "interval", "encodings": ["x"]}, "bind": "scales"})
+    first = next(spec for layer, spec in zip(panel.layers, layers) if layer.data is not None)
+    (first["layer"][0] if "layer" in first else first)["params"] = params
+    return {"title": panel.title, "height": PANEL_HEIGHT, "datasets": datasets, "layer": layers,
+            "config": {"axis": {"gridOpacity": 0.3}}}
+
+# --------------------------------------------------
+# matplotlib fallback
+# --------------------------------------------------
+def _draw_bars(ax, panel, layer, frame):
+    positions = list(range(len(frame)))
+    colors = frame[layer.colors].tolist() if layer.colors else layer.color
+    if panel.horizontal:
+        bars = ax.barh(positions, frame[layer.y], color=colors, alpha=layer.opacity, edgecolor="black")
+        ax.set_yticks(positions, frame[panel.x].astype(str))
+    else:
+        bars = ax.bar(positions, frame[layer.y], color=colors, alpha=layer.opacity, edgecolor="black")
+        ax.set_xticks(positions, frame[panel.x].astype(str), rotation=45, ha="right")
+    for bar, text in zip(bars, frame[layer.text] if layer.text else []):
+        if panel.horizontal:
+            ax.text(bar.get_width() + 0.01, bar.get_y() + bar.get_height() / 2, text,
+                    ha="left", va="center", fontweight="bold")
+        else:
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width() / 2, height + 0.01 if height >= 0 else height - 0.03, text,
+                    ha="center", va="bottom" if height >= 0 else "top", fontweight="bold")
+
+
+def _draw(ax, panel):
+    legend = panel.legend()
+    labelled = set()  # a grouped series gets one legend entry, from its first layer
+    for layer in panel.layers:
+        linestyle = "--" if layer.dash else "-"
+        if layer.kind == "rule":
+            ax.axhline(layer.value[0], color=layer.color, linestyle=linestyle, alpha=layer.opacity, label=layer.label)
+            continue
+        if layer.kind == "span":
+            ax.axvspan(*layer.value, color=layer.color, alpha=layer.opacity, label=layer.label)
+            continue
+        frame = _layer_frame(panel, layer, pixel_width(ax))
+        if layer.kind == "points":
+            ax.scatter(frame[panel.x], frame[layer.y], c=frame[layer.colors].tolist(), s=layer.size,
+                       alpha=layer.opacity, edgecolors="black")
+            continue
+        if layer.kind == "bars":
+            _draw_bars(ax, panel, layer, frame)
+            continue
+        groups = frame.groupby(frame[layer.by].astype(str), sort=False) if layer.by else [(layer.label, frame)]
+        for series, group in groups:
+            color = legend[series] if layer.by else layer.color
+            label = series if series not in labelled else None
+            labelled.add(series)
+            if layer.kind == "line":
+                ax.plot(group[panel.x], group[layer.y], color=color, marker=layer.marker, linestyle=linestyle,
+                        linewidth=layer.width, alpha=layer.opacity, label=label)
+            else:
+                ax.fill_between(group[panel.x], group[layer.y], group[layer.y2], color=color, alpha=layer.opacity,
+                                label=label)
+
+    ax.set_title(panel.title, fontsize=14, fontweight="bold")
+    if panel.horizontal:
+        ax.set_xlabel(panel.y_title or "")
+    else:
+        ax.set_xlabel(panel.x_title or "")
+        ax.set_ylabel(panel.y_title or "")
+    ax.grid(axis=("x" if panel.horizontal else "y") if panel.categorical else "both", alpha=0.3)
+    if panel.y_domain:
+        ax.set_ylim(*panel.y_domain)
+    if ax.get_legend_handles_labels()[0]:
+        ax.legend(fontsize=8 if len(legend) > 4 else None)
+
+
+def show(panels, span_name, columns=1, figsize=(12, 5)):
+    """Render a chart: one panel, or a list of panels laid out `columns` wide (empty panels are skipped)"""
+    panels = [panels] if isinstance(panels, Panel) else [panel for panel in panels if panel.layers]
+    rows = -(-len(panels) // columns)
+    if renderer() == "matplotlib":
+        import matplotlib.pyplot as plt
+
+        from ecofusion.layout import show_figure
+
+        fig, axes = plt.subplots(rows, columns, figsize=figsize, squeeze=False)
+        for ax, panel in zip(axes.flat, panels):
+            _draw(ax, panel)
+        for ax in axes.flat[len(panels):]:
+            ax.set_visible(False)
+        fig.tight_layout()
+        show_figure(fig, span_name)
+        return
+
+    with tracing.span(span_name, panels=len(panels)):
+        for row in range(rows):
+            slots = st.columns(columns) if columns > 1 else [st]
+            for slot, panel in zip(slots, panels[row * columns:(row + 1) * columns]):
+                slot.vega_lite_chart(panel_spec(panel, DEFAULT_POINTS // columns), width="stretch")
@@ -0,0 +1,318 @@
+"""
+Chunked, compressed int16 NDVI data cube
+MOD13Q1 NDVI is delivered as int16 with a 0.0001 scale factor, but notebook 1
+multiplies it out to floats straight away, so a local stack of composites
+costs 4-8 bytes per pixel (far more as CSV). A cube keeps the native encoding:
+
+- values are stored as int16 = round((ndvi - offset) / scale) with a fill
+  value for clouds and no data, and decoded to float32 (NaN for fill) on read
+- the time × y × x array is split into chunks; every chunk is byte-shuffled
+  (low bytes, then the nearly constant high bytes) and compressed on its own
+  with zstd via pyarrow. A "delta" filter (differences along time) is
+  available for smooth series; on noisy composites it compresses worse
+- the default chunk shape serves both access patterns: a single-date map
+  decompresses 4 dates per pixel it returns and a pixel time series one
+  128 × 128 tile per 4 dates
+
+A cube is a directory: cube.json (shape, chunks, scale/offset, fill, codec,
+filters, times and extent) plus one file per chunk named by its chunk indices
+(`chunks/<t>.<y>.<x>`, as in Zarr). Chunks holding only fill are not written.
+Readers decompress only the chunks a selection touches. Rows run south →
+north, as in the spatial grid.
+
+Usage:
+    python -m ecofusion.cube ndvi_stack.npy data/ndvi_cube_WESTERN_GHATS --start 2018-01-01 --step-days 16
+"""
+
+import argparse
+import itertools
+import json
+import math
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from ecofusion.pipeline import WG_LAT_MAX, WG_LAT_MIN, WG_LON_MAX, WG_LON_MIN
+
+CUBE_DIR = "data/ndvi_cube_WESTERN_GHATS"
+SCALE = 0.0001  # MOD13Q1 NDVI scale factor
+FILL = -3000  # MOD13Q1 fill value
+VALID_RANGE = (-2000, 10000)
+DEFAULT_CHUNKS = (4, 128, 128)  # 128 KiB of int16 per chunk
+FILTERS = ("shuffle",)
+WG_EXTENT = {"lat_min": WG_LAT_MIN, "lat_max": WG_LAT_MAX, "lon_min": WG_LON_MIN, "lon_max": WG_LON_MAX}
+
+# --------------------------------------------------
+# Encoding and per-chunk filters
+# --------------------------------------------------
+def encode(values, scale=SCALE, offset=0.0, fill=FILL, valid_range=VALID_RANGE):
+    """Float NDVI → int16 counts (NaN → fill, out-of-range values clipped to the valid range)"""
+    values = np.asarray(values, np.float64)
+    with np.errstate(invalid="ignore"):
+        counts = np.clip(np.round((values - offset) / scale), *valid_range)
+    return np.where(np.isnan(values), fill, counts).astype(np.int16)
+
+
+def decode(counts, scale=SCALE, offset=0.0, fill=FILL):
+    """int16 counts → float32 NDVI with NaN for fill"""
+    return np.where(counts == fill, np.nan, counts * np.float32(scale) + np.float32(offset)).astype(np.float32)
+
+
+def _pack(block, filters, codec):
+    if "delta" in filters:
+        block = np.diff(block, axis=0, prepend=np.int16(0))  # int16 wraps, undone exactly by an int16 cumsum
+    payload = np.ascontiguousarray(block).view(np.uint8)
+    if "shuffle" in filters:
+        payload = payload.reshape(-1, 2).T
+    return codec.compress(np.ascontiguousarray(payload).tobytes(), asbytes=True)
+
+
+def _unpack(payload, shape, filters, codec):
+    size = math.prod(shape)
+    data = np.frombuffer(codec.decompress(payload, decompressed_size=2 * size, asbytes=True), np.uint8)
+    if "shuffle" in filters:
+        data = data.reshape(2, size).T
+    block = np.ascontiguousarray(data).view(np.int16).reshape(shape)
+    if "delta" in filters:
+        block = np.cumsum(block, axis=0, dtype=np.int16)
+    return block
+
+
+def _chunk_name(index):
+    return ".".join(map(str, index))
+
+# --------------------------------------------------
+# Writing
+# --------------------------------------------------
+class CubeWriter:
+    """Appends (time, y, x) slabs of NDVI to a new cube, one row of time chunks at a time
+
+    Float slabs are encoded with scale/offset; pass raw=True to store int16
+    MOD13Q1 counts as they are. Memory is bounded by one time chunk of maps.
+    """
+
+    def __init__(self, directory, height, width, chunks=DEFAULT_CHUNKS, scale=SCALE, offset=0.0, fill=FILL,
+                 valid_range=VALID_RANGE, codec="zstd", level=3, filters=FILTERS, extent=None):
+        self.directory = Path(directory)
+        (self.directory / "chunks").mkdir(parents=True, exist_ok=True)
+        for stale in (self.directory / "chunks").iterdir():
+            stale.unlink()
+        self.meta = {
+            "shape": [0, int(height), int(width)], "chunks": [int(c) for c in chunks], "dtype": "int16",
+            "scale": scale, "offset": offset, "fill": fill, "valid_range": list(valid_range), "codec": codec,
+            "level": level, "filters": list(filters), "times": [], "extent": extent or WG_EXTENT,
+        }
+        self.codec = pa.Codec(codec, compression_level=level)
+        self._pending = []
+        self.stored_bytes = 0
+
+    def append(self, values, times=None, raw=False):
+        values = np.asarray(values)
+        values = values[None] if values.ndim == 2 else values
+        if values.shape[1:] != tuple(self.meta["shape"][1:]):
+            raise ValueError(f"slab of shape {values.shape[1:]} does not match the cube's {self.meta['shape'][1:]}")
+        m = self.meta
+        counts = values.astype(np.int16) if raw else encode(values, m["scale"], m["offset"], m["fill"],
+                                                            m["valid_range"])
+        self._pending.append(counts)
+        self.meta["times"] += [str(t) for t in times] if times is not None else [None] * len(counts)
+        if sum(len(p) for p in self._pending) >= m["chunks"][0]:
+            self._flush(final=False)
+
+    def _flush(self, final):
+        pending = np.concatenate(self._pending) if self._pending else np.empty((0, *self.meta["shape"][1:]), np.int16)
+        t_chunk, y_chunk, x_chunk = self.meta["chunks"]
+        full = len(pending) if final else len(pending) // t_chunk * t_chunk
+        for start in range(0, full, t_chunk):
+            t_index = (self.meta["shape"][0] + start) // t_chunk
+            slab = pending[start:start + t_chunk]
+            for y, x in itertools.product(range(0, slab.shape[1], y_chunk), range(0, slab.shape[2], x_chunk)):
+                block = slab[:, y:y + y_chunk, x:x + x_chunk]
+                if (block == self.meta["fill"]).all():
+                    continue
+                payload = _pack(block, self.meta["filters"], self.codec)
+                (self.directory / "chunks" / _chunk_name((t_index, y // y_chunk, x // x_chunk))).write_bytes(payload)
+                self.stored_bytes += len(payload)
+        self.meta["shape"][0] += full
+        self._pending = [pending[full:]] if full < len(pending) else []
+
+    def close(self):
+        """Write the last (possibly partial) time chunk and cube.json; returns the opened cube"""
+        self._flush(final=True)
+        (self.directory / "cube.json").write_text(json.dumps(self.meta, indent=2))
+        return open_cube(self.directory)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if exc[0] is None:
+            self.close()
+
+
+def write_cube(directory, values, times=None, raw=False, **options):
+    """Write a whole (time, y, x) array as a cube; options as for CubeWriter"""
+    values = np.asarray(values)
+    writer = CubeWriter(directory, values.shape[1], values.shape[2], **options)
+    t_chunk = writer.meta["chunks"][0]
+    for start in range(0, len(values), t_chunk):
+        writer.append(values[start:start + t_chunk], None if times is None else times[start:start + t_chunk], raw)
+    return writer.close()
+
+# --------------------------------------------------
+# Reading
+# --------------------------------------------------
+class Cube:
+    """Read access to a saved cube; selections decompress only the chunks they touch
+
+    `cube[t, y, x]` takes ints and slices (any step) and returns float32 NDVI;
+    `cube.raw[...]` returns the stored int16 counts. Recently used chunks are
+    kept in a small LRU cache, and chunks_read / bytes_read count what was
+    decompressed from disk.
+    """
+
+    def __init__(self, directory, meta, cache_chunks=64, workers=None):
+        self.directory = Path(directory)
+        self.meta = meta
+        self.shape = tuple(meta["shape"])
+        self.chunks = tuple(meta["chunks"])
+        self.times = meta["times"]
+        self.codec = pa.Codec(meta["codec"])
+        self.cache_chunks = cache_chunks
+        self.workers = workers
+        self._cache = OrderedDict()
+        self.chunks_read = 0
+        self.bytes_read = 0
+
+    def __getitem__(self, key):
+        m = self.meta
+        return decode(self.raw[key], m["scale"], m["offset"], m["fill"])
+
+    @property
+    def raw(self):
+        return _RawView(self)
+
+    def _load(self, index):
+        """(decompressed int16 block, compressed bytes read) of one chunk; absent chunks are all fill"""
+        shape = tuple(min(c, s - i * c) for i, c, s in zip(index, self.chunks, self.shape))
+        path = self.directory / "chunks" / _chunk_name(index)
+        if not path.exists():
+            return np.full(shape, self.meta["fill"], np.int16), 0
+        payload = path.read_bytes()
+        return _unpack(payload, shape, self.meta["filters"], self.codec), len(payload)
+
+    def _store(self, index, loaded):
+        block, size = loaded
+        self.chunks_read += size > 0
+        self.bytes_read += size
+        self._cache[index] = block
+        if len(self._cache) > self.cache_chunks:
+            self._cache.popitem(last=False)
+        return block
+
+    def _chunk(self, index):
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+        return self._store(index, self._load(index))
+
+    def read_raw(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        key = key + (slice(None),) * (3 - len(key))
+        positions = []
+        for k, size in zip(key, self.shape):
+            if isinstance(k, (int, np.integer)):
+                if not -size <= k < size:
+                    raise IndexError(f"index {k} is out of bounds for size {size}")
+                positions.append(int(k) % size)
+            else:
+                positions.append(range(*k.indices(size)))
+
+        # Read the box covering the selection, then take the selected positions out of it
+        box = [(p, p + 1) if isinstance(p, int) else (min(p), max(p) + 1) if len(p) else (0, 0) for p in positions]
+        out = np.full([hi - lo for lo, hi in box], self.meta["fill"], np.int16)
+        ranges = [range(lo // c, (hi - 1) // c + 1) if hi > lo else range(0) for (lo, hi), c in zip(box, self.chunks)]
+        indices = list(itertools.product(*ranges))
+        missing = [index for index in indices if index not in self._cache]
+        if self.workers and len(missing) > 1:
+            # pyarrow releases the GIL while decompressing, so wide reads decode chunks in parallel
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for index, loaded in zip(missing, pool.map(self._load, missing)):
+                    self._store(index, loaded)
+        for index in indices:
+            block = self._chunk(index)
+            source, target = [], []
+            for i, (lo, hi), c in zip(index, box, self.chunks):
+                start, stop = max(lo, i * c), min(hi, (i + 1) * c)
+                source.append(slice(start - i * c, stop - i * c))
+                target.append(slice(start - lo, stop - lo))
+            out[tuple(target)] = block[tuple(source)]
+
+        selection = tuple(0 if isinstance(p, int) else slice(None) if p.step == 1 else np.asarray(p, dtype=np.intp) - lo
+                          for p, (lo, _) in zip(positions, box))
+        if any(isinstance(s, np.ndarray) for s in selection):
+            # Strided or reversed selections: one axis at a time (fancy indices would broadcast together)
+            for axis in reversed(range(3)):
+                out = out[(slice(None),) * axis + (selection[axis],)]
+            return out
+        return out[selection]
+
+    def pixel(self, lat, lon):
+        """(row, col) of the pixel containing each point; rows run south → north"""
+        extent, (_, height, width) = self.meta["extent"], self.shape
+        row = (np.asarray(lat, np.float64) - extent["lat_min"]) / (extent["lat_max"] - extent["lat_min"]) * height
+        col = (np.asarray(lon, np.float64) - extent["lon_min"]) / (extent["lon_max"] - extent["lon_min"]) * width
+        return np.clip(row.astype(np.int64), 0, height - 1), np.clip(col.astype(np.int64), 0, width - 1)
+
+    def series(self, lat, lon):
+        """NDVI time series of the pixel containing (lat, lon)"""
+        row, col = self.pixel(lat, lon)
+        return self[:, int(row), int(col)]
+
+    def stored_bytes(self):
+        return sum(path.stat().st_size for path in (self.directory / "chunks").iterdir())
+
+
+class _RawView:
+    def __init__(self, cube):
+        self.cube = cube
+
+    def __getitem__(self, key):
+        return self.cube.read_raw(key)
+
+
+def open_cube(directory, cache_chunks=64, workers=None):
+    directory = Path(directory)
+    return Cube(directory, json.loads((directory / "cube.json").read_text()), cache_chunks, workers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Store a (time, y, x) NDVI stack as a chunked int16 cube")
+    parser.add_argument("stack", type=Path, help=".npy array of NDVI (float, NaN = no data) or raw int16 counts")
+    parser.add_argument("output", type=Path, nargs="?", default=Path(CUBE_DIR))
+    parser.add_argument("--chunks", type=int, nargs=3, default=DEFAULT_CHUNKS, metavar=("T", "Y", "X"))
+    parser.add_argument("--start", help="date of the first composite (times are left unset without it)")
+    parser.add_argument("--step-days", type=int, default=16, help="days between composites")
+    parser.add_argument("--level", type=int, default=3, help="zstd compression level")
+    args = parser.parse_args(argv)
+
+    stack = np.load(args.stack, mmap_mode="r")
+    times = None
+    if args.start:
+        times = pd.date_range(args.start, periods=len(stack), freq=f"{args.step_days}D").strftime("%Y-%m-%d")
+    start = time.perf_counter()
+    cube = write_cube(args.output, stack, times, raw=stack.dtype == np.int16, chunks=args.chunks, level=args.level)
+    seconds = time.perf_counter() - start
+    stored = cube.stored_bytes()
+    print(f"✅ {' × '.join(map(str, cube.shape))} cube in {seconds:.1f} s: {stored / 1e6:.1f} MB stored "
+          f"({stack.size * 4 / stored:.1f}× smaller than float32, {stack.size * 8 / stored:.1f}× than float64) "
+          f"→ {args.output}")
+
+
+if __name__ == "__main__":
+    main()
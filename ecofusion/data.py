@@ -0,0 +1,214 @@
+"""
+Shared data layer for the dashboard
+Tables come from the memory-mapped Arrow store (ecofusion.store) through the
+active data snapshot (ecofusion.versions), which a background watcher swaps
+when inputs change. Each rerun pins one snapshot, so a page never mixes data
+versions. Frames are shared read-only views; pages must not mutate them.
+"""
+
+import numpy as np
+import streamlit as st
+
+from ecofusion.versions import DataManager, SnapshotValidationError
+
+_SNAPSHOT_KEY = "_ecofusion_snapshot"
+
+
+@st.cache_resource
+def get_data_manager():
+    return DataManager().start()
+
+
+def pin_snapshot():
+    """Pin the active data version for the rest of this rerun (call once at the top of app.py)"""
+    try:
+        snapshot = get_data_manager().current()
+    except FileNotFoundError as e:
+        st.error(f"Data file not found: {e}")
+        st.error("Please run the notebooks first to generate the required data files.")
+        st.stop()
+    except SnapshotValidationError as e:
+        st.error(f"Data files failed validation: {e}")
+        st.error("Please regenerate the data files (notebooks or pipeline) and reload the page.")
+        st.stop()
+    st.session_state[_SNAPSHOT_KEY] = snapshot
+    return snapshot
+
+
+def current_snapshot():
+    snapshot = st.session_state.get(_SNAPSHOT_KEY)
+    return snapshot if snapshot is not None else pin_snapshot()
+
+# --------------------------------------------------
+# Per-table accessors (each page only touches what it needs)
+# --------------------------------------------------
+def load_fusion():
+    return current_snapshot().table("fusion")
+
+def load_model_results():
+    return current_snapshot().table("model_results")
+
+def load_feature_importance():
+    return current_snapshot().table("feature_importance")  # Indexed by feature name
+
+def load_audio_species():
+    return current_snapshot().table("audio_species")
+
+def load_audio_summary():
+    return current_snapshot().table("audio_summary")
+
+def load_gbif():
+    return current_snapshot().table("gbif")
+
+def load_species_stress():
+    # Species stress indicators are optional
+    return current_snapshot().tables.get("species_stress")
+
+def load_ndvi_data():
+    # FileNotFoundError propagates so the NDVI page can show its own guidance
+    snapshot = current_snapshot()
+    return snapshot.table("ndvi"), snapshot.ndvi_regional_summary
+
+
+@st.cache_resource
+def _open_grid_store(directory, modified_ns):
+    from ecofusion.spatial import open_grid_store
+
+    return open_grid_store(directory)
+
+
+def load_spatial_grid():
+    # Optional: written by the pipeline (or the synthetic generator); None when absent
+    from ecofusion.spatial import GRID_DIR
+    from ecofusion.store import DATA_ROOT
+
+    meta = DATA_ROOT / GRID_DIR / "grid.json"
+    if not meta.exists():
+        return None
+    return _open_grid_store(str(meta.parent), meta.stat().st_mtime_ns)
+
+
+@st.cache_resource
+def _open_species_matrix(directory, modified_ns):
+    from ecofusion.species import open_species_matrix
+
+    return open_species_matrix(directory)
+
+
+@st.cache_data(max_entries=16)
+def _species_trends(directory, modified_ns, region):
+    from ecofusion.species import species_trends
+
+    return species_trends(_open_species_matrix(directory, modified_ns), region)
+
+
+def _species_matrix_meta():
+    from ecofusion.species import MATRIX_DIR
+    from ecofusion.store import DATA_ROOT
+
+    return DATA_ROOT / MATRIX_DIR / "meta.json"
+
+
+def load_species_matrix():
+    # Optional: written by the pipeline (or the synthetic generator); None when absent
+    meta = _species_matrix_meta()
+    if not meta.exists():
+        return None
+    return _open_species_matrix(str(meta.parent), meta.stat().st_mtime_ns)
+
+
+def load_species_trends(region=None):
+    # One row per species, cached per region and matrix version; None when the matrix is absent
+    meta = _species_matrix_meta()
+    if not meta.exists():
+        return None
+    return _species_trends(str(meta.parent), meta.stat().st_mtime_ns, region)
+
+
+@st.cache_resource
+def _open_sketches(path, modified_ns):
+    from ecofusion.sketch import open_sketches
+
+    return open_sketches(path)
+
+
+def load_ndvi_sketches():
+    # Optional per region-year NDVI t-digests (pipeline --ndvi-points or the synthetic generator); None when absent
+    from ecofusion.sketch import SKETCH_PATH
+    from ecofusion.store import DATA_ROOT
+
+    path = DATA_ROOT / SKETCH_PATH
+    if not path.exists():
+        return None
+    return _open_sketches(str(path), path.stat().st_mtime_ns)
+
+
+@st.cache_data(max_entries=16)
+def _forecasts(version, horizon, model):
+    from ecofusion.forecast import forecast_frame
+
+    snapshot = current_snapshot()  # the pinned snapshot is the one named by `version`
+    fusion = snapshot.table("fusion").assign(region="Western Ghats")
+    stress = forecast_frame(fusion, "region", "year", "eco_stress_index", horizon, model)
+    ndvi = snapshot.tables.get("ndvi")
+    if ndvi is not None:
+        ndvi = forecast_frame(ndvi, "region", "year", "ndvi_mean", horizon, model)
+    return stress, ndvi
+
+
+def load_forecasts(horizon, model="damped_trend"):
+    """Eco-stress and per-region NDVI forecasts, cached per data version (NDVI is None without the table)"""
+    return _forecasts(current_snapshot().version, horizon, model)
+
+
+@st.cache_data(max_entries=16)
+def _cell_stress_forecast(version, directory, modified_ns, horizon, model):
+    from ecofusion.forecast import forecast_panel
+
+    latest = current_snapshot().table("fusion").iloc[-1]
+    store = _open_grid_store(directory, modified_ns)
+    stress = store.stress(latest.get("species_stress_index", 0.0), latest.get("critical_species_stress", 0.0))
+    observed = np.isfinite(stress).any(axis=1)
+    return np.flatnonzero(observed), forecast_panel(stress[observed], horizon, model)
+
+
+def load_cell_stress_forecast(horizon, model="damped_trend"):
+    # (cell ids, Forecast) for every grid cell with NDVI samples; None without the spatial grid
+    from ecofusion.spatial import GRID_DIR
+    from ecofusion.store import DATA_ROOT
+
+    meta = DATA_ROOT / GRID_DIR / "grid.json"
+    if not meta.exists():
+        return None
+    return _cell_stress_forecast(current_snapshot().version, str(meta.parent), meta.stat().st_mtime_ns, horizon, model)
+
+
+@st.cache_data(max_entries=32)
+def _query_dataset(name, committed_ns, columns, conditions):
+    from ecofusion.partitioned import query
+
+    return query(name, list(columns) or None, **dict(conditions))
+
+
+def load_partitioned(name, columns=None, **conditions):
+    """Selected partitions/columns of a partitioned dataset, cached per write; None when it was never written"""
+    from ecofusion.partitioned import committed_ns
+
+    committed = committed_ns(name)
+    if committed is None:
+        return None
+    return _query_dataset(name, committed, tuple(columns or ()), tuple(sorted(conditions.items())))
+
+
+@st.cache_data(max_entries=32)
+def _partition_values(name, committed_ns, key):
+    from ecofusion.partitioned import partition_values
+
+    return partition_values(name, key)
+
+
+def load_partition_values(name, key):
+    from ecofusion.partitioned import committed_ns
+
+    committed = committed_ns(name)
+    return [] if committed is None else _partition_values(name, committed, key)
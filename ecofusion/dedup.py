@@ -0,0 +1,190 @@
+"""
+Duplicate record detection for GBIF occurrences and BirdCLEF recordings
+Every record is reduced to normalized (species, lat/lon, event date, recorder)
+keys and hashed into two 64-bit fingerprints: an exact one (coordinates to
+~1 m) and a near one (coordinates rounded to ~100 m). Catalog numbers and file
+names are deliberately left out, so the same specimen filed twice or a
+recording uploaded twice collapses onto one fingerprint. The first record of
+each group is kept.
+
+Large exports are deduplicated in bounded memory: pass 1 streams the file and
+spills (fingerprint, row) pairs into hash partitions on disk, pass 2 finds the
+duplicate rows one partition at a time, pass 3 streams the file again and
+drops them.
+
+Usage:
+    python -m ecofusion.dedup occurrence.txt occurrence_dedup.txt --kind gbif
+    python -m ecofusion.dedup train_metadata.csv train_metadata_dedup.csv --kind birdclef
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+EXACT_DECIMALS = 5  # ~1 m: the same point written twice
+NEAR_DECIMALS = 3  # ~100 m: the same site georeferenced slightly differently
+
+# Source columns per record kind: species, latitude, longitude, event date, recorder
+KEY_COLUMNS = {
+    "gbif": {"species": "species", "lat": "decimalLatitude", "lon": "decimalLongitude",
+             "date": "eventDate", "recorder": "recordedBy"},
+    "birdclef": {"species": "primary_label", "lat": "latitude", "lon": "longitude",
+                 "date": "date", "recorder": "author"},
+}
+
+
+def _normalize_text(values):
+    return (values.astype("string").str.casefold().str.replace(r"[^\w]+", " ", regex=True)
+            .str.strip().fillna(""))
+
+
+def _event_date(frame, column):
+    """ISO day of the event; GBIF year/month/day columns are the fallback when eventDate is absent"""
+    if column in frame.columns:
+        return frame[column].astype("string").str.slice(0, 10).fillna("")
+    parts = [pd.to_numeric(frame[part], errors="coerce").astype("Int64").astype("string").fillna("")
+             for part in ("year", "month", "day") if part in frame.columns]
+    if not parts:
+        return pd.Series("", index=frame.index, dtype="string")
+    return parts[0].str.cat(parts[1:], sep="-") if len(parts) > 1 else parts[0]
+
+
+def fingerprints(frame, kind="gbif"):
+    """(exact, near) uint64 fingerprints per record"""
+    columns = KEY_COLUMNS[kind]
+    missing = pd.Series("", index=frame.index, dtype="string")
+    keys = pd.DataFrame({
+        "species": _normalize_text(frame[columns["species"]]),
+        "date": _event_date(frame, columns["date"]),
+        "recorder": _normalize_text(frame[columns["recorder"]]) if columns["recorder"] in frame.columns else missing,
+    })
+    # Near coordinates are rounded from the exact ones, so every exact group nests inside one near group
+    lat = np.round(pd.to_numeric(frame[columns["lat"]], errors="coerce").to_numpy(np.float64), EXACT_DECIMALS)
+    lon = np.round(pd.to_numeric(frame[columns["lon"]], errors="coerce").to_numpy(np.float64), EXACT_DECIMALS)
+
+    def hashed(lat, lon):
+        # + 0.0 folds -0.0 into 0.0 so both hash alike
+        return pd.util.hash_pandas_object(keys.assign(lat=lat + 0.0, lon=lon + 0.0), index=False).to_numpy()
+
+    return hashed(lat, lon), hashed(np.round(lat, NEAR_DECIMALS), np.round(lon, NEAR_DECIMALS))
+
+
+def duplicate_rows(exact, near, rows):
+    """Row ids to drop, split into exact and near duplicates; the lowest row of each group is kept
+
+    Exact groups nest inside near groups, so the inputs may be any subset of
+    records that is closed under the near fingerprint (e.g. one hash partition).
+    """
+    order = np.lexsort((rows, exact))
+    exact_sorted = exact[order]
+    repeat = np.r_[False, exact_sorted[1:] == exact_sorted[:-1]]
+    exact_dups = rows[order[repeat]]
+
+    # Among the exact representatives, a repeated near fingerprint is a near duplicate
+    representatives = order[~repeat]
+    order = representatives[np.lexsort((rows[representatives], near[representatives]))]
+    near_sorted = near[order]
+    repeat = np.r_[False, near_sorted[1:] == near_sorted[:-1]]
+    return np.sort(exact_dups), np.sort(rows[order[repeat]])
+
+
+def _report(years, exact_mask, near_mask):
+    report = pd.DataFrame({"year": pd.array(years, dtype="Float64").astype("Int64"), "exact_duplicates": exact_mask, "near_duplicates": near_mask})
+    report = report.groupby("year", dropna=False).agg(
+        records=("exact_duplicates", "size"),
+        exact_duplicates=("exact_duplicates", "sum"),
+        near_duplicates=("near_duplicates", "sum"),
+    )
+    report["kept"] = report["records"] - report["exact_duplicates"] - report["near_duplicates"]
+    return report.reset_index()
+
+
+def _years(frame, kind):
+    if "year" in frame.columns:
+        return pd.to_numeric(frame["year"], errors="coerce").to_numpy()
+    date_column = KEY_COLUMNS[kind]["date"]
+    if date_column in frame.columns:
+        return pd.to_datetime(frame[date_column], errors="coerce").dt.year.to_numpy()
+    return np.full(len(frame), np.nan)
+
+
+def deduplicate(frame, kind="gbif"):
+    """Drop exact and near duplicate records from an in-memory frame; returns (kept, per-year report)"""
+    exact, near = fingerprints(frame, kind)
+    exact_dups, near_dups = duplicate_rows(exact, near, np.arange(len(frame)))
+    exact_mask = np.zeros(len(frame), bool)
+    near_mask = np.zeros(len(frame), bool)
+    exact_mask[exact_dups] = True
+    near_mask[near_dups] = True
+    report = _report(_years(frame, kind), exact_mask, near_mask)
+    return frame[~(exact_mask | near_mask)], report
+
+
+def deduplicate_file(source, destination, kind="gbif", sep=None, chunksize=1_000_000, partitions=64):
+    """Streaming three-pass deduplication of a delimited export; memory is bounded by one partition"""
+    source, destination = Path(source), Path(destination)
+    sep = sep or ("\t" if source.suffix in (".txt", ".tsv") else ",")
+    read = dict(sep=sep, chunksize=chunksize, low_memory=False, dtype=str, keep_default_na=False, na_values=[""])
+
+    with tempfile.TemporaryDirectory(prefix="ecofusion-dedup-") as spill_dir:
+        spill = [open(Path(spill_dir) / f"part-{p:04d}.bin", "wb") for p in range(partitions)]
+        try:
+            offset = 0
+            for chunk in pd.read_csv(source, **read):
+                exact, near = fingerprints(chunk, kind)
+                # Near groups never straddle partitions (exact groups nest inside them)
+                part = (near % np.uint64(partitions)).astype(np.int64)
+                records = np.rec.fromarrays([exact, near, np.arange(offset, offset + len(chunk), dtype=np.uint64)])
+                for p in np.unique(part):
+                    records[part == p].tofile(spill[p])
+                offset += len(chunk)
+        finally:
+            for handle in spill:
+                handle.close()
+
+        dtype = np.dtype([("f0", np.uint64), ("f1", np.uint64), ("f2", np.uint64)])
+        exact_dups, near_dups = [], []
+        for p in range(partitions):
+            records = np.fromfile(Path(spill_dir) / f"part-{p:04d}.bin", dtype=dtype)
+            if len(records):
+                exact_part, near_part = duplicate_rows(records["f0"], records["f1"], records["f2"].astype(np.int64))
+                exact_dups.append(exact_part)
+                near_dups.append(near_part)
+    exact_dups = np.sort(np.concatenate(exact_dups or [np.empty(0, np.int64)]))
+    near_dups = np.sort(np.concatenate(near_dups or [np.empty(0, np.int64)]))
+
+    reports = []
+    offset = 0
+    with open(destination, "w", newline="") as sink:
+        for i, chunk in enumerate(pd.read_csv(source, **read)):
+            rows = np.arange(offset, offset + len(chunk))
+            exact_mask = np.isin(rows, exact_dups, assume_unique=True)
+            near_mask = np.isin(rows, near_dups, assume_unique=True)
+            reports.append(_report(_years(chunk, kind), exact_mask, near_mask))
+            chunk[~(exact_mask | near_mask)].to_csv(sink, sep=sep, index=False, header=i == 0)
+            offset += len(chunk)
+    report = pd.concat(reports).groupby("year", dropna=False).sum().reset_index()
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Remove exact and near duplicate GBIF / BirdCLEF records")
+    parser.add_argument("source", type=Path)
+    parser.add_argument("destination", type=Path)
+    parser.add_argument("--kind", choices=sorted(KEY_COLUMNS), default="gbif")
+    parser.add_argument("--chunksize", type=int, default=1_000_000)
+    parser.add_argument("--partitions", type=int, default=64, help="spill partitions on disk")
+    args = parser.parse_args(argv)
+
+    report = deduplicate_file(args.source, args.destination, args.kind, chunksize=args.chunksize,
+                              partitions=args.partitions)
+    removed = int(report["exact_duplicates"].sum() + report["near_duplicates"].sum())
+    print(f"✅ {int(report['records'].sum())} records → {int(report['kept'].sum())} kept ({removed} duplicates removed)")
+    print(report.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Downsampling for long time-series charts
+A line chart cannot show more points than its axes have pixels, so before a
+series reaches matplotlib it is reduced to about one point per pixel column.
+Largest-Triangle-Three-Buckets (LTTB) keeps the points that shape the line
+(peaks, troughs, turns); min/max per bucket keeps the exact extremes of every
+bucket. Both run over all series of a chart at once: the series are laid out
+as one (series × x) panel and every bucket is a single array operation, so
+render time depends on the chart width, not on the series length.
+"""
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_POINTS = 1000  # roughly the plot area of a 12-inch figure at 100 dpi
+MIN_POINTS = 3  # LTTB keeps the first and last point plus at least one bucket
+
+
+def pixel_width(ax):
+    """Width of a matplotlib axes in pixels at its figure's dpi"""
+    return max(int(ax.get_position().width * ax.figure.get_figwidth() * ax.figure.dpi), MIN_POINTS)
+
+
+def _valid_ends(valid):
+    n = valid.shape[1]
+    first = np.argmax(valid, axis=1)
+    last = n - 1 - np.argmax(valid[:, ::-1], axis=1)
+    return first, last
+
+
+def lttb_indices(x, Y, n_out):
+    """Column indices LTTB keeps in every row of Y (n_series × n) over the shared, sorted x
+
+    NaN marks a missing point (series need not cover the whole x grid).
+    Returns an (n_series, n_out) array; -1 where a series has no point to keep.
+    """
+    x = np.asarray(x, np.float64)
+    Y = np.asarray(Y, np.float64)
+    n_series, n = Y.shape
+    n_out = max(int(n_out), MIN_POINTS)
+    if n <= n_out:
+        return np.where(np.isnan(Y), -1, np.arange(n))
+
+    valid = ~np.isnan(Y)
+    rows = np.arange(n_series)
+    first, last = _valid_ends(valid)
+    kept = np.full((n_series, n_out), -1)
+    kept[:, 0], kept[:, -1] = first, last
+
+    # n_out - 2 buckets over the interior points; the end points are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    prev_x, prev_y = x[first], Y[rows, first]
+    last_x, last_y = x[last], Y[rows, last]
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        if b + 1 < n_out - 2:
+            # Average of the next bucket (of its present points) is the triangle's third corner
+            nlo, nhi = edges[b + 1], edges[b + 2]
+            present = valid[:, nlo:nhi]
+            count = present.sum(axis=1)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                avg_x = np.where(present, x[nlo:nhi], 0.0).sum(axis=1) / count
+                avg_y = np.where(present, Y[:, nlo:nhi], 0.0).sum(axis=1) / count
+            empty = count == 0
+            avg_x[empty], avg_y[empty] = last_x[empty], last_y[empty]
+        else:
+            avg_x, avg_y = last_x, last_y
+
+        bucket_x, bucket_y = x[lo:hi], Y[:, lo:hi]
+        area = np.abs((prev_x - avg_x)[:, None] * (bucket_y - prev_y[:, None])
+                      - (prev_x[:, None] - bucket_x) * (avg_y - prev_y)[:, None])
+        area = np.where(valid[:, lo:hi] & (np.arange(lo, hi) > first[:, None]) & (np.arange(lo, hi) < last[:, None]),
+                        area, -1.0)
+        best = np.argmax(area, axis=1)
+        found = area[rows, best] >= 0
+        choice = lo + best
+        kept[found, b + 1] = choice[found]
+        prev_x = np.where(found, x[choice], prev_x)
+        prev_y = np.where(found, Y[rows, choice], prev_y)
+
+    kept[~valid.any(axis=1)] = -1
+    return kept
+
+
+def minmax_indices(x, Y, n_out):
+    """Column indices of the minimum and maximum of every bucket (n_out // 2 buckets) per row of Y
+
+    Keeps every local extreme at bucket resolution; x only fixes the order.
+    Returns an (n_series, 2 * buckets + 2) array including the end points, -1 where absent.
+    """
+    Y = np.asarray(Y, np.float64)
+    n_series, n = Y.shape
+    n_out = max(int(n_out), MIN_POINTS)
+    if n <= n_out:
+        return np.where(np.isnan(Y), -1, np.arange(n))
+
+    buckets = max(n_out // 2 - 1, 1)
+    size = -(-n // buckets)
+    padded = np.full((n_series, buckets * size), np.nan)
+    padded[:, :n] = Y
+    padded = padded.reshape(n_series, buckets, size)
+    valid = ~np.isnan(padded)
+    offsets = np.arange(buckets)[None, :] * size
+    low = np.argmin(np.where(valid, padded, np.inf), axis=2) + offsets
+    high = np.argmax(np.where(valid, padded, -np.inf), axis=2) + offsets
+    present = valid.any(axis=2)
+    first, last = _valid_ends(~np.isnan(Y))
+    kept = np.concatenate([first[:, None], np.where(present, low, -1), np.where(present, high, -1), last[:, None]], axis=1)
+    kept[np.isnan(Y).all(axis=1)] = -1
+    return kept
+
+
+METHODS = {"lttb": lttb_indices, "minmax": minmax_indices}
+
+
+def _x_values(values):
+    values = np.asarray(values)
+    if values.dtype.kind == "M":
+        values = values.astype("datetime64[ns]").astype(np.int64)
+    return values.astype(np.float64)
+
+
+def downsample_frame(frame, x, columns, by=None, max_points=DEFAULT_POINTS, method="lttb"):
+    """Rows of `frame` a line chart of `columns` against `x` (one line per `by` group) needs
+
+    Every (group, column) series is reduced to max_points / len(columns)
+    points and the union of the kept rows is returned in the frame's order,
+    so all columns plotted from the result stay aligned. Frames whose series
+    already fit are returned unchanged.
+    """
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    budget = max(int(max_points) // len(columns), MIN_POINTS)
+    if by is None:
+        groups, n_groups = np.zeros(len(frame), np.int64), 1
+    else:
+        groups, labels = pd.factorize(frame[by], sort=False)
+        n_groups = len(labels)
+    if len(frame) == 0 or np.bincount(groups[groups >= 0], minlength=1).max() <= budget:
+        return frame
+
+    # (group, x) panel: every series lives on the sorted union of x values
+    x_codes, x_values = pd.factorize(frame[x], sort=True)
+    rows = np.full((n_groups, len(x_values)), -1)
+    present = (groups >= 0) & (x_codes >= 0)
+    rows[groups[present], x_codes[present]] = np.flatnonzero(present)
+    panel = np.full((len(columns) * n_groups, len(x_values)), np.nan)
+    for k, column in enumerate(columns):
+        panel[k * n_groups + groups[present], x_codes[present]] = frame[column].to_numpy(np.float64, na_value=np.nan)[present]
+
+    kept = METHODS[method](_x_values(x_values), panel, budget)
+    series_group = np.tile(np.arange(n_groups), len(columns))[:, None]
+    kept_rows = np.where(kept >= 0, rows[series_group, np.maximum(kept, 0)], -1)
+    return frame.iloc[np.unique(kept_rows[kept_rows >= 0])]
@@ -0,0 +1,419 @@
+"""
+Headless static export of the dashboard
+Every section of app.py is rendered without a browser by Streamlit's AppTest
+runner. The main-area elements (text, metrics, tables, alerts) become HTML and
+every matplotlib figure is saved as PNG or SVG. Sections and their region
+selections are spread across a process pool. Each region selection gets its
+own page.
+
+Each section's data version (the tables and artefacts it reads plus the
+source of the page and every ecofusion module it imports) is stored in the
+site manifest. A re-export only re-renders the sections whose version changed
+or whose last render raised. Serving the site is plain static files.
+
+Usage:
+    python -m ecofusion.export site/ --jobs 4
+    ECOFUSION_DATA_ROOT=/tmp/ecofusion_synth python -m ecofusion.export /tmp/site --format svg --force
+"""
+
+import argparse
+import ast
+import functools
+import hashlib
+import html
+import json
+import os
+import re
+import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from ecofusion import store
+from ecofusion.boundaries import NATURALEARTH
+from ecofusion.pages import NAVIGATION, PAGES
+from ecofusion.partitioned import COMMIT_MARKER, DATASET_DIR
+from ecofusion.sketch import SKETCH_PATH
+from ecofusion.spatial import GRID_DIR
+from ecofusion.species import MATRIX_DIR
+
+APP_PATH = store.REPO_ROOT / "app.py"
+MANIFEST = "manifest.json"
+RENDER_TIMEOUT = 300  # seconds per AppTest run
+MAX_TABLE_ROWS = 500
+
+# What each section reads: registered store tables, plus other artefacts relative to the data root
+# (absolute paths for sources shipped with the repo)
+SECTION_INPUTS = {
+    "🏠 Overview": (["fusion", "audio_species", "gbif"], []),
+    "📈 Biodiversity Trends": (["fusion", "gbif"], [f"{DATASET_DIR}/gbif_region_yearly/{COMMIT_MARKER}",
+                                                  f"{MATRIX_DIR}/meta.json"]),
+    "🚨 Early Warning System": (["fusion", "ndvi"], [f"{GRID_DIR}/grid.json"]),
+    "🤖 ML Model Insights": (["model_results", "feature_importance"], []),
+    "🛰️ NDVI Regional Analysis": (["ndvi"], [SKETCH_PATH]),
+    "🗺️ Spatial Hotspots": (["fusion"], [f"{GRID_DIR}/grid.json",
+                                        *(NATURALEARTH.with_suffix(ext) for ext in (".shp", ".shx", ".dbf"))]),
+}
+
+# Region selectors: every option gets its own page (other widgets keep their defaults)
+SELECTIONS = {
+    "📈 Biodiversity Trends": [("selectbox", "NDVI region"), ("selectbox", "Region")],
+    "🛰️ NDVI Regional Analysis": [("multiselect", "Select regions to analyze:")],
+}
+
+
+def slugify(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-") or "page"
+
+
+def section_slug(section):
+    return PAGES[section].rsplit(".", 1)[-1]
+
+
+def _stat(path):
+    try:
+        stat = path.stat()
+        return stat.st_size, stat.st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _module_path(module):
+    path = store.REPO_ROOT / module.replace(".", "/")
+    for candidate in (path.with_suffix(".py"), path / "__init__.py"):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def code_sources(*paths):
+    """The given source files plus every ecofusion module they import, transitively
+
+    Function-level (lazy) imports count too, so the data loaders and analytics
+    a page reaches through ecofusion.data are part of its fingerprint.
+    """
+    pending, sources = list(paths), {}
+    while pending:
+        path = pending.pop()
+        if path is None or path in sources:
+            continue
+        sources[path] = None
+        modules = []
+        for node in ast.walk(ast.parse(path.read_bytes())):
+            if isinstance(node, ast.Import):
+                modules += [alias.name for alias in node.names if alias.name.startswith("ecofusion.")]
+            elif isinstance(node, ast.ImportFrom) and node.module == "ecofusion":
+                modules += [f"ecofusion.{alias.name}" for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and (node.module or "").startswith("ecofusion."):
+                modules.append(node.module)
+        pending += [_module_path(module) for module in modules]
+    return tuple(sorted(sources))
+
+
+def section_version(section):
+    """Fingerprint of everything a section's pages depend on: its inputs and the code that reads and renders them"""
+    tables, artefacts = SECTION_INPUTS.get(section, (list(store.TABLES), []))
+    entries = [(name, _stat(store.DATA_ROOT / store.TABLES[name][0])) for name in tables]
+    entries += [(str(name), _stat(store.DATA_ROOT / name)) for name in artefacts]
+    digest = hashlib.sha1(json.dumps(entries).encode())
+    for path in (*code_sources(APP_PATH, _module_path(PAGES[section])), Path(__file__)):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+# --------------------------------------------------
+# Element tree → HTML
+# --------------------------------------------------
+def _inline(text):
+    text = html.escape(text, quote=False)
+    text = re.sub(r"\[([^\]]+)\]\(([^)\s]+)\)", r'<a href="\2">\1</a>', text)
+    text = re.sub(r"`([^`]+)`", r"<code>\1</code>", text)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    return re.sub(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?!\w)", r"<em>\1</em>", text)
+
+
+def markdown_to_html(text):
+    """The markdown subset the pages use: headings, rules, bullet/numbered lists, emphasis, code, links"""
+    out, paragraph, list_tag = [], [], None
+
+    def flush():
+        nonlocal list_tag
+        if paragraph:
+            out.append(f"<p>{'<br>'.join(_inline(line) for line in paragraph)}</p>")
+            paragraph.clear()
+        if list_tag:
+            out.append(f"</{list_tag}>")
+            list_tag = None
+
+    for line in textwrap.dedent(text).strip("\n").splitlines():
+        stripped = line.strip()
+        heading = re.match(r"(#{1,6})\s+(.*)", stripped)
+        item = re.match(r"(?:[-*•]|(\d+)\.)\s+(.*)", stripped)
+        if not stripped:
+            flush()
+        elif re.fullmatch(r"-{3,}|\*{3,}", stripped):
+            flush()
+            out.append("<hr>")
+        elif heading:
+            flush()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{_inline(heading.group(2))}</h{level}>")
+        elif item:
+            tag = "ol" if item.group(1) else "ul"
+            if paragraph or list_tag != tag:
+                flush()
+                start = int(item.group(1)) if item.group(1) else 1
+                out.append(f'<{tag} start="{start}">' if start != 1 else f"<{tag}>")
+                list_tag = tag
+            out.append(f"<li>{_inline(item.group(2))}</li>")
+        else:
+            if list_tag:
+                flush()
+            paragraph.append(stripped)
+    flush()
+    return "\n".join(out)
+
+
+def _table(frame):
+    note = ""
+    if len(frame) > MAX_TABLE_ROWS:
+        note = f'<p class="caption">First {MAX_TABLE_ROWS} of {len(frame)} rows</p>'
+        frame = frame.head(MAX_TABLE_ROWS)
+    return frame.to_html(classes="table", border=0, float_format=lambda v: f"{v:.4g}") + note
+
+
+def element_html(node, images):
+    """HTML for one AppTest node; images are the page's figure files in render order"""
+    kind = node.type
+    children = getattr(node, "children", None)
+    if isinstance(children, dict):
+        inner = "\n".join(element_html(child, images) for child in children.values())
+        label = getattr(node, "label", None)
+        if kind == "flex_container":
+            return f'<div class="row">{inner}</div>'
+        if kind in ("expander", "tab") and label:
+            return f"<details open><summary>{_inline(label)}</summary>{inner}</details>"
+        return f'<div class="{kind}">{inner}</div>'
+
+    value = getattr(node, "value", None)
+    if kind == "title":
+        return f"<h1>{_inline(value)}</h1>"
+    if kind == "header":
+        return f"<h2>{_inline(value)}</h2>"
+    if kind == "subheader":
+        return f"<h3>{_inline(value)}</h3>"
+    if kind == "markdown":
+        return markdown_to_html(value)
+    if kind == "caption":
+        return f'<p class="caption">{_inline(value)}</p>'
+    if kind in ("info", "success", "warning", "error"):
+        return f'<div class="alert {kind}">{markdown_to_html(value)}</div>'
+    if kind == "metric":
+        delta = f'<div class="delta">{_inline(node.delta)}</div>' if node.delta else ""
+        return (f'<div class="metric"><div class="label">{_inline(node.label)}</div>'
+                f'<div class="value">{html.escape(str(value))}</div>{delta}</div>')
+    if kind in ("dataframe", "table"):
+        return _table(value)
+    if kind == "image":
+        return f'<img src="{images.pop(0)}" alt="figure">' if images else ""
+    if kind in ("selectbox", "multiselect", "slider", "select_slider", "checkbox", "radio"):
+        shown = ", ".join(map(str, value)) if isinstance(value, (list, tuple)) else value
+        return f'<p class="widget">{_inline(node.label)}: <strong>{html.escape(str(shown))}</strong></p>'
+    if kind == "exception":
+        return f'<pre class="alert error">{html.escape(str(value))}</pre>'
+    return ""
+
+
+# --------------------------------------------------
+# Rendering (pool workers)
+# --------------------------------------------------
+def _widget(at, kind, label):
+    return next((widget for widget in getattr(at, kind) if widget.label == label), None)
+
+
+def render_page(section, slug, out_dir, image_format="png", selection=None):
+    """Render one section (optionally with one region selection) headless; returns body HTML and selector options"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    os.environ["ECOFUSION_CHARTS"] = "matplotlib"  # static pages embed figures, not browser-drawn charts
+    from streamlit.testing.v1 import AppTest
+
+    from ecofusion import layout
+
+    out_dir = Path(out_dir)
+    (out_dir / "img").mkdir(parents=True, exist_ok=True)
+    images = []
+
+    def keep(fig):
+        name = f"img/{slug}-{len(images)}.{image_format}"
+        fig.savefig(out_dir / name, format=image_format, dpi=100, bbox_inches="tight")
+        images.append(name)
+
+    start = time.perf_counter()
+    at = AppTest.from_file(str(APP_PATH), default_timeout=RENDER_TIMEOUT)
+    at.run()
+    at.sidebar.radio[0].set_value(section)
+    if selection:
+        at.run()
+        kind, label, value = selection
+        _widget(at, kind, label).set_value([value] if kind == "multiselect" else value)
+    layout.FIGURE_HOOKS.append(keep)
+    try:
+        at.run()
+    finally:
+        layout.FIGURE_HOOKS.remove(keep)
+
+    body = element_html(at.main, list(images))
+    options = {}
+    for kind, label in SELECTIONS.get(section, []) if selection is None else []:
+        widget = _widget(at, kind, label)
+        if widget is not None:
+            options[label] = (kind, [str(option) for option in widget.options])
+    return {"slug": slug, "body": body, "images": images, "options": options,
+            "errors": len(at.exception), "seconds": time.perf_counter() - start}
+
+# --------------------------------------------------
+# Site assembly
+# --------------------------------------------------
+STYLE = """
+body { font-family: system-ui, sans-serif; margin: 0; color: #262730; }
+nav { background: #f0f2f6; padding: .6rem 1rem; display: flex; flex-wrap: wrap; gap: 1rem; }
+nav a { text-decoration: none; color: #262730; } nav a.active { font-weight: bold; }
+main { max-width: 1200px; margin: 0 auto; padding: 1rem 2rem; }
+.row { display: flex; gap: 1.5rem; } .row > .column { flex: 1; min-width: 0; }
+.metric .label { font-size: .9rem; } .metric .value { font-size: 2rem; } .metric .delta { color: #09ab3b; }
+.alert { padding: .75rem 1rem; border-radius: .5rem; margin: .5rem 0; }
+.info { background: #e8f0fe; } .success { background: #e6f4ea; } .warning { background: #fff8e1; }
+.error { background: #fdecea; }
+.table { border-collapse: collapse; font-size: .85rem; } .table td, .table th { padding: .2rem .6rem; }
+img { max-width: 100%; } .caption, .widget { color: #6b6f7b; font-size: .9rem; }
+.variants { font-size: .9rem; } .variants a { margin-right: .6rem; }
+"""
+
+
+_ACTIVE = ' class="active"'
+
+
+def _document(title, nav, body):
+    return (f'<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8">'
+            f'<meta name="viewport" content="width=device-width, initial-scale=1">'
+            f"<title>{html.escape(title)} – EcoFusionAI</title><style>{STYLE}</style></head>\n"
+            f"<body>{nav}<main>{body}</main></body></html>\n")
+
+
+def _nav(active):
+    links = [f'<a href="{section_slug(s)}.html"{_ACTIVE if s == active else ""}>{html.escape(s)}</a>'
+             for s in NAVIGATION]
+    return f"<nav>{''.join(links)}</nav>"
+
+
+def _variant_menu(pages, active_slug):
+    """Links between a section's default page and its region pages, grouped by selector"""
+    groups = {}
+    for page in pages:
+        if page["label"]:
+            groups.setdefault(page["label"], []).append(page)
+    if not groups:
+        return ""
+    lines = [f'<p class="variants"><a href="{pages[0]["slug"]}.html">Default view</a></p>']
+    for label, members in groups.items():
+        links = "".join(f'<a href="{p["slug"]}.html"{_ACTIVE if p["slug"] == active_slug else ""}>'
+                        f'{html.escape(p["value"])}</a>' for p in members)
+        lines.append(f'<p class="variants">{html.escape(label)} {links}</p>')
+    return "\n".join(lines)
+
+
+def _write(path, text):
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def export_site(out_dir, jobs=None, image_format="png", force=False):
+    """Render every section (and region selection) whose data version changed; returns per-section stats"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    previous = manifest.get("sections", {}) if manifest.get("image_format") == image_format else {}
+
+    versions = {section: section_version(section) for section in NAVIGATION}
+    stale = [section for section in NAVIGATION if force or previous.get(section, {}).get("version") != versions[section]
+             or not all((out_dir / f"{page['slug']}.html").exists() for page in previous[section]["pages"])]
+    stats = {section: {"rendered": 0, "skipped": len(previous[section]["pages"])}
+             for section in NAVIGATION if section not in stale}
+
+    os.environ.setdefault("ECOFUSION_RELOAD_INTERVAL", "0")  # no watcher thread in the workers
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # Default view of every stale section first: it also lists the region selector options
+        defaults = {section: pool.submit(render_page, section, section_slug(section), out_dir, image_format)
+                    for section in stale}
+        variants = {}
+        for section, future in defaults.items():
+            result = future.result()
+            results[section] = [dict(result, label=None, value=None)]
+            for label, (kind, options) in result["options"].items():
+                for value in options:
+                    slug = f"{section_slug(section)}--{slugify(label)}--{slugify(value)}"
+                    variants[(section, slug, label, value)] = pool.submit(
+                        render_page, section, slug, out_dir, image_format, (kind, label, value))
+        for (section, _, label, value), future in variants.items():
+            results[section].append(dict(future.result(), label=label, value=value))
+
+    sections = {section: previous[section] for section in NAVIGATION if section not in stale}
+    for section, pages in results.items():
+        for page in pages:
+            body = _variant_menu(pages, page["slug"]) + page["body"]
+            title = section if page["value"] is None else f"{section} · {page['value']}"
+            _write(out_dir / f"{page['slug']}.html", _document(title, _nav(section), body))
+        # Pages and figures of selections that no longer exist
+        current = {page["slug"] for page in pages}
+        current_images = {image for page in pages for image in page["images"]}
+        for old in previous.get(section, {}).get("pages", []):
+            if old["slug"] not in current:
+                (out_dir / f"{old['slug']}.html").unlink(missing_ok=True)
+            for image in old.get("images", []):
+                if image not in current_images:
+                    (out_dir / image).unlink(missing_ok=True)
+        errors = sum(page["errors"] for page in pages)
+        sections[section] = {
+            # No version after a failed render, so the next export renders the section again
+            "version": None if errors else versions[section],
+            "pages": [{key: page[key] for key in ("slug", "label", "value", "images")} for page in pages],
+        }
+        stats[section] = {"rendered": len(pages), "skipped": 0, "errors": errors,
+                          "seconds": sum(page["seconds"] for page in pages)}
+
+    index = f'<meta http-equiv="refresh" content="0; url={section_slug(NAVIGATION[0])}.html">'
+    _write(out_dir / "index.html", _document("EcoFusionAI", _nav(None), index))
+    _write(manifest_path, json.dumps({"image_format": image_format, "sections": sections}, indent=2))
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every dashboard section to a static HTML site")
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--format", choices=["png", "svg"], default="png", help="figure format")
+    parser.add_argument("--force", action="store_true", help="re-render every section")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = export_site(args.out_dir, args.jobs, args.format, args.force)
+    for section, section_stats in stats.items():
+        if section_stats["rendered"]:
+            errors = f", ⚠️ {section_stats['errors']} errors" if section_stats["errors"] else ""
+            print(f"🖼️ {section}: {section_stats['rendered']} pages rendered "
+                  f"({section_stats['seconds']:.1f}s in workers{errors})")
+        else:
+            print(f"✅ {section}: unchanged ({section_stats['skipped']} pages kept)")
+    print(f"📦 Static site in {args.out_dir} ({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    # Pool workers must unpickle ecofusion.export.render_page, not __main__'s copy (AppTest swaps __main__)
+    from ecofusion.export import main as export_main
+
+    export_main()
@@ -0,0 +1,288 @@
+"""
+Materialized feature store
+Each model feature is defined once (inputs, lag/cross-section dependencies and
+a vectorized compute function) and materialized per (region, year) into a
+versioned Arrow table. A re-materialization fingerprints every row's inputs,
+including the lagged and same-year rows its features read, and recomputes
+only the rows whose fingerprint changed. Recomputed rows are appended under a
+new version number, so as_of(version) is a point-in-time correct view for
+training and latest() the identical view for serving.
+
+Usage:
+    python -m ecofusion.features build data/feature_inputs_WESTERN_GHATS.csv
+    python -m ecofusion.features show --as-of 2
+"""
+
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+import types
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from ecofusion.ndvi import NDVI_HEALTH_THRESHOLDS  # same health classes as the NDVI regional summary
+from ecofusion.store import PUBLISHED_MODE
+
+KEYS = ["region", "year"]
+FEATURE_STORE_PATH = "data/feature_store_WESTERN_GHATS.arrow"
+INPUTS_PATH = "data/feature_inputs_WESTERN_GHATS.csv"
+
+_DEFINITIONS_KEY = b"ecofusion.feature_definitions"
+
+
+@dataclass(frozen=True)
+class Feature:
+    """compute(frame) → one value per row; frame is keyed by (region, year) and holds every input column"""
+
+    name: str
+    inputs: tuple
+    compute: Callable
+    lags: int = 0  # also reads the same region's previous `lags` years
+    cross_section: bool = False  # also reads the other regions of the same year
+    description: str = ""
+
+
+FEATURES = {}
+
+
+def feature(name, inputs, lags=0, cross_section=False):
+    """Register a feature definition (decorator)"""
+    def register(compute):
+        FEATURES[name] = Feature(name, tuple(inputs), compute, lags, cross_section, (compute.__doc__ or "").strip())
+        return compute
+    return register
+
+
+def _lag_positions(frame, k):
+    """Row position of the same region k years earlier (-1 when that year is missing)"""
+    index = pd.MultiIndex.from_arrays([frame["region"], frame["year"]])
+    return index.get_indexer(pd.MultiIndex.from_arrays([frame["region"], frame["year"] - k]))
+
+
+def lagged(frame, column, k=1):
+    """frame[column] of the same region k years earlier (NaN when that year is missing)"""
+    positions = _lag_positions(frame, k)
+    values = frame[column].to_numpy(np.float64)[positions]
+    return np.where(positions >= 0, values, np.nan)
+
+# --------------------------------------------------
+# Feature definitions (models/ecofusion_features_v2.txt)
+# --------------------------------------------------
+@feature("ndvi_change", inputs=["ndvi_mean"], lags=1)
+def _ndvi_change(frame):
+    """Year-on-year change in regional mean NDVI"""
+    return frame["ndvi_mean"].to_numpy() - lagged(frame, "ndvi_mean")
+
+
+@feature("ndvi_severity", inputs=["ndvi_mean"])
+def _ndvi_severity(frame):
+    """Vegetation stress class: 0 excellent, 1 good, 2 moderate, 3 poor (NaN without NDVI)"""
+    ndvi = frame["ndvi_mean"].to_numpy(np.float64)
+    severity = np.select([ndvi > t for t in NDVI_HEALTH_THRESHOLDS], [0.0, 1.0, 2.0], default=3.0)
+    return np.where(np.isnan(ndvi), np.nan, severity)
+
+
+@feature("obs_per_species", inputs=["occurrences", "species_richness"])
+def _obs_per_species(frame):
+    """GBIF occurrences per recorded species (sampling depth)"""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(frame["species_richness"] > 0, frame["occurrences"] / frame["species_richness"], np.nan)
+
+
+@feature("bird_presence_norm", inputs=["bird_recordings"], cross_section=True)
+def _bird_presence_norm(frame):
+    """BirdCLEF recordings relative to the best-recorded region that year"""
+    best = frame.groupby("year")["bird_recordings"].transform("max").to_numpy(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(best > 0, frame["bird_recordings"] / best, 0.0)
+
+
+@feature("inat_obs_total", inputs=["inat_occurrences"])
+def _inat_obs_total(frame):
+    """iNaturalist research-grade observations (GBIF records published by iNaturalist)"""
+    return frame["inat_occurrences"].to_numpy(np.float64)
+
+
+@feature("inat_species_richness", inputs=["inat_species"])
+def _inat_species_richness(frame):
+    """Distinct species among the iNaturalist observations"""
+    return frame["inat_species"].to_numpy(np.float64)
+
+
+_CONSTANT_TYPES = (bool, int, float, complex, str, bytes, tuple, frozenset, list, dict, type(None))
+
+
+def _hash_code(digest, code, namespace, seen):
+    """Feed bytecode, literals and the referenced module-level constants/helpers of `code` into digest"""
+    if code in seen:
+        return
+    seen.add(code)
+    digest.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(digest, const, namespace, seen)  # comprehensions, lambdas, nested functions
+        else:
+            digest.update(repr(const).encode())
+    for name in code.co_names:
+        value = namespace.get(name)
+        if isinstance(value, types.FunctionType):
+            _hash_code(digest, value.__code__, value.__globals__, seen)
+        elif isinstance(value, _CONSTANT_TYPES):
+            digest.update(repr((name, value)).encode())
+
+
+def definitions_hash(names=None):
+    """Fingerprint of the feature definitions; any change invalidates every materialized row"""
+    digest = hashlib.sha1()
+    seen = set()
+    for name in sorted(names or FEATURES):
+        definition = FEATURES[name]
+        digest.update(repr((name, definition.inputs, definition.lags, definition.cross_section)).encode())
+        _hash_code(digest, definition.compute.__code__, definition.compute.__globals__, seen)
+    return digest.hexdigest()[:12]
+
+# --------------------------------------------------
+# Incremental materialization
+# --------------------------------------------------
+def row_fingerprints(inputs, names=None):
+    """uint64 per row over its own inputs, its lagged rows and (if needed) its year's cross-section"""
+    definitions = [FEATURES[name] for name in (names or FEATURES)]
+    columns = sorted({column for definition in definitions for column in definition.inputs})
+    own = pd.util.hash_pandas_object(inputs[KEYS + columns], index=False).to_numpy()
+    fingerprint = own.copy()
+    with np.errstate(over="ignore"):  # uint64 arithmetic wraps around by design
+        for k in range(1, max(d.lags for d in definitions) + 1):
+            positions = _lag_positions(inputs, k)
+            previous = np.where(positions >= 0, own[positions], np.uint64(0))
+            fingerprint = fingerprint * np.uint64(1_000_003) + previous
+        if any(d.cross_section for d in definitions):
+            codes, _ = pd.factorize(inputs["year"])
+            year_hash = np.zeros(codes.max() + 1, np.uint64)
+            np.add.at(year_hash, codes, own)  # order-independent sum of the year's row hashes
+            fingerprint = fingerprint * np.uint64(1_000_003) + year_hash[codes]
+    return fingerprint
+
+
+def compute_features(inputs, names=None):
+    """Evaluate feature definitions over an input frame (one row per region-year)"""
+    return pd.DataFrame({name: np.asarray(FEATURES[name].compute(inputs), np.float64)
+                         for name in (names or FEATURES)}, index=inputs.index)
+
+
+def _context(inputs, changed, names):
+    """Rows the changed rows' features read: themselves, their lags and their years' cross-sections"""
+    definitions = [FEATURES[name] for name in names]
+    keep = changed.copy()
+    years = inputs["year"].to_numpy()
+    for k in range(1, max(d.lags for d in definitions) + 1):
+        wanted = pd.MultiIndex.from_arrays([inputs["region"][changed], years[changed] - k])
+        keep |= pd.MultiIndex.from_arrays([inputs["region"], years]).isin(wanted)
+    if any(d.cross_section for d in definitions):
+        keep |= np.isin(years, years[changed])
+    return keep
+
+
+class FeatureStore:
+    """Append-only (region, year) feature table; every row carries the version that materialized it"""
+
+    def __init__(self, path=FEATURE_STORE_PATH, names=None):
+        self.path = Path(path)
+        self.names = list(names or FEATURES)
+        self.table, self.stale = self._read()
+
+    def _read(self):
+        empty = pd.DataFrame({"region": pd.Series(dtype=object), "year": pd.Series(dtype=np.int64),
+                              **{name: pd.Series(dtype=np.float64) for name in self.names},
+                              "_fingerprint": pd.Series(dtype=np.uint64), "_version": pd.Series(dtype=np.int64),
+                              "_materialized_at": pd.Series(dtype=np.float64)})
+        if not self.path.exists():
+            return empty, False
+        with pa.memory_map(str(self.path), "r") as source:
+            table = ipc.open_file(source).read_all()
+        # Changed definitions keep the history (as_of still answers what was served) but invalidate every row
+        stale = (table.schema.metadata or {}).get(_DEFINITIONS_KEY, b"").decode() != definitions_hash(self.names)
+        return table.to_pandas(), stale
+
+    @property
+    def version(self):
+        return int(self.table["_version"].max()) if len(self.table) else 0
+
+    def latest(self, names=None):
+        """Serving view: current feature values per (region, year)"""
+        return self.as_of(None, names)
+
+    def as_of(self, version=None, names=None):
+        """Point-in-time view: each (region, year) as materialized at or before `version`"""
+        rows = self.table if version is None else self.table[self.table["_version"] <= version]
+        current = rows.sort_values("_version", kind="stable").drop_duplicates(KEYS, keep="last")
+        return current.sort_values(KEYS).reindex(columns=KEYS + list(names or self.names)).reset_index(drop=True)
+
+    def materialize(self, inputs):
+        """Recompute rows whose fingerprint changed and append them as a new version; returns stats"""
+        inputs = inputs.sort_values(KEYS).reset_index(drop=True)
+        fingerprints = row_fingerprints(inputs, self.names)
+        latest = self.table.sort_values("_version", kind="stable").drop_duplicates(KEYS, keep="last")
+        positions = pd.MultiIndex.from_frame(latest[KEYS]).get_indexer(pd.MultiIndex.from_frame(inputs[KEYS]))
+        stored = latest["_fingerprint"].to_numpy(np.uint64)
+        if self.stale or not len(stored):
+            changed = np.ones(len(inputs), bool)
+        else:
+            changed = (positions < 0) | (stored[np.maximum(positions, 0)] != fingerprints)
+
+        stats = {"version": self.version, "recomputed": int(changed.sum()), "unchanged": int((~changed).sum())}
+        if not changed.any():
+            return stats
+
+        context = _context(inputs, changed, self.names)
+        values = compute_features(inputs[context], self.names).loc[np.flatnonzero(changed)]
+        rows = inputs.loc[changed, KEYS].assign(**values, _fingerprint=fingerprints[changed],
+                                                _version=self.version + 1, _materialized_at=time.time())
+        self.table = rows if self.table.empty else pd.concat([self.table, rows], ignore_index=True)
+        self.stale = False
+        self._write()
+        stats["version"] = self.version
+        return stats
+
+    def _write(self):
+        table = pa.Table.from_pandas(self.table, preserve_index=False)
+        table = table.replace_schema_metadata({_DEFINITIONS_KEY: definitions_hash(self.names).encode()})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=self.path.parent)
+        try:
+            with os.fdopen(fd, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            os.chmod(tmp_name, PUBLISHED_MODE)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Materialize or inspect the (region, year) feature store")
+    parser.add_argument("command", choices=["build", "show"])
+    parser.add_argument("inputs", type=Path, nargs="?", default=Path(INPUTS_PATH))
+    parser.add_argument("--store", type=Path, default=Path(FEATURE_STORE_PATH))
+    parser.add_argument("--as-of", type=int, help="version to show (default: latest)")
+    args = parser.parse_args(argv)
+
+    store = FeatureStore(args.store)
+    if args.command == "build":
+        stats = store.materialize(pd.read_csv(args.inputs))
+        print(f"✅ Feature store version {stats['version']}: "
+              f"{stats['recomputed']} rows recomputed, {stats['unchanged']} unchanged")
+    else:
+        print(f"📦 {args.store} (latest version {store.version})")
+        print(store.as_of(args.as_of).round(4).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
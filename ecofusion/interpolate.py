@@ -0,0 +1,274 @@
+"""
+Spatial interpolation of point NDVI samples onto the grid
+Notebook 1 samples random points in each region and keeps only their mean and
+std, so every within-region detail is lost and cells outside the sampled
+regions get no NDVI at all. This module keeps the per-point samples
+(lat, lon, year, ndvi) and interpolates each year onto the centres of a
+spatial grid's cells:
+
+- idw: inverse-distance weighted mean of the k nearest samples (1 / d^power)
+- kriging: ordinary kriging over the same k neighbours with an exponential or
+  spherical variogram fitted to each year's samples; also returns the kriging
+  variance of every cell
+
+Neighbours come from one KD-tree per year on equirectangular km coordinates
+(distortion stays within a few percent across the Western Ghats). Cell
+centres are split into tiles whose neighbour queries and weight solves are
+batched numpy operations; tiles of all years run on a thread pool, since the
+KD-tree queries and batched solves release the GIL.
+
+The surface is written into a grid store as `ndvi_interpolated.npy` (cells ×
+years, same layout as the binned arrays), so it joins with the gridded
+occurrences by cell ID and the dashboard reads it in place of the binned
+NDVI means.
+
+Usage:
+    python -m ecofusion.interpolate ndvi_point_samples.csv data/spatial_grid_WESTERN_GHATS --method kriging
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import curve_fit
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import pdist
+
+from ecofusion.pipeline import GBIF_YEARS
+from ecofusion.spatial import GRID_DIR, make_grid
+
+METHODS = ("idw", "kriging")
+VARIOGRAM_MODELS = ("exponential", "spherical")
+SURFACE_FILE = "ndvi_interpolated.npy"
+VARIANCE_FILE = "ndvi_kriging_variance.npy"
+KM_PER_DEG_LAT = 110.57
+KM_PER_DEG_LON = 111.32
+
+
+def project(lat, lon, lat0):
+    """(n, 2) equirectangular km coordinates around latitude lat0"""
+    lat, lon = np.asarray(lat, np.float64), np.asarray(lon, np.float64)
+    return np.column_stack([lon * KM_PER_DEG_LON * math.cos(math.radians(lat0)), lat * KM_PER_DEG_LAT])
+
+# --------------------------------------------------
+# Variograms
+# --------------------------------------------------
+@dataclass(frozen=True)
+class Variogram:
+    """Semivariance as a function of distance (km): nugget + sill × model(h / range)"""
+
+    nugget: float
+    sill: float
+    range_km: float
+    model: str = "exponential"
+
+    def __call__(self, h):
+        h = np.asarray(h, np.float64) / self.range_km
+        if self.model == "exponential":
+            shape = 1 - np.exp(-3 * h)  # practical range: 95% of the sill
+        else:
+            shape = np.where(h < 1, 1.5 * h - 0.5 * h ** 3, 1.0)
+        return np.where(h > 0, self.nugget + self.sill * shape, 0.0)
+
+    def covariance(self, h):
+        return self.nugget + self.sill - self(h)
+
+
+def fit_variogram(xy, values, model="exponential", n_lags=12, max_points=2000, seed=0):
+    """Weighted least-squares fit of a variogram model to the empirical semivariogram
+
+    Lags run to half the largest sample distance; pairs are taken from at most
+    `max_points` samples. Falls back to a pure sill at a third of the lag
+    range when the fit does not converge (e.g. too few samples).
+    """
+    if model not in VARIOGRAM_MODELS:
+        raise ValueError(f"model must be one of {VARIOGRAM_MODELS}")
+    if len(values) > max_points:
+        keep = np.random.default_rng(seed).choice(len(values), max_points, replace=False)
+        xy, values = xy[keep], values[keep]
+    variance = float(np.var(values)) if len(values) else 0.0
+    distances = pdist(xy) if len(values) > 1 else np.empty(0)
+    max_lag = distances.max() / 2 if len(distances) and distances.max() > 0 else 1.0
+    fallback = Variogram(0.0, variance, max_lag / 3, model)
+    if len(values) < 4 or variance == 0:
+        return fallback
+
+    semivariance = 0.5 * pdist(values[:, None], "sqeuclidean")
+    lag = np.minimum((distances / max_lag * n_lags).astype(np.int64), n_lags)
+    counts = np.bincount(lag, minlength=n_lags + 1)[:n_lags]
+    sums = np.bincount(lag, weights=semivariance, minlength=n_lags + 1)[:n_lags]
+    used = counts > 0
+    centres = (np.arange(n_lags) + 0.5) * max_lag / n_lags
+    if used.sum() < 3:
+        return fallback
+    try:
+        (nugget, sill, range_km), _ = curve_fit(
+            lambda h, nugget, sill, range_km: Variogram(nugget, sill, range_km, model)(h),
+            centres[used], sums[used] / counts[used], p0=[0.1 * variance, variance, max_lag / 3],
+            sigma=1 / np.sqrt(counts[used]), bounds=([0, 0, 1e-6], [np.inf, np.inf, np.inf]),
+        )
+    except (RuntimeError, ValueError):
+        return fallback
+    return Variogram(float(nugget), float(sill), float(range_km), model)
+
+# --------------------------------------------------
+# Batched weights for one tile of targets
+# --------------------------------------------------
+def idw_estimate(distances, neighbour_values, power=2.0):
+    """Inverse-distance weighted means; a sample on the target wins outright, inf distances weigh nothing"""
+    with np.errstate(divide="ignore"):
+        weights = 1.0 / distances ** power
+    exact = distances == 0
+    weights = np.where(exact.any(axis=1, keepdims=True), exact, weights)
+    weights = np.where(np.isfinite(distances), weights, 0.0)
+    total = weights.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total > 0, (weights * neighbour_values).sum(axis=1) / total, np.nan)
+
+
+def kriging_estimate(neighbour_xy, distances, neighbour_values, variogram):
+    """Ordinary kriging estimate and variance from each target's k neighbours (one batched solve)
+
+    Missing neighbours (inf distance) get an identity row, so their weight
+    solves to zero; a small jitter keeps co-located samples solvable.
+    """
+    n, k = distances.shape
+    valid = np.isfinite(distances)
+    empty = ~valid.any(axis=1)
+    valid[empty, 0] = True  # solvable placeholder, masked out below
+
+    pair = np.sqrt(((neighbour_xy[:, :, None, :] - neighbour_xy[:, None, :, :]) ** 2).sum(axis=-1))
+    total = max(variogram.nugget + variogram.sill, 1e-12)
+    both = valid[:, :, None] & valid[:, None, :]
+    system = np.zeros((n, k + 1, k + 1))
+    diagonal = np.eye(k) * np.where(valid, 1e-9 * total, 1.0)[:, None, :]
+    system[:, :k, :k] = np.where(both, variogram.covariance(pair), 0.0) + diagonal
+    system[:, :k, k] = system[:, k, :k] = valid
+    rhs = np.zeros((n, k + 1))
+    rhs[:, :k] = np.where(valid, variogram.covariance(np.where(valid, distances, 0.0)), 0.0)
+    rhs[:, k] = 1.0
+
+    solution = np.linalg.solve(system, rhs[:, :, None])[:, :, 0]
+    weights, multiplier = solution[:, :k], solution[:, k]
+    estimate = (weights * np.where(valid, neighbour_values, 0.0)).sum(axis=1)
+    variance = np.maximum(total - (weights * rhs[:, :k]).sum(axis=1) - multiplier, 0.0)
+    return np.where(empty, np.nan, estimate), np.where(empty, np.nan, variance)
+
+
+def _interpolate_tile(tree, xy, values, targets, method, k, power, max_distance_km, variogram):
+    distances, neighbours = tree.query(targets, k=k, distance_upper_bound=max_distance_km or np.inf)
+    distances, neighbours = distances.reshape(len(targets), k), neighbours.reshape(len(targets), k)
+    # Missing neighbours come back as index n: pad so they can be gathered, then masked by their inf distance
+    neighbour_values = np.append(values, 0.0)[neighbours]
+    if method == "idw":
+        return idw_estimate(distances, neighbour_values, power), None
+    neighbour_xy = np.vstack([xy, np.zeros((1, 2))])[neighbours]
+    return kriging_estimate(neighbour_xy, distances, neighbour_values, variogram)
+
+# --------------------------------------------------
+# Whole-grid surfaces
+# --------------------------------------------------
+def interpolate_grid(samples, grid, years=GBIF_YEARS, method="idw", k=12, power=2.0, max_distance_km=None,
+                     variogram_model="exponential", tile_size=4096, workers=None):
+    """Interpolate point samples onto every cell centre of `grid` for each year
+
+    `samples` has lat, lon, year and ndvi columns. Returns (values, variance)
+    as cells × years float32 arrays; variance is None for idw. Years without
+    samples, and cells with no sample within `max_distance_km`, are NaN.
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}")
+    first_year, last_year = years
+    n_years = last_year - first_year + 1
+    lat, lon = grid.cell_centers()
+    lat0 = (grid.lat_min + grid.lat_max) / 2
+    targets = project(lat, lon, lat0)
+    values = np.full((grid.n_cells, n_years), np.nan, np.float32)
+    variance = np.full((grid.n_cells, n_years), np.nan, np.float32) if method == "kriging" else None
+
+    samples = samples.dropna(subset=["lat", "lon", "year", "ndvi"])
+    samples = samples[samples["year"].between(first_year, last_year)]
+    tiles = [slice(start, start + tile_size) for start in range(0, grid.n_cells, tile_size)]
+    jobs = []
+    for year, points in samples.groupby(samples["year"].astype(int)):
+        xy = project(points["lat"], points["lon"], lat0)
+        ndvi = points["ndvi"].to_numpy(np.float64)
+        tree = cKDTree(xy)
+        variogram = fit_variogram(xy, ndvi, variogram_model) if method == "kriging" else None
+        jobs += [(year - first_year, tile, (tree, xy, ndvi, targets[tile], method, min(k, len(ndvi)), power,
+                                            max_distance_km, variogram)) for tile in tiles]
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [(column, tile, pool.submit(_interpolate_tile, *args)) for column, tile, args in jobs]
+        for column, tile, future in futures:
+            estimate, error = future.result()
+            values[tile, column] = estimate
+            if variance is not None:
+                variance[tile, column] = error
+    return values, variance
+
+
+def save_surface(directory, values, variance=None, **params):
+    """Write a surface into a grid store next to its binned arrays; params are recorded in grid.json"""
+    directory = Path(directory)
+    meta = json.loads((directory / "grid.json").read_text())
+    first, last = meta["years"]
+    expected = (make_grid(**meta["grid"]).n_cells, last - first + 1)
+    if values.shape != expected:
+        raise ValueError(f"surface shape {values.shape} does not match the grid store {expected}")
+    np.save(directory / SURFACE_FILE, values.astype(np.float32))
+    if variance is None:
+        (directory / VARIANCE_FILE).unlink(missing_ok=True)
+    else:
+        np.save(directory / VARIANCE_FILE, variance.astype(np.float32))
+    # Rewriting grid.json also bumps its mtime, which the dashboard keys its cached store on
+    meta["surface"] = params
+    (directory / "grid.json").write_text(json.dumps(meta, indent=2))
+    return directory
+
+
+def interpolate_store(directory, samples, method="idw", **options):
+    """Interpolate samples onto a saved grid store's grid and years, then save the surface into it"""
+    directory = Path(directory)
+    meta = json.loads((directory / "grid.json").read_text())
+    values, variance = interpolate_grid(samples, make_grid(**meta["grid"]), tuple(meta["years"]), method, **options)
+    save_surface(directory, values, variance, method=method, samples=int(len(samples)),
+                 **{key: value for key, value in options.items() if key not in ("tile_size", "workers")})
+    return values, variance
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Interpolate point NDVI samples onto a spatial grid store")
+    parser.add_argument("samples", type=Path, help="CSV of point samples with lat, lon, year and ndvi columns")
+    parser.add_argument("store", type=Path, nargs="?", default=Path(GRID_DIR), help="grid store directory")
+    parser.add_argument("--method", choices=METHODS, default="idw")
+    parser.add_argument("--k", type=int, default=12, help="nearest samples per cell")
+    parser.add_argument("--power", type=float, default=2.0, help="IDW distance exponent")
+    parser.add_argument("--max-distance-km", type=float, help="leave cells without a sample this close empty")
+    parser.add_argument("--variogram", choices=VARIOGRAM_MODELS, default="exponential")
+    parser.add_argument("--workers", type=int, help="threads (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    samples = pd.read_csv(args.samples, usecols=["lat", "lon", "year", "ndvi"])
+    start = time.perf_counter()
+    options = dict(k=args.k, max_distance_km=args.max_distance_km, workers=args.workers)
+    if args.method == "idw":
+        options["power"] = args.power
+    else:
+        options["variogram_model"] = args.variogram
+    values, _ = interpolate_store(args.store, samples, args.method, **options)
+    seconds = time.perf_counter() - start
+    filled = int(np.isfinite(values).any(axis=1).sum())
+    print(f"✅ {args.method} NDVI surface from {len(samples)} samples: {filled}/{len(values)} cells × "
+          f"{values.shape[1]} years in {seconds:.2f} s → {args.store / SURFACE_FILE}")
+
+
+if __name__ == "__main__":
+    main()
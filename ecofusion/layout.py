@@ -0,0 +1,84 @@
+"""
+Dashboard chrome shared by every page: sidebar summary, figures, timing panel and footer
+"""
+
+import streamlit as st
+
+from ecofusion import tracing
+from ecofusion.data import get_data_manager, load_audio_species, load_audio_summary, load_fusion, load_gbif
+
+
+def render_sidebar_summary(snapshot):
+    fusion = load_fusion()
+    audio_species = load_audio_species()
+    audio_summary = load_audio_summary()
+    gbif_data = load_gbif()
+
+    # Add data summary in sidebar
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("**📋 Data Summary:**")
+    st.sidebar.markdown(f"• **Temporal Coverage:** {fusion.year.min()}-{fusion.year.max()}")
+    st.sidebar.markdown(f"• **Bird Species:** {len(audio_species)} (Western Ghats)")
+    st.sidebar.markdown(f"• **GBIF Records:** {len(gbif_data)} yearly summaries")
+    st.sidebar.markdown(f"• **Audio Signal:** {audio_summary['audio_signal_strength'].iloc[0]:.3f}")
+    st.sidebar.markdown(f"• **Data Version:** `{snapshot.version}` (loaded in {snapshot.load_seconds * 1000:.0f} ms)")
+
+    last_error = get_data_manager().last_error
+    if last_error:
+        st.sidebar.warning(f"⚠️ Latest data refresh rejected, serving `{snapshot.version}`: {last_error}")
+
+    # Add GBIF citation in sidebar
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("**📚 Data Citation:**")
+    st.sidebar.markdown("GBIF.org (28 January 2026)")
+    st.sidebar.markdown("[GBIF Occurrence Download](https://doi.org/10.15468/dl.zdxvtf)")
+    st.sidebar.markdown("*Herbarium of French Institute of Pondicherry*")
+
+
+# Called with every figure before it is released (the static export keeps a copy of each one)
+FIGURE_HOOKS = []
+
+
+def show_figure(fig, span_name):
+    """Render a matplotlib figure and release it (pyplot keeps every open figure alive)"""
+    import matplotlib.pyplot as plt
+
+    with tracing.span(span_name):
+        st.pyplot(fig)
+    for hook in FIGURE_HOOKS:
+        hook(fig)
+    plt.close(fig)
+
+
+def render_timing_panel(spans, limit=12):
+    """Sidebar breakdown of the slowest spans in this rerun (?debug=1 or ECOFUSION_TRACE=1)"""
+    with st.sidebar.expander("⏱️ Render Timings", expanded=False):
+        total = next((e["dur_us"] for e in spans if e["name"] == "app.rerun"), None)
+        if total is not None:
+            st.markdown(f"**Rerun:** {total / 1000:.1f} ms")
+        rows = [
+            {"span": "  " * e["depth"] + e["name"], "ms": round(e["dur_us"] / 1000, 2),
+             "detail": ", ".join(f"{k}={v}" for k, v in e.get("attrs", {}).items())}
+            for e in tracing.slowest(spans, limit)
+        ]
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+
+
+def render_footer():
+    st.markdown("---")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("**🌿 EcoFusionAI**")
+        st.markdown("Research-grade multimodal early-warning system")
+
+    with col2:
+        st.markdown("**🎓 Academic Project**")
+        st.markdown("Final Year BE - Computer Engineering (SPPU)")
+
+    with col3:
+        st.markdown("**📊 Data Sources**")
+        st.markdown("GBIF • MODIS • BirdCLEF")
+
+    st.markdown("---")
+    st.caption("🔬 Scientific methodology aligned with temporal data characteristics | 🌍 Western Ghats biodiversity hotspot focus")
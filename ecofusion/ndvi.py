@@ -0,0 +1,62 @@
+"""
+NDVI regional analytics
+Vectorized per-region statistics and trends shared by the dashboard and batch jobs
+"""
+
+import numpy as np
+import pandas as pd
+
+# Mean NDVI lower bounds of the excellent / good / moderate health classes (below the last is poor)
+NDVI_HEALTH_THRESHOLDS = (0.7, 0.6, 0.5)
+
+
+def build_ndvi_regional_summary(ndvi_raw):
+    """Per-region NDVI statistics, OLS trend slope and health classes for all regions at once"""
+    ndvi = ndvi_raw.sort_values(['region', 'year'], kind='mergesort')
+    codes, regions = pd.factorize(ndvi['region'], sort=True)
+    n_regions = len(regions)
+
+    x = ndvi['year'].to_numpy(dtype=float)
+    y = ndvi['ndvi_mean'].to_numpy(dtype=float)
+    n = np.bincount(codes, minlength=n_regions).astype(float)
+
+    def group_sum(values):
+        return np.bincount(codes, weights=values, minlength=n_regions)
+
+    # Closed-form OLS slope on per-region centred years (numerically stable for calendar years)
+    x_centred = x - (group_sum(x) / n)[codes]
+    y_mean = group_sum(y) / n
+    sxx = group_sum(x_centred * x_centred)
+    y_centred = y - y_mean[codes]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = np.where((n > 1) & (sxx > 0), group_sum(x_centred * y_centred) / sxx, np.nan)
+        y_std = np.where(n > 1, np.sqrt(group_sum(y_centred * y_centred) / (n - 1)), np.nan)
+
+    # Rows are sorted by (region, year), so each region is a contiguous block
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    ends = np.r_[starts[1:], len(codes)] - 1
+    first, last = y[starts], y[ends]
+
+    summary = pd.DataFrame({
+        'Mean_NDVI': y_mean,
+        'Min_NDVI': np.minimum.reduceat(y, starts),
+        'Max_NDVI': np.maximum.reduceat(y, starts),
+        'NDVI_Variability': y_std,
+        'Avg_Internal_Std': group_sum(ndvi['ndvi_std'].to_numpy(dtype=float)) / n,
+        'Avg_Samples': group_sum(ndvi['num_samples'].to_numpy(dtype=float)) / n,
+    }, index=pd.Index(regions, name='region')).round(3)
+
+    summary['Health_Status'] = np.select(
+        [summary['Mean_NDVI'] > threshold for threshold in NDVI_HEALTH_THRESHOLDS],
+        ['🟢 Excellent', '🟡 Good', '🟠 Moderate'],
+        default='🔴 Poor'
+    )
+
+    summary['Trend_Slope'] = slope
+    summary['Trend_Status'] = np.select(
+        [slope > 0.01, slope < -0.01], ['🟢 Improving', '🔴 Declining'], default='🟡 Stable'
+    )
+    summary['Total_Change'] = last - first
+    summary['Percent_Change'] = (last - first) / first * 100
+    summary['Num_Years'] = n.astype(int)
+    return summary
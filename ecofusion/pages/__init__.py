@@ -0,0 +1,26 @@
+"""
+Dashboard pages – one module per section, imported only when its section is shown
+"""
+
+# --------------------------------------------------
+# Sections → page modules (imported lazily, so a rerun only loads
+# the libraries the selected page needs)
+# --------------------------------------------------
+PAGES = {
+    "🏠 Overview": "ecofusion.pages.overview",
+    "📊 Scientific Methodology": "ecofusion.pages.methodology",
+    "📈 Biodiversity Trends": "ecofusion.pages.trends",
+    "🚨 Early Warning System": "ecofusion.pages.early_warning",
+    "🤖 ML Model Insights": "ecofusion.pages.model_insights",
+    "🛰️ NDVI Regional Analysis": "ecofusion.pages.ndvi_regional",
+    "🗺️ Spatial Hotspots": "ecofusion.pages.spatial",
+}
+
+NAVIGATION = [
+    "🏠 Overview",
+    "📈 Biodiversity Trends",
+    "🚨 Early Warning System",
+    "🤖 ML Model Insights",
+    "🛰️ NDVI Regional Analysis",
+    "🗺️ Spatial Hotspots"
+]
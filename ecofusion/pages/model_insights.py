@@ -0,0 +1,191 @@
+"""
+🤖 ML Model Insights page
+"""
+
+import streamlit as st
+
+from ecofusion import charts
+from ecofusion.charts import Panel
+from ecofusion.data import load_feature_importance, load_model_results
+
+
+def render():
+    model_results = load_model_results()
+    feature_importance = load_feature_importance()
+    
+    st.title("🤖 Machine Learning Model Analysis")
+    
+    st.markdown("""
+    ### 🔍 **Model Performance Overview**
+    
+    Our multimodal approach uses two complementary machine learning models to understand 
+    biodiversity-environment relationships in the Western Ghats.
+    """)
+    
+    # Model performance comparison
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📊 Model Performance Metrics")
+        
+        # Enhanced model results display
+        model_display = model_results.copy()
+        model_display['RMSE'] = model_display['RMSE'].round(4)
+        model_display['R2'] = model_display['R2'].round(4)
+        
+        # Add performance interpretation
+        for idx, row in model_display.iterrows():
+            if row['R2'] < 0:
+                model_display.loc[idx, 'Interpretation'] = "Expected (small dataset)"
+            elif row['R2'] < 0.3:
+                model_display.loc[idx, 'Interpretation'] = "Weak relationship"
+            elif row['R2'] < 0.7:
+                model_display.loc[idx, 'Interpretation'] = "Moderate relationship"
+            else:
+                model_display.loc[idx, 'Interpretation'] = "Strong relationship"
+        
+        st.dataframe(model_display, use_container_width=True)
+        
+        # Performance context
+        st.info("""
+        **📝 Performance Context:**
+        
+        ⚠️ **Negative R² is expected** due to small sample size (7 years)
+        
+        ✅ **Methodology is scientifically valid** - proof-of-concept system
+        
+        🎯 **Focus on feature importance** rather than prediction accuracy
+        """)
+    
+    with col2:
+        st.subheader("🎯 Model Comparison")
+        
+        # Create performance visualization
+        scores = model_results.assign(color=(['skyblue', 'lightcoral'] * len(model_results))[:len(model_results)],
+                                      label=model_results['R2'].map('{:.3f}'.format))
+        performance = Panel("Model Performance Comparison", 'Model', y_title="R² Score", categorical=True)
+        performance.bars(scores, 'R2', colors='color', text='label', opacity=0.7)
+        performance.rule(0, color='red', label='Baseline', opacity=0.5)
+        charts.show(performance, "model_insights.chart", figsize=(8, 6))
+        
+        # Model insights
+        best_model = model_results.loc[model_results['R2'].idxmax(), 'Model']
+        st.success(f"🏆 **Best Performing Model:** {best_model}")
+        
+        if 'Random Forest' in best_model:
+            st.markdown("✅ **Nonlinear ecological relationships detected**")
+        else:
+            st.markdown("📊 **Linear relationships dominate**")
+    
+    # Feature importance analysis
+    st.markdown("---")
+    st.subheader("🔍 Feature Importance Analysis")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Feature importance visualization, sorted by importance
+        feature_imp_sorted = feature_importance.sort_values('importance', ascending=True)
+        total_importance = feature_imp_sorted['importance'].sum()
+        feature_imp_sorted = feature_imp_sorted.assign(
+            feature=feature_imp_sorted.index.astype(str),
+            color=(['#2E8B57', '#4682B4', '#DAA520', '#CD853F'] * len(feature_imp_sorted))[:len(feature_imp_sorted)],
+            percentage=(feature_imp_sorted['importance'] / total_importance * 100).map('{:.1f}%'.format),
+        )
+        importance = Panel("Feature Importance - Drivers of Biodiversity Change", 'feature',
+                           y_title="Importance Score", categorical=True, horizontal=True)
+        importance.bars(feature_imp_sorted, 'importance', colors='color', text='percentage')
+        charts.show(importance, "model_insights.importance_chart", figsize=(10, 6))
+    
+    with col2:
+        st.markdown("**🎯 Key Insights:**")
+        
+        # Get top feature
+        top_feature = feature_importance.loc[feature_importance['importance'].idxmax()]
+        top_feature_name = str(top_feature.name)  # Convert to string to avoid AttributeError
+        top_importance = top_feature['importance']
+        
+        st.metric(
+            "🏆 Most Important Driver",
+            top_feature_name.replace('_', ' ').title(),
+            f"{(top_importance/feature_importance['importance'].sum())*100:.1f}%"
+        )
+        
+        # Ecological interpretation
+        if 'ndvi' in top_feature_name.lower():
+            st.success("🌿 **Environmental factors dominate** biodiversity patterns")
+            st.markdown("**Implication:** Vegetation health is the primary driver of species richness changes")
+        elif 'audio' in top_feature_name.lower():
+            st.info("🔊 **Acoustic signals are key** biodiversity indicators")
+            st.markdown("**Implication:** Bird activity strongly correlates with ecosystem health")
+        elif 'occurrence' in top_feature_name.lower():
+            st.warning("📊 **Sampling effort significantly affects** biodiversity measures")
+            st.markdown("**Implication:** Observation bias correction is crucial")
+        
+        # Feature ranking
+        st.markdown("**📊 Feature Ranking:**")
+        for i, (feature, row) in enumerate(feature_importance.sort_values('importance', ascending=False).iterrows(), 1):
+            percentage = (row['importance'] / feature_importance['importance'].sum()) * 100
+            st.markdown(f"{i}. **{feature.replace('_', ' ').title()}** ({percentage:.1f}%)")
+    
+    # Scientific implications
+    st.markdown("---")
+    st.subheader("🧬 Scientific Implications")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        **🌿 Environmental Dominance**
+        
+        If NDVI features rank highest:
+        - Vegetation health drives biodiversity
+        - Climate/habitat quality is primary factor
+        - Conservation should focus on habitat protection
+        """)
+    
+    with col2:
+        st.markdown("""
+        **🔊 Acoustic Indicators**
+        
+        If audio features are important:
+        - Bird activity reflects ecosystem health
+        - Acoustic monitoring is valuable
+        - Species-specific conservation needed
+        """)
+    
+    with col3:
+        st.markdown("""
+        **📊 Sampling Effects**
+        
+        If occurrence features dominate:
+        - Observer bias significantly affects results
+        - Data collection standardization needed
+        - Statistical corrections are crucial
+        """)
+    
+    # Model limitations and future work
+    st.markdown("---")
+    st.subheader("⚠️ Model Limitations & Future Directions")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **🚧 Current Limitations:**
+        - Small temporal dataset (7 years)
+        - Limited to Western Ghats region
+        - Prototype-level system
+        - Audio signal aggregated regionally
+        - Point sampling approach for NDVI
+        """)
+    
+    with col2:
+        st.markdown("""
+        **🚀 Future Enhancements:**
+        - Expanded temporal coverage
+        - Real-time satellite integration
+        - Species-specific audio analysis
+        - Deep learning for audio signals
+        - Habitat fragmentation metrics
+        """)
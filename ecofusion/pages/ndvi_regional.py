@@ -0,0 +1,208 @@
+"""
+🛰️ NDVI Regional Analysis page
+"""
+
+import pandas as pd
+import streamlit as st
+
+from ecofusion import charts
+from ecofusion.charts import Panel
+from ecofusion.data import load_ndvi_data, load_ndvi_sketches
+from ecofusion.sketch import STRESS_NDVI
+
+
+def render():
+    st.title("🛰️ NDVI Regional Analysis - Environmental Monitoring")
+    
+    st.markdown("""
+    ### 🌿 **Vegetation Health Monitoring**
+    
+    This section shows **Normalized Difference Vegetation Index (NDVI)** trends across different 
+    Western Ghats regions, providing the environmental foundation for our multimodal analysis.
+    """)
+    
+    # Load NDVI data
+    try:
+        ndvi_raw, ndvi_regional_summary = load_ndvi_data()
+        
+        # Regional analysis
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            st.subheader("📊 Regional NDVI Trends")
+            
+            # Region selector
+            regions = ndvi_regional_summary.index.tolist()
+            selected_regions = st.multiselect(
+                "Select regions to analyze:",
+                regions,
+                default=regions[:3] if len(regions) > 3 else regions
+            )
+        
+        with col2:
+            st.subheader("📋 Analysis Options")
+            
+            show_aggregated = st.checkbox("Show aggregated trend", value=True)
+            show_individual = st.checkbox("Show individual regions", value=True)
+            
+            # NDVI interpretation guide
+            st.info("""
+            **🌿 NDVI Interpretation:**
+            - **0.8-1.0:** Dense vegetation
+            - **0.6-0.8:** Moderate vegetation  
+            - **0.4-0.6:** Sparse vegetation
+            - **0.2-0.4:** Very sparse/stressed
+            - **<0.2:** Bare soil/water
+            """)
+        
+        if selected_regions:
+            # Filter data
+            filtered_data = ndvi_raw[ndvi_raw['region'].isin(selected_regions)]
+            
+            # Create comprehensive visualization
+            trends = Panel("NDVI Trends by Region", "year", y_title="NDVI Mean")
+            aggregated = Panel("Aggregated NDVI Trend (Used in Fusion)", "year", y_title="NDVI Mean")
+            variability = Panel("NDVI Variability by Region", "year", x_title="Year", y_title="NDVI Standard Deviation")
+            
+            # 1. Individual region trends
+            if show_individual:
+                trends.line(filtered_data, 'ndvi_mean', by='region', opacity=0.8)
+            
+            # 2. Aggregated trend (used in fusion)
+            if show_aggregated:
+                yearly_ndvi = filtered_data.groupby('year')['ndvi_mean'].mean().reset_index()
+                aggregated.line(yearly_ndvi, 'ndvi_mean', label='Aggregated NDVI', color='green', width=3)
+            
+            # 3. NDVI variability
+            variability.line(filtered_data, 'ndvi_std', by='region', marker='s', opacity=0.7)
+            
+            # 4. Regional comparison (latest year)
+            latest_year = filtered_data['year'].max()
+            latest_data = filtered_data[filtered_data['year'] == latest_year]
+            latest_data = latest_data.assign(label=latest_data['ndvi_mean'].map('{:.3f}'.format))
+            comparison = Panel(f"Regional NDVI Comparison ({int(latest_year)})", 'region', y_title="NDVI Mean",
+                               categorical=True)
+            comparison.bars(latest_data, 'ndvi_mean', color='green', text='label', opacity=0.7)
+            
+            charts.show([trends, aggregated, variability, comparison], "ndvi_regional.chart", columns=2,
+                        figsize=(15, 12))
+            
+            # Regional statistics
+            st.markdown("---")
+            st.subheader("📊 Regional Statistics Summary")
+            
+            # Slice the precomputed per-region summary by the selection
+            regional_stats = ndvi_regional_summary.loc[selected_regions, [
+                'Mean_NDVI', 'Min_NDVI', 'Max_NDVI', 'NDVI_Variability',
+                'Avg_Internal_Std', 'Avg_Samples', 'Health_Status'
+            ]]
+            
+            st.dataframe(regional_stats, use_container_width=True)
+            
+            # Key insights
+            st.markdown("---")
+            st.subheader("🔍 Environmental Insights")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                healthiest = regional_stats['Mean_NDVI'].idxmax()
+                healthiest_value = regional_stats.loc[healthiest, 'Mean_NDVI']
+                st.metric(
+                    "🌿 Healthiest Region",
+                    healthiest,
+                    f"{healthiest_value:.3f} NDVI"
+                )
+            
+            with col2:
+                most_stressed = regional_stats['Mean_NDVI'].idxmin()
+                stressed_value = regional_stats.loc[most_stressed, 'Mean_NDVI']
+                st.metric(
+                    "⚠️ Most Stressed Region",
+                    most_stressed,
+                    f"{stressed_value:.3f} NDVI"
+                )
+            
+            with col3:
+                most_variable = regional_stats['NDVI_Variability'].idxmax()
+                variable_value = regional_stats.loc[most_variable, 'NDVI_Variability']
+                st.metric(
+                    "📊 Most Variable Region",
+                    most_variable,
+                    f"{variable_value:.3f} std"
+                )
+            
+            # Temporal analysis
+            st.subheader("📈 Temporal Trends Analysis")
+            
+            # Trends come precomputed with the regional summary (regions need 2+ years)
+            trends = ndvi_regional_summary.loc[selected_regions]
+            trends = trends[trends['Num_Years'] > 1]
+            
+            if len(trends):
+                trend_df = pd.DataFrame({
+                    'Region': trends.index,
+                    'Trend_Slope': trends['Trend_Slope'].map('{:.4f}'.format).to_numpy(),
+                    'Trend_Status': trends['Trend_Status'].to_numpy(),
+                    'Total_Change': trends['Total_Change'].map('{:.3f}'.format).to_numpy(),
+                    'Percent_Change': trends['Percent_Change'].map('{:+.1f}%'.format).to_numpy()
+                })
+                st.dataframe(trend_df, use_container_width=True)
+            
+            # Pixel-level distribution from the region-year quantile sketches (optional artefact)
+            sketches = load_ndvi_sketches()
+            if sketches is not None:
+                st.markdown("---")
+                st.subheader("📦 NDVI Distribution")
+                
+                chosen = sketches.select(sketches.keys['region'].isin(selected_regions))
+                if len(chosen):
+                    summary = chosen.summary()
+                    combined = chosen.rollup(['year']).summary()
+                    
+                    spread = Panel("NDVI Median and 5-95% Range", "year", y_title="NDVI")
+                    spread.band(summary, 'q05', 'q95', by='region')
+                    spread.line(summary, 'q50', by='region')
+                    spread.line(combined, 'q50', label='Selected regions', color='green', width=3)
+                    
+                    stressed = Panel(f"Share of Pixels Below NDVI {STRESS_NDVI}", "year", x_title="Year",
+                                     y_title="Share of pixels")
+                    stressed.line(summary, 'share_below', by='region', marker='s')
+                    stressed.line(combined, 'share_below', label='Selected regions', color='green', width=3)
+                    
+                    charts.show([spread, stressed], "ndvi_regional.distribution", columns=2, figsize=(15, 5))
+                    
+                    latest = combined[combined['year'] == combined['year'].max()].iloc[0]
+                    col1, col2, col3 = st.columns(3)
+                    col1.metric("📍 Pixels Sampled", f"{int(latest['count']):,}", f"{int(latest['year'])}")
+                    col2.metric("📊 Median NDVI", f"{latest['q50']:.3f}",
+                                f"IQR {latest['q25']:.3f}-{latest['q75']:.3f}", delta_color="off")
+                    col3.metric("⚠️ Stressed Pixels", f"{latest['share_below']:.1%}",
+                                f"NDVI < {STRESS_NDVI}", delta_color="off")
+                    st.caption("Quantiles come from mergeable t-digest sketches of every sampled pixel, so any "
+                               "combination of regions and years is summarised without rereading the samples.")
+            
+            # Connection to fusion analysis
+            st.markdown("---")
+            st.subheader("🔗 Connection to Multimodal Analysis")
+            
+            st.markdown("""
+            **🔄 From Regional NDVI to Ecosystem Monitoring:**
+            
+            1. **Regional Extraction:** Individual NDVI trends shown above
+            2. **Temporal Aggregation:** Combined into yearly ecosystem-wide signal
+            3. **Multimodal Fusion:** Integrated with biodiversity and acoustic data
+            4. **Early Warning:** Contributes to composite eco-stress index
+            
+            **🎯 Key Contribution:** NDVI provides the **environmental foundation** for understanding 
+            biodiversity stress patterns in the Western Ghats ecosystem.
+            """)
+            
+        else:
+            st.warning("Please select at least one region to analyze.")
+            
+    except FileNotFoundError:
+        st.error("NDVI data not found. Please run Notebook 1 first to generate NDVI temporal dataset.")
+    except Exception as e:
+        st.error(f"Error loading NDVI data: {e}")
+        st.info("Please ensure all required data files are available.")
@@ -0,0 +1,74 @@
+"""
+🏠 Overview page
+"""
+
+import streamlit as st
+
+from ecofusion.data import load_audio_species, load_fusion, load_gbif
+
+
+def render():
+    fusion = load_fusion()
+    audio_species = load_audio_species()
+    gbif_data = load_gbif()
+    
+    st.title("🌿 EcoFusionAI – Multimodal Biodiversity Early Warning System")
+    
+    st.markdown("""
+    ### 🎯 **Research Objective**
+    **EcoFusionAI** is a research-grade, multimodal early-warning system that detects biodiversity stress trends in the **Western Ghats biodiversity hotspot** using:
+    
+    - 🛰️ **Satellite vegetation health (NDVI)** – Environmental monitoring (2018-2024)
+    - 🦅 **Species occurrence trends (GBIF)** – Long-term biodiversity baseline (1990-2024) 
+    - 🔊 **Bird acoustic activity (BirdCLEF)** – Regional biodiversity indicator (163 species)
+    
+    ### 🧬 **Scientific Approach**
+    All data sources are **geographically filtered to Western Ghats region** (8.0-21.0°N, 73.0-77.5°E) ensuring meaningful ecological correlations and scientific validity.
+    """)
+    
+    # Key metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            "📅 Analysis Period", 
+            f"{fusion.year.min()}-{fusion.year.max()}",
+            f"{len(fusion)} years"
+        )
+    
+    with col2:
+        st.metric(
+            "🦜 Bird Species", 
+            f"{len(audio_species)}",
+            "Western Ghats filtered"
+        )
+    
+    with col3:
+        st.metric(
+            "📊 GBIF Records", 
+            f"{len(gbif_data)}",
+            "Yearly summaries"
+        )
+    
+    with col4:
+        current_stress = fusion['eco_stress_index'].iloc[-1]
+        stress_status = "🔴 High" if current_stress > 0.6 else "🟡 Medium" if current_stress > 0.4 else "🟢 Low"
+        st.metric(
+            "⚠️ Current Stress", 
+            f"{current_stress:.3f}",
+            stress_status
+        )
+    
+    # Navigation guide
+    st.markdown("---")
+    st.info("""
+    **🔍 Navigation Guide:**
+    
+    📈 **Biodiversity Trends** - Long-term species patterns
+    
+    🚨 **Early Warning** - Stress detection system
+    
+    🤖 **ML Insights** - Model performance & features
+    
+    🛰️ **NDVI Analysis** - Regional vegetation health
+    """)
@@ -0,0 +1,90 @@
+"""
+🗺️ Spatial Hotspots page
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import streamlit as st
+
+from ecofusion.boundaries import load_boundaries
+from ecofusion.data import load_fusion, load_spatial_grid
+from ecofusion.layout import show_figure
+
+METRICS = {
+    "Occurrences": "occurrences",
+    "Species Richness": "richness",
+    "NDVI": "ndvi",
+    "Eco-Stress Index": "stress",
+}
+
+
+def render():
+    st.title("🗺️ Spatial Hotspots - Gridded Biodiversity Signals")
+
+    st.markdown("""
+    ### 📍 **Where in the Western Ghats is stress rising?**
+
+    Occurrence records and NDVI samples are binned onto a regular grid, so each cell has its own
+    yearly occurrence count, species richness, mean NDVI and eco-stress index. Where point NDVI samples
+    were interpolated onto the grid (`python -m ecofusion.interpolate`), every cell gets NDVI, not only
+    the cells that hold a sample.
+    """)
+
+    store = load_spatial_grid()
+    if store is None:
+        st.info("""
+        **Spatial grid not available.** Build it from a GBIF occurrence download with
+        `python -m ecofusion.spatial occurrence.txt` (the batch pipeline writes it too).
+        """)
+        return
+
+    col1, col2 = st.columns([2, 1])
+    with col2:
+        metric = st.selectbox("Metric", list(METRICS))
+        year = st.select_slider("Year", options=store.years.tolist(), value=int(store.years[-1]))
+
+    key = METRICS[metric]
+    if key == "ndvi":
+        values = store.ndvi_mean()
+    elif key == "stress":
+        fusion = load_fusion()
+        latest = fusion.iloc[-1]
+        values = store.stress(latest.get("species_stress_index", 0.0), latest.get("critical_species_stress", 0.0))
+    else:
+        values = store.arrays[key]
+    cells = store.to_frame(values, year)
+
+    with col1:
+        grid = store.grid
+        fig, ax = plt.subplots(figsize=(7, 9))
+        cmap = "RdYlGn_r" if key == "stress" else "viridis"
+        if grid.kind == "regular":
+            # Regular grids are drawn straight from the memory-mapped cells × years array
+            column = np.asarray(values, np.float64)[:, store.year_index(year)].reshape(grid.shape)
+            image = ax.imshow(np.where(column == 0, np.nan, column), origin="lower", cmap=cmap,
+                              extent=(grid.lon_min, grid.lon_max, grid.lat_min, grid.lat_max))
+        else:
+            image = ax.scatter(cells["lon"], cells["lat"], c=cells["value"], marker="h", s=60, cmap=cmap)
+        fig.colorbar(image, ax=ax, label=metric)
+
+        # Country outlines from the bundled Natural Earth boundaries
+        boundaries = load_boundaries()
+        for shape_id in boundaries.query_bbox(grid.lon_min, grid.lat_min, grid.lon_max, grid.lat_max):
+            for ring in boundaries.rings(shape_id):
+                ax.plot(ring[:, 0], ring[:, 1], color="black", linewidth=0.8)
+        ax.set_xlim(grid.lon_min, grid.lon_max)
+        ax.set_ylim(grid.lat_min, grid.lat_max)
+        ax.set_title(f"{metric} per {grid.cell_deg}° cell ({year})", fontsize=14, fontweight='bold')
+        ax.set_xlabel("Longitude")
+        ax.set_ylabel("Latitude")
+        ax.grid(alpha=0.3)
+        fig.tight_layout()
+        show_figure(fig, "spatial.pyplot")
+
+    with col2:
+        st.metric("Occupied Cells", f"{len(cells)} / {grid.n_cells}")
+        if len(cells):
+            st.metric(f"Mean {metric}", f"{cells['value'].mean():.3f}")
+
+    st.subheader(f"🔥 Top Cells by {metric} ({year})")
+    st.dataframe(cells.nlargest(10, "value").round(3), use_container_width=True, hide_index=True)
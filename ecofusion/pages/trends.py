@@ -0,0 +1,163 @@
+"""
+📈 Biodiversity Trends page
+"""
+
+import pandas as pd
+import streamlit as st
+
+from ecofusion import charts
+from ecofusion.charts import Panel
+from ecofusion.data import (
+    load_fusion, load_gbif, load_partition_values, load_partitioned, load_species_matrix, load_species_trends,
+)
+from ecofusion.species import ALL_REGIONS, declining_species
+
+
+def render():
+    fusion = load_fusion()
+    gbif_data = load_gbif()
+    
+    st.title("📈 Long-Term Biodiversity Trends Analysis")
+    
+    st.markdown("""
+    ### 🔍 **GBIF Biodiversity Patterns (1990-2024)**
+    
+    This analysis shows **sampling-corrected species richness** from the Herbarium of French Institute of Pondicherry, 
+    filtered specifically for the Western Ghats region.
+    """)
+    
+    # Main biodiversity trend
+    fusion_biodiversity = fusion["species_per_1000_occ"]
+    baseline = Panel("Long-term Biodiversity Baseline (Full GBIF Dataset)", "year",
+                     y_title="Species per 1000 Occurrences")
+    baseline.line(gbif_data, "species_per_1000_occ", color="blue")
+    baseline.span(2018, 2024, color="green", label="Fusion Analysis Period")
+    fusion_period = Panel("Biodiversity Trends in Fusion Analysis Period (2018-2024)", "year", x_title="Year",
+                          y_title="Species per 1000 Occurrences")
+    fusion_period.line(fusion, "species_per_1000_occ", label="Fusion Period", color="green", width=3)
+    charts.show([baseline, fusion_period], "trends.chart", figsize=(12, 10))
+    
+    # Key insights
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        trend_change = ((fusion_biodiversity.iloc[-1] - fusion_biodiversity.iloc[0]) / fusion_biodiversity.iloc[0]) * 100
+        st.metric(
+            "📊 Trend (2018-2024)", 
+            f"{trend_change:+.1f}%",
+            "Change in species richness"
+        )
+    
+    with col2:
+        peak_year = gbif_data.loc[gbif_data['species_per_1000_occ'].idxmax(), 'year']
+        peak_value = gbif_data['species_per_1000_occ'].max()
+        st.metric(
+            "🏔️ Peak Biodiversity", 
+            f"{int(peak_year)}",
+            f"{peak_value:.2f} species/1000 occ"
+        )
+    
+    with col3:
+        recent_avg = fusion_biodiversity.mean()
+        historical_avg = gbif_data['species_per_1000_occ'].mean()
+        comparison = ((recent_avg - historical_avg) / historical_avg) * 100
+        st.metric(
+            "📈 Recent vs Historical", 
+            f"{comparison:+.1f}%",
+            "Fusion period vs full baseline"
+        )
+    
+    # Sample-size-robust richness (present when the pipeline computed the estimators)
+    if "rarefied_richness" in gbif_data.columns:
+        st.markdown("---")
+        st.subheader("🧮 Rarefied Richness & Richness Estimators")
+        depth = int(gbif_data["rarefaction_depth"].iloc[0])
+        st.markdown(f"""
+        The ratio above still shrinks as sampling grows. **Rarefied richness** compares every year at the same
+        sample size (**{depth} occurrences**), while **Chao1** and **ACE** estimate total richness from the
+        number of rarely recorded species.
+        """)
+        estimates = Panel("Species Richness Estimates by Year", "year", x_title="Year", y_title="Species")
+        estimates.line(gbif_data, "species_richness", label="Observed", color="black", marker=None, dash=True,
+                       opacity=0.6)
+        estimates.line(gbif_data, "rarefied_richness", label=f"Rarefied (n={depth})", color="blue")
+        estimates.line(gbif_data, "chao1", label="Chao1", color="green", marker="s", opacity=0.7)
+        estimates.line(gbif_data, "ace", label="ACE", color="#bf00bf", marker="^", opacity=0.7)
+        charts.show(estimates, "trends.richness_chart")
+
+    # Per-region richness, read from the partitioned dataset (only the selected region's partitions)
+    regions = load_partition_values("gbif_region_yearly", "region")
+    if regions:
+        st.markdown("---")
+        st.subheader("🗺️ Richness by Region")
+        region = st.selectbox("NDVI region", regions, key="richness_region")
+        columns = ["year", "occurrences", "species_richness", "rarefied_richness", "chao1"]
+        region_richness = load_partitioned("gbif_region_yearly", columns, region=region).sort_values("year")
+        richness = Panel(f"Species Richness — {region.replace('_', ' ')}", "year", x_title="Year", y_title="Species")
+        richness.line(region_richness, "species_richness", label="Observed", color="black", dash=True, opacity=0.6)
+        richness.line(region_richness, "rarefied_richness", label="Rarefied", color="blue")
+        richness.line(region_richness, "chao1", label="Chao1", color="green", marker="s", opacity=0.7)
+        charts.show(richness, "trends.region_richness_chart")
+
+    # Per-species trends from the sparse species × year matrix (present when the pipeline wrote it)
+    matrix = load_species_matrix()
+    if matrix is not None:
+        st.markdown("---")
+        st.subheader("📉 Fastest-Declining Species")
+        st.markdown(f"""
+        Trends are OLS slopes of each species' **reporting rate** (records per 1000 occurrences that year),
+        so changes in overall sampling effort cancel out. {len(matrix.species):,} species tracked.
+        """)
+        if matrix.n_years < 2:
+            st.info("Species trends need at least two years of records.")
+        else:
+            col1, col2 = st.columns(2)
+            with col1:
+                region = st.selectbox("Region", [ALL_REGIONS, *matrix.regions])
+            with col2:
+                # A slider needs min < max; with exactly two years there is nothing to choose
+                min_years = 2 if matrix.n_years == 2 else st.slider(
+                    "Minimum years recorded", 2, int(matrix.n_years), min(3, int(matrix.n_years)))
+            declining = declining_species(load_species_trends(region), min_years=min_years)
+            if declining.empty:
+                st.info("No declining species meet the current filters.")
+            else:
+                st.dataframe(declining.round(3), use_container_width=True, hide_index=True)
+
+    # Scientific interpretation
+    st.markdown("---")
+    st.markdown("""
+    ### 🧬 **Scientific Interpretation**
+    
+    **✅ Sampling Bias Correction Applied**
+    - Uses "species per 1000 occurrences" metric to normalize for observation effort
+    - Accounts for varying collection intensity across years
+    - Reflects true biodiversity patterns, not sampling artifacts
+    
+    **🔍 Key Observations:**
+    - **Long-term baseline** provides statistical credibility for biodiversity trends
+    - **Recent period** shows specific patterns relevant to current conservation needs
+    - **Herbarium data** captures botanical diversity with high taxonomic accuracy
+    
+    **🎯 Conservation Implications:**
+    - Identifies periods of biodiversity stress requiring intervention
+    - Provides baseline for measuring conservation success
+    - Supports evidence-based policy decisions for Western Ghats protection
+    """)
+    
+    # Detailed statistics
+    st.subheader("📊 Statistical Summary")
+    
+    # Create summary table
+    summary_data = {
+        'Period': ['Full Baseline (1990-2024)', 'Fusion Analysis (2018-2024)'],
+        'Years': [len(gbif_data), len(fusion)],
+        'Mean Species/1000': [gbif_data['species_per_1000_occ'].mean(), fusion_biodiversity.mean()],
+        'Min Species/1000': [gbif_data['species_per_1000_occ'].min(), fusion_biodiversity.min()],
+        'Max Species/1000': [gbif_data['species_per_1000_occ'].max(), fusion_biodiversity.max()],
+        'Std Deviation': [gbif_data['species_per_1000_occ'].std(), fusion_biodiversity.std()]
+    }
+    
+    summary_df = pd.DataFrame(summary_data)
+    summary_df = summary_df.round(3)
+    st.dataframe(summary_df, use_container_width=True)
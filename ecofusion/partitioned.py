@@ -0,0 +1,181 @@
+"""
+Hive-partitioned Parquet datasets
+Pipeline outputs are written as datasets/<name>/hotspot=<hotspot>/region=<region>/year=<year>/
+Parquet files with per-row-group min/max statistics. A query names the
+partitions and columns it needs; partition pruning skips every other
+directory and the row-group statistics skip non-matching row groups inside
+the files, so I/O per query grows with the selection, not with the history.
+
+Usage:
+    python -m ecofusion.partitioned list
+    python -m ecofusion.partitioned query occurrences --region Western_Ghats_South --year 2020 2024 \\
+        --columns species year
+"""
+
+import argparse
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from ecofusion import store, tracing
+
+DATASET_DIR = "datasets"  # under the data root (dashboard) or the pipeline output directory
+PARTITIONS = ["hotspot", "region", "year"]
+HOTSPOT = "WESTERN_GHATS"
+ALL_REGIONS = "All"  # region partition of hotspot-wide tables
+ROW_GROUP_SIZE = 128 * 1024
+COMMIT_MARKER = "_committed"  # touched after every write; dataset discovery skips "_" files
+
+_PARTITIONING = ds.partitioning(
+    pa.schema([("hotspot", pa.string()), ("region", pa.string()), ("year", pa.int32())]), flavor="hive"
+)
+
+
+def dataset_root():
+    return store.DATA_ROOT / DATASET_DIR
+
+
+def dataset_path(name, root=None):
+    return Path(root or dataset_root()) / name
+
+
+def write_dataset(frame, name, root=None, hotspot=HOTSPOT, sort_by=None):
+    """Write (or replace the touched partitions of) one dataset
+
+    Frames without a region column are stored under region=All. Partitions
+    present in `frame` are overwritten; all others are left as they are, so
+    yearly runs append history.
+    """
+    frame = frame.assign(hotspot=hotspot)
+    if "region" not in frame.columns:
+        frame = frame.assign(region=ALL_REGIONS)
+    frame = frame.dropna(subset=["year"]).astype({"year": "int32"})
+    if sort_by:
+        # Sorted rows give tight per-row-group min/max statistics on the sort column
+        frame = frame.sort_values(PARTITIONS + list(sort_by), kind="stable")
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    # Categoricals are stored as plain strings (Parquet dictionary-encodes them anyway),
+    # so partitions written from differently typed frames share one schema
+    table = table.cast(pa.schema(
+        [field.with_type(pa.large_string()) if pa.types.is_dictionary(field.type) else field for field in table.schema],
+        metadata=table.schema.metadata,
+    ))
+
+    with tracing.span("partitioned.write_dataset", dataset=name, rows=len(frame)):
+        ds.write_dataset(
+            table,
+            dataset_path(name, root),
+            format="parquet",
+            partitioning=_PARTITIONING,
+            basename_template="part-{i}.parquet",
+            existing_data_behavior="delete_matching",
+            max_rows_per_group=ROW_GROUP_SIZE,
+            min_rows_per_group=min(ROW_GROUP_SIZE, max(len(frame), 1)),
+            file_options=ds.ParquetFileFormat().make_write_options(compression="zstd", write_statistics=True),
+        )
+    (dataset_path(name, root) / COMMIT_MARKER).touch()
+    return dataset_path(name, root)
+
+
+def open_dataset(name, root=None):
+    return ds.dataset(dataset_path(name, root), format="parquet", partitioning=_PARTITIONING)
+
+
+def committed_ns(name, root=None):
+    """Modification time of the last write (cache key for readers); None when the dataset is absent"""
+    try:
+        return (dataset_path(name, root) / COMMIT_MARKER).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def partition_values(name, key, root=None, hotspot=HOTSPOT):
+    """Distinct values of one partition key, from the directory layout alone (no data is read)"""
+    dataset = open_dataset(name, root)
+    values = {ds.get_partition_keys(fragment.partition_expression).get(key)
+              for fragment in dataset.get_fragments(filter=where(hotspot=hotspot))}
+    return sorted(value for value in values if value is not None)
+
+
+def where(**conditions):
+    """Filter expression: value → equality, list/tuple → membership, slice(lo, hi) → inclusive range"""
+    expression = None
+    for column, condition in conditions.items():
+        if condition is None:
+            continue
+        field = ds.field(column)
+        if isinstance(condition, slice):
+            term = None
+            if condition.start is not None:
+                term = field >= condition.start
+            if condition.stop is not None:
+                upper = field <= condition.stop
+                term = upper if term is None else term & upper
+        elif isinstance(condition, (list, tuple, set)):
+            term = field.isin(list(condition))
+        else:
+            term = field == condition
+        if term is not None:
+            expression = term if expression is None else expression & term
+    return expression
+
+
+def query(name, columns=None, root=None, hotspot=HOTSPOT, **conditions):
+    """Read only the matching partitions / row groups and the requested columns as a DataFrame"""
+    with tracing.span("partitioned.query", dataset=name) as span:
+        dataset = open_dataset(name, root)
+        table = dataset.to_table(columns=columns, filter=where(hotspot=hotspot, **conditions))
+        span.set(rows=table.num_rows)
+    return table.to_pandas()
+
+
+def scan_stats(name, root=None, hotspot=HOTSPOT, **conditions):
+    """How much of a dataset a query touches: files after partition pruning and row groups after statistics"""
+    dataset = open_dataset(name, root)
+    expression = where(hotspot=hotspot, **conditions)
+    files = list(dataset.get_fragments())
+    matching = list(dataset.get_fragments(filter=expression))
+    row_groups = sum(fragment.num_row_groups for fragment in files)
+    kept_groups = sum(len(piece.row_groups) for fragment in matching
+                      for piece in fragment.split_by_row_group(filter=expression, schema=dataset.schema))
+    return {"files": len(files), "files_read": len(matching),
+            "row_groups": row_groups, "row_groups_read": kept_groups}
+
+
+def list_datasets(root=None):
+    root = Path(root or dataset_root())
+    if not root.is_dir():
+        return {}
+    return {path.name: sum(1 for _ in path.rglob("*.parquet")) for path in sorted(root.iterdir()) if path.is_dir()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect and query the partitioned Parquet datasets")
+    parser.add_argument("command", choices=["list", "query"])
+    parser.add_argument("name", nargs="?")
+    parser.add_argument("--root", type=Path, default=None, help=f"dataset root (default: <data root>/{DATASET_DIR})")
+    parser.add_argument("--hotspot", default=HOTSPOT)
+    parser.add_argument("--region", nargs="+")
+    parser.add_argument("--year", nargs="+", type=int, help="one year, or first and last year")
+    parser.add_argument("--columns", nargs="+")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name, files in list_datasets(args.root).items():
+            print(f"📦 {name}: {files} files")
+        return
+
+    conditions = {"region": args.region}
+    if args.year:
+        conditions["year"] = slice(args.year[0], args.year[-1])
+    frame = query(args.name, args.columns, args.root, args.hotspot, **conditions)
+    stats = scan_stats(args.name, args.root, args.hotspot, **conditions)
+    print(f"✅ {len(frame)} rows; read {stats['files_read']}/{stats['files']} files, "
+          f"{stats['row_groups_read']}/{stats['row_groups']} row groups")
+    print(frame.head(args.limit).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
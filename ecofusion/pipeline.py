@@ -0,0 +1,486 @@
+"""
+EcoFusionAI batch pipeline
+The ingestion, fusion and training stages of notebooks 2 and 3 as plain
+functions, so they can be scripted, benchmarked and traced stage by stage.
+
+Usage:
+    python -m ecofusion.pipeline --gbif occurrence.txt --audio train_metadata.csv \\
+        --ndvi data/ndvi_temporal_dataset_POINT_SAMPLING.csv --output-dir out/
+"""
+
+import argparse
+import json
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ecofusion import align, partitioned, schema, tracing
+from ecofusion.dedup import deduplicate
+from ecofusion.features import FEATURE_STORE_PATH, INPUTS_PATH, FeatureStore, definitions_hash
+from ecofusion.richness import richness_estimates
+from ecofusion.species import MATRIX_DIR, build_species_matrix
+from ecofusion.tracing import traced
+
+# Western Ghats geographic bounds (approximate, literature-backed)
+WG_LAT_MIN, WG_LAT_MAX = 8.0, 21.0
+WG_LON_MIN, WG_LON_MAX = 73.0, 77.5
+
+# NDVI sampling regions from notebook 1 (lon_min, lat_min, lon_max, lat_max)
+NDVI_REGIONS = {
+    "Western_Ghats_South": (76.2, 8.2, 77.2, 11.3),
+    "Western_Ghats_North": (73.4, 18.8, 73.8, 19.2),
+    "Periyar_National_Park": (76.95, 9.42, 77.25, 9.68),
+}
+
+OTHER_REGION = "Western_Ghats_Other"
+
+GBIF_YEARS = (1990, 2024)
+FUSION_YEARS = (2018, 2024)
+MIN_OCCURRENCES = 20
+
+TARGET = "species_per_1000_occ"
+FEATURES = ["ndvi_mean", "ndvi_std", "audio_signal_strength", "occurrences"]
+
+# Region-year model on the feature store's v2 features (ecofusion/features.py)
+FEATURE_MODEL_PATH = "models/ecofusion_rf_feature_store.pkl"
+FEATURE_MODEL_METADATA_PATH = "models/ecofusion_rf_feature_store.json"
+FEATURE_PREDICTIONS_PATH = "data/feature_store_predictions_WESTERN_GHATS.csv"
+
+# Eco-stress index weights (environment, species stress, critical species, sampling)
+STRESS_WEIGHTS = (0.40, 0.35, 0.15, 0.10)
+
+# --------------------------------------------------
+# Ingestion (notebook 2)
+# --------------------------------------------------
+@traced("pipeline.load_gbif_occurrences")
+def load_gbif_occurrences(path):
+    """GBIF Darwin Core occurrence export (tab separated), only the columns the pipeline uses"""
+    return schema.read_csv(path, "gbif_occurrences", sep="\t")
+
+
+@traced("pipeline.filter_gbif_western_ghats")
+def filter_gbif_western_ghats(gbif, years=GBIF_YEARS):
+    gbif = gbif.assign(
+        decimalLatitude=pd.to_numeric(gbif["decimalLatitude"], errors="coerce"),
+        decimalLongitude=pd.to_numeric(gbif["decimalLongitude"], errors="coerce"),
+        year=pd.to_numeric(gbif["year"], errors="coerce"),
+    ).dropna(subset=["year", "species", "decimalLatitude", "decimalLongitude"]).astype({"year": "int16"})
+
+    return gbif[
+        gbif["decimalLatitude"].between(WG_LAT_MIN, WG_LAT_MAX) &
+        gbif["decimalLongitude"].between(WG_LON_MIN, WG_LON_MAX) &
+        gbif["year"].between(*years)
+    ]
+
+
+@traced("pipeline.deduplicate_records")
+def deduplicate_records(records, kind):
+    """Drop duplicate specimens / repeated uploads; returns (kept, per-year duplicate report)"""
+    kept, report = deduplicate(records, kind)
+    return kept, report.assign(source=kind)
+
+
+@traced("pipeline.gbif_yearly_biodiversity")
+def gbif_yearly_biodiversity(gbif_wg, min_occurrences=MIN_OCCURRENCES, smooth_window=3):
+    """Yearly richness, occurrences and sampling-corrected richness
+
+    Besides the species_per_1000_occ ratio, adds rarefied richness at the
+    smallest retained yearly sample size and the Chao1/ACE estimators.
+    """
+    estimates = richness_estimates(gbif_wg["year"], gbif_wg["species"], min_occurrences=min_occurrences)
+    biodiversity = estimates[["species_richness", "occurrences"]].rename_axis("year").reset_index()
+
+    biodiversity["species_per_1000_occ"] = (
+        biodiversity["species_richness"] / biodiversity["occurrences"] * 1000
+    )
+
+    # Remove years with too few observations (noise control)
+    keep = (biodiversity["occurrences"] >= min_occurrences).to_numpy()
+    biodiversity = biodiversity[keep].reset_index(drop=True)
+
+    biodiversity["species_per_1000_occ_smooth"] = (
+        biodiversity["species_per_1000_occ"].rolling(window=smooth_window, min_periods=1).mean()
+    )
+    for column in ("rarefied_richness", "chao1", "ace", "rarefaction_depth"):
+        biodiversity[column] = estimates[column].to_numpy()[keep]
+    return biodiversity
+
+
+def assign_ndvi_region(lat, lon, regions=NDVI_REGIONS):
+    """Most specific (smallest) NDVI region containing each point, else OTHER_REGION"""
+    lat, lon = np.asarray(lat, np.float64), np.asarray(lon, np.float64)
+    assigned = np.full(len(lat), OTHER_REGION, dtype=object)
+    by_area = sorted(regions.items(), key=lambda item: -(item[1][2] - item[1][0]) * (item[1][3] - item[1][1]))
+    for region, (lon_min, lat_min, lon_max, lat_max) in by_area:  # smaller regions overwrite larger ones
+        assigned[(lat >= lat_min) & (lat <= lat_max) & (lon >= lon_min) & (lon <= lon_max)] = region
+    return assigned
+
+
+@traced("pipeline.species_matrix")
+def species_matrix(gbif_wg, years=GBIF_YEARS):
+    """Sparse species × (NDVI region, year) occurrence counts"""
+    regions = assign_ndvi_region(gbif_wg["decimalLatitude"], gbif_wg["decimalLongitude"])
+    return build_species_matrix(gbif_wg["species"], gbif_wg["year"], regions, year_range=years)
+
+
+@traced("pipeline.feature_inputs")
+def feature_inputs(gbif_wg, audio_wg, ndvi, years=FUSION_YEARS):
+    """Per (region, year) inputs of the feature store: NDVI, GBIF/iNaturalist sampling and BirdCLEF recordings
+
+    iNaturalist observations are the GBIF records with institutionCode "iNaturalist"
+    (NaN when the download has no institutionCode column). Dated BirdCLEF
+    recordings are counted per region-year; without dates every year of a
+    region gets its total recordings.
+    """
+    gbif = gbif_wg[gbif_wg["year"].between(*years)]
+    occurrences = pd.DataFrame({
+        "region": assign_ndvi_region(gbif["decimalLatitude"], gbif["decimalLongitude"]),
+        "year": gbif["year"].astype(int).to_numpy(),
+        "species": gbif["species"].to_numpy(),
+    })
+    keys = ["region", "year"]
+    table = occurrences.groupby(keys).agg(occurrences=("species", "size"), species_richness=("species", "nunique"))
+    if "institutionCode" in gbif.columns:
+        inat = occurrences[gbif["institutionCode"].eq("iNaturalist").to_numpy()]
+        table = table.join(inat.groupby(keys).agg(inat_occurrences=("species", "size"),
+                                                  inat_species=("species", "nunique")))
+    else:
+        table = table.assign(inat_occurrences=np.nan, inat_species=np.nan)
+
+    # Every region × year, including years without records
+    index = pd.MultiIndex.from_product([[*NDVI_REGIONS, OTHER_REGION], range(years[0], years[1] + 1)], names=keys)
+    table = table.reindex(index)
+    counts = ["occurrences", "species_richness"] + (["inat_occurrences", "inat_species"]
+                                                    if "institutionCode" in gbif.columns else [])
+    table[counts] = table[counts].fillna(0).astype(np.int64)
+    table = table.join(ndvi.set_index(keys)[["ndvi_mean", "ndvi_std"]]).reset_index()
+
+    recordings = pd.DataFrame({
+        "region": assign_ndvi_region(audio_wg["latitude"], audio_wg["longitude"]),
+        "year": (pd.to_datetime(audio_wg["date"], errors="coerce").dt.year.to_numpy()
+                 if "date" in audio_wg.columns else np.nan),
+        "recording": 1,
+    })
+    if recordings["year"].notna().any():
+        # Recordings within each region-year window [year, year + 1)
+        counted = align.window_join(table, recordings, on="year", by="region", window=(0, 1), how="count",
+                                    columns=["recording"])
+        table["bird_recordings"] = counted["recording_count"].astype(int)
+    else:
+        table["bird_recordings"] = table["region"].map(recordings["region"].value_counts()).fillna(0).astype(int)
+    return table
+
+
+@traced("pipeline.gbif_region_yearly_richness")
+def gbif_region_yearly_richness(gbif_wg, regions=NDVI_REGIONS, min_occurrences=MIN_OCCURRENCES):
+    """Richness estimators per NDVI region and year (regions may overlap)"""
+    tables = []
+    for region, (lon_min, lat_min, lon_max, lat_max) in regions.items():
+        inside = gbif_wg[
+            gbif_wg["decimalLatitude"].between(lat_min, lat_max) &
+            gbif_wg["decimalLongitude"].between(lon_min, lon_max)
+        ]
+        if len(inside):
+            estimates = richness_estimates(inside["year"], inside["species"], min_occurrences=min_occurrences)
+            tables.append(estimates.rename_axis("year").reset_index().assign(region=region))
+    if not tables:
+        return pd.DataFrame(columns=["region", "year", "occurrences", "species_richness", "rarefied_richness",
+                                     "chao1", "ace", "rarefaction_depth"])
+    table = pd.concat(tables, ignore_index=True)
+    return table[["region"] + [c for c in table.columns if c != "region"]]
+
+
+@traced("pipeline.load_birdclef_metadata")
+def load_birdclef_metadata(path):
+    return schema.read_csv(path, "birdclef_metadata")
+
+
+@traced("pipeline.filter_audio_western_ghats")
+def filter_audio_western_ghats(df_audio):
+    df_audio = df_audio.assign(
+        latitude=pd.to_numeric(df_audio["latitude"], errors="coerce"),
+        longitude=pd.to_numeric(df_audio["longitude"], errors="coerce"),
+    ).dropna(subset=["latitude", "longitude", "primary_label"])
+
+    return df_audio[
+        df_audio["latitude"].between(WG_LAT_MIN, WG_LAT_MAX) &
+        df_audio["longitude"].between(WG_LON_MIN, WG_LON_MAX)
+    ]
+
+
+@traced("pipeline.audio_species_richness")
+def audio_species_richness(audio_wg):
+    richness = audio_wg.groupby("primary_label").size().reset_index(name="num_recordings")
+    richness["normalized_audio_strength"] = richness["num_recordings"] / richness["num_recordings"].max()
+    return richness
+
+
+@traced("pipeline.audio_signal_summary")
+def audio_signal_summary(audio_species):
+    # Final audio strength (static regional signal)
+    return pd.DataFrame({"audio_signal_strength": [audio_species["normalized_audio_strength"].mean()]})
+
+# --------------------------------------------------
+# Fusion (notebook 3)
+# --------------------------------------------------
+@traced("pipeline.ndvi_yearly")
+def ndvi_yearly(ndvi):
+    """Aggregate NDVI across all regions by year"""
+    return (
+        ndvi.groupby("year")
+        .agg(ndvi_mean=("ndvi_mean", "mean"), ndvi_std=("ndvi_std", "mean"))
+        .reset_index()
+    )
+
+
+@traced("pipeline.fuse_modalities")
+def fuse_modalities(gbif_yearly, ndvi_by_year, audio_summary, years=FUSION_YEARS):
+    """Align GBIF with the NDVI period and broadcast the regional audio summary
+
+    audio_summary is a one-row frame; every column it has (audio signal and,
+    for the enhanced summary, species stress indicators) is broadcast.
+    """
+    gbif_recent = gbif_yearly[gbif_yearly["year"].between(*years)].copy()
+    gbif_recent["year"] = gbif_recent["year"].astype(int)
+    audio = audio_summary.drop(columns=["top5_species_count"], errors="ignore").iloc[0]
+
+    fusion = gbif_recent.merge(ndvi_by_year, on="year", how="inner")
+    for column, value in audio.items():
+        fusion[column] = value
+    return fusion
+
+
+@traced("pipeline.add_stress_indicators")
+def add_stress_indicators(fusion, weights=STRESS_WEIGHTS):
+    """Eco-stress index, environmental stress and biodiversity decline columns"""
+    environment, species, critical, sampling = weights
+    fusion = fusion.copy()
+    species_stress = fusion.get("species_stress_index", 1 - fusion["audio_signal_strength"])
+    critical_stress = fusion.get("critical_species_stress", 0.0)
+
+    fusion["eco_stress_index"] = (
+        (1 - fusion["ndvi_mean"]) * environment +
+        species_stress * species +
+        critical_stress * critical +
+        (fusion["occurrences"] / fusion["occurrences"].max()) * sampling
+    )
+    fusion["environmental_stress"] = 1 - fusion["ndvi_mean"]
+    baseline = fusion[TARGET].iloc[0]
+    fusion["biodiversity_decline"] = ((baseline - fusion[TARGET]) / baseline).clip(lower=0)
+    return fusion
+
+# --------------------------------------------------
+# Training (notebook 3)
+# --------------------------------------------------
+@traced("pipeline.train_models")
+def train_models(fusion, features=FEATURES, target=TARGET, random_state=42):
+    """Linear Regression baseline and Random Forest; returns (results, importances, models)"""
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.linear_model import LinearRegression
+    from sklearn.metrics import mean_squared_error, r2_score
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+
+    X, y = fusion[features], fusion[target]
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.25, random_state=random_state)
+
+    with tracing.span("pipeline.train_models.linear_regression"):
+        scaler = StandardScaler().fit(X_train)
+        lr = LinearRegression().fit(scaler.transform(X_train), y_train)
+        y_pred_lr = lr.predict(scaler.transform(X_test))
+
+    with tracing.span("pipeline.train_models.random_forest"):
+        rf = RandomForestRegressor(n_estimators=300, random_state=random_state).fit(X_train, y_train)
+        y_pred_rf = rf.predict(X_test)
+
+    results = pd.DataFrame({
+        "Model": ["Linear Regression", "Random Forest"],
+        "RMSE": [np.sqrt(mean_squared_error(y_test, y_pred_lr)), np.sqrt(mean_squared_error(y_test, y_pred_rf))],
+        "R2": [r2_score(y_test, y_pred_lr), r2_score(y_test, y_pred_rf)],
+    })
+    importances = pd.Series(rf.feature_importances_, index=features).sort_values(ascending=False)
+    return results, importances, {"linear_regression": lr, "scaler": scaler, "random_forest": rf}
+
+
+def region_targets(inputs, target=TARGET, min_occurrences=MIN_OCCURRENCES):
+    """Next year's species_per_1000_occ of each (region, year) row (NaN below min_occurrences or in the last year)"""
+    if target != TARGET:
+        raise ValueError(f"feature store models predict {TARGET}")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratio = np.where(inputs["occurrences"] >= min_occurrences,
+                         inputs["species_richness"] / inputs["occurrences"] * 1000, np.nan)
+    current = pd.Series(ratio, index=pd.MultiIndex.from_frame(inputs[["region", "year"]]))
+    following = pd.MultiIndex.from_arrays([inputs["region"], inputs["year"] + 1])
+    return pd.DataFrame({"region": inputs["region"].to_numpy(), "year": inputs["year"].to_numpy(),
+                         f"next_{target}": current.reindex(following).to_numpy()})
+
+
+@traced("pipeline.train_feature_model")
+def train_feature_model(store, targets, version=None, random_state=42):
+    """Random Forest on the feature store's point-in-time view; returns (model, metadata)
+
+    Features are read with store.as_of(version), so a retrain on the same
+    version sees exactly the rows the first one did. The metadata records the
+    version, feature names and definitions hash that serving must match.
+    """
+    from sklearn.ensemble import RandomForestRegressor
+
+    version = store.version if version is None else version
+    target = [c for c in targets.columns if c not in ("region", "year")][0]
+    frame = store.as_of(version).merge(targets, on=["region", "year"], how="inner").dropna(subset=[target])
+    if not len(frame):
+        raise ValueError(f"no feature store rows with a {target} target at version {version}")
+    # Random forests split on missing values (e.g. ndvi_change in a region's first year)
+    model = RandomForestRegressor(n_estimators=300, random_state=random_state).fit(frame[store.names],
+                                                                                   frame[target])
+    metadata = {
+        "feature_store_version": version,
+        "feature_definitions": definitions_hash(store.names),
+        "features": list(store.names),
+        "target": target,
+        "training_samples": len(frame),
+        "importance": dict(zip(store.names, model.feature_importances_.round(6).tolist())),
+    }
+    return model, metadata
+
+
+def predict_latest(store, model, metadata):
+    """Serve predictions for every region's latest year from store.latest(), the features training read"""
+    if store.stale or definitions_hash(metadata["features"]) != metadata["feature_definitions"]:
+        raise ValueError("feature definitions changed since the model was trained; rematerialize and retrain")
+    features = store.latest(metadata["features"])
+    features = features[features["year"] == features.groupby("region")["year"].transform("max")]
+    features = features.reset_index(drop=True)
+    return features[["region", "year"]].assign(**{
+        f"predicted_{metadata['target']}": model.predict(features[metadata["features"]]),
+        "feature_store_version": store.version,
+    })
+
+# --------------------------------------------------
+# End-to-end run
+# --------------------------------------------------
+@traced("pipeline.run")
+def run_pipeline(gbif_path, audio_path, ndvi_path, output_dir=".", enhanced_audio_path=None, target=TARGET,
+                 ndvi_points_path=None):
+    output_dir = Path(output_dir)
+    (output_dir / "data").mkdir(parents=True, exist_ok=True)
+
+    gbif_wg, gbif_duplicates = deduplicate_records(filter_gbif_western_ghats(load_gbif_occurrences(gbif_path)), "gbif")
+    gbif_yearly = gbif_yearly_biodiversity(gbif_wg)
+    region_richness = gbif_region_yearly_richness(gbif_wg)
+    matrix = species_matrix(gbif_wg)
+    audio_wg, audio_duplicates = deduplicate_records(filter_audio_western_ghats(load_birdclef_metadata(audio_path)),
+                                                     "birdclef")
+    audio_species = audio_species_richness(audio_wg)
+    audio_summary = audio_signal_summary(audio_species)
+    ndvi = pd.read_csv(ndvi_path)
+    inputs = feature_inputs(gbif_wg, audio_wg, ndvi)
+
+    # The enhanced (species-specific) audio summary carries the species stress indicators
+    fusion_audio = pd.read_csv(enhanced_audio_path) if enhanced_audio_path else audio_summary
+    fusion = add_stress_indicators(fuse_modalities(gbif_yearly, ndvi_yearly(ndvi), fusion_audio))
+    results, importances, _ = train_models(fusion, target=target)
+
+    with tracing.span("pipeline.write_outputs"):
+        gbif_yearly.to_csv(output_dir / "data/gbif_biodiversity_yearly_WESTERN_GHATS.csv", index=False)
+        region_richness.to_csv(output_dir / "data/gbif_richness_region_yearly_WESTERN_GHATS.csv", index=False)
+        matrix.save(output_dir / MATRIX_DIR)
+        inputs.to_csv(output_dir / INPUTS_PATH, index=False)
+        pd.concat([gbif_duplicates, audio_duplicates])[["source", "year", "records", "exact_duplicates",
+                                                         "near_duplicates", "kept"]].to_csv(
+            output_dir / "data/dedup_report_WESTERN_GHATS.csv", index=False)
+        audio_species.to_csv(output_dir / "data/audio_species_richness_WESTERN_GHATS.csv", index=False)
+        audio_summary.to_csv(output_dir / "data/audio_signal_summary_WESTERN_GHATS.csv", index=False)
+        fusion.to_csv(output_dir / "fusion_multimodal_dataset.csv", index=False)
+        results.to_csv(output_dir / "model_results_summary.csv", index=False)
+        importances.to_csv(output_dir / "feature_importance.csv", header=["importance"])
+
+    # Partitioned copies (hotspot/region/year) for consumers that read only a selection
+    with tracing.span("pipeline.write_datasets"):
+        root = output_dir / partitioned.DATASET_DIR
+        occurrence_columns = [c for c in ["species", "decimalLatitude", "decimalLongitude", "year", "eventDate",
+                                          "basisOfRecord", "institutionCode"] if c in gbif_wg.columns]
+        occurrences = gbif_wg[occurrence_columns].assign(
+            region=assign_ndvi_region(gbif_wg["decimalLatitude"], gbif_wg["decimalLongitude"]))
+        partitioned.write_dataset(occurrences, "occurrences", root, sort_by=["species"])
+        partitioned.write_dataset(region_richness, "gbif_region_yearly", root)
+        partitioned.write_dataset(gbif_yearly, "gbif_yearly", root)
+        partitioned.write_dataset(inputs, "feature_inputs", root)
+        partitioned.write_dataset(fusion, "fusion", root)
+
+    # Only region-years whose inputs changed since the last run are recomputed
+    with tracing.span("pipeline.feature_store") as span:
+        store = FeatureStore(output_dir / FEATURE_STORE_PATH)
+        span.set(**store.materialize(inputs))
+
+    # The v2 model trains on the store's current version and serves from its latest view
+    targets = region_targets(inputs)
+    if targets[f"next_{TARGET}"].notna().any():
+        model, model_metadata = train_feature_model(store, targets)
+        with tracing.span("pipeline.write_feature_model"):
+            (output_dir / FEATURE_MODEL_PATH).parent.mkdir(parents=True, exist_ok=True)
+            with open(output_dir / FEATURE_MODEL_PATH, "wb") as handle:
+                pickle.dump(model, handle)
+            (output_dir / FEATURE_MODEL_METADATA_PATH).write_text(json.dumps(model_metadata, indent=2))
+            predict_latest(store, model, model_metadata).to_csv(output_dir / FEATURE_PREDICTIONS_PATH, index=False)
+
+    with tracing.span("pipeline.spatial_grid"):
+        from ecofusion.spatial import GRID_DIR, GridAccumulator, RegularGrid  # spatial imports this module
+
+        grid = GridAccumulator(RegularGrid())
+        grid.add_occurrences(gbif_wg["decimalLatitude"], gbif_wg["decimalLongitude"], gbif_wg["year"], gbif_wg["species"])
+        grid.save(output_dir / GRID_DIR)
+
+    if ndvi_points_path:
+        samples = pd.read_csv(ndvi_points_path)
+        if "region" not in samples.columns:
+            samples["region"] = assign_ndvi_region(samples["lat"], samples["lon"])
+        with tracing.span("pipeline.ndvi_surface"):
+            from ecofusion.interpolate import interpolate_store
+
+            interpolate_store(output_dir / GRID_DIR, samples)
+        with tracing.span("pipeline.ndvi_sketches"):
+            from ecofusion.sketch import SKETCH_PATH, DigestSet
+
+            DigestSet.from_samples(samples, ["region", "year"]).save(output_dir / SKETCH_PATH)
+    return fusion, results, importances
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the EcoFusionAI ingestion → fusion → training pipeline")
+    parser.add_argument("--gbif", required=True, help="GBIF occurrence download (tab separated)")
+    parser.add_argument("--audio", required=True, help="BirdCLEF train_metadata.csv")
+    parser.add_argument("--ndvi", required=True, help="NDVI region-year table from notebook 1")
+    parser.add_argument("--ndvi-points",
+                        help="per-point NDVI samples (lat, lon, year, ndvi) to grid by IDW and sketch per region-year")
+    parser.add_argument("--enhanced-audio", help="species-specific audio summary with stress indicators")
+    parser.add_argument("--output-dir", default=".")
+    parser.add_argument("--target", default=TARGET, choices=[TARGET, "rarefied_richness", "chao1", "ace"],
+                        help="richness measure the models predict")
+    parser.add_argument("--trace-jsonl", help="append stage spans to this JSON lines file")
+    parser.add_argument("--chrome-trace", help="write a Chrome trace of the run")
+    args = parser.parse_args(argv)
+
+    if args.trace_jsonl or args.chrome_trace:
+        tracing.enable()
+
+    fusion, results, importances = run_pipeline(
+        args.gbif, args.audio, args.ndvi, args.output_dir, args.enhanced_audio, args.target, args.ndvi_points
+    )
+    print(f"✅ Fusion dataset: {fusion.shape[0]} years × {fusion.shape[1]} columns")
+    print(results.to_string(index=False))
+
+    if tracing.is_enabled():
+        print("\n⏱️ Stage timings:")
+        for name, stats in tracing.summary().items():
+            print(f"  {name:<48} {stats['total_ms']:10.1f} ms ({stats['count']}×)")
+    if args.chrome_trace:
+        tracing.export_chrome_trace(args.chrome_trace)
+    if args.trace_jsonl:
+        tracing.export_jsonl(args.trace_jsonl)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Sample-size-robust species richness estimators
+Rarefied richness at a common sample size, Chao1 and ACE, computed for many
+cells (years, region-years, grid cells) at once from species-frequency
+vectors. The frequency vectors are kept flat (one entry per cell × species
+with its count), and the rarefaction terms use log-gamma, so the cost is one
+pass over the distinct cell-species pairs.
+
+The ratio species_richness / occurrences * 1000 shrinks as sampling grows;
+rarefaction compares every cell at the same number of occurrences instead.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.special import gammaln
+
+RARE_THRESHOLD = 10  # ACE: species with at most this many occurrences are "rare"
+
+
+def frequency_vectors(cells, species):
+    """Flat species-frequency vectors from one row per occurrence
+
+    Returns (cell_labels, entry_cell, entry_count): entry_cell/entry_count hold
+    one entry per distinct (cell, species) pair.
+    """
+    cell_codes, cell_labels = pd.factorize(np.asarray(cells), sort=True)
+    species_codes, species_labels = pd.factorize(np.asarray(species))
+    keep = (cell_codes >= 0) & (species_codes >= 0)
+    n_species = max(len(species_labels), 1)
+
+    # Sorted (cell, species) keys: each run of equal keys is one frequency entry
+    keys = np.sort(cell_codes[keep].astype(np.int64) * n_species + species_codes[keep], kind="stable")
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))[:len(keys)]
+    entry_count = np.diff(np.append(starts, len(keys)))
+    return cell_labels, keys[starts] // n_species, entry_count
+
+
+def _log_binomial(n, k):
+    return gammaln(n + 1) - gammaln(k + 1) - gammaln(n - k + 1)
+
+
+def rarefied_richness(entry_cell, entry_count, n_cells, sample_size):
+    """Expected species in a random subsample of sample_size occurrences (Hurlbert 1971)
+
+    E[S_m] = Σ_i 1 - C(N - N_i, m) / C(N, m); NaN for cells with fewer than m occurrences.
+    """
+    totals = np.bincount(entry_cell, weights=entry_count, minlength=n_cells)
+    n = totals[entry_cell]
+    remaining = n - entry_count
+    with np.errstate(invalid="ignore"):
+        log_ratio = _log_binomial(remaining, sample_size) - _log_binomial(n, sample_size)
+    # C(N - N_i, m) is zero when fewer than m occurrences remain outside species i
+    miss = np.where(remaining >= sample_size, np.exp(log_ratio), 0.0)
+    expected = np.bincount(entry_cell, weights=1.0 - miss, minlength=n_cells)
+    return np.where(totals >= sample_size, expected, np.nan)
+
+
+def _frequency_counts(entry_cell, entry_count, n_cells, max_k=RARE_THRESHOLD):
+    """F[c, k] = number of species seen exactly k times in cell c (k ≤ max_k; column 0 unused)"""
+    capped = np.minimum(entry_count, max_k + 1)
+    counts = np.bincount(entry_cell * (max_k + 2) + capped, minlength=n_cells * (max_k + 2))
+    return counts.reshape(n_cells, max_k + 2)[:, :max_k + 1]
+
+
+def chao1(entry_cell, entry_count, n_cells):
+    """Bias-corrected Chao1: S_obs + (N-1)/N · F1(F1-1) / (2(F2+1))"""
+    observed = np.bincount(entry_cell, minlength=n_cells)
+    totals = np.bincount(entry_cell, weights=entry_count, minlength=n_cells)
+    freq = _frequency_counts(entry_cell, entry_count, n_cells, max_k=2)
+    f1, f2 = freq[:, 1], freq[:, 2]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        correction = np.where(totals > 0, (totals - 1) / totals, 0.0)
+    return observed + correction * f1 * (f1 - 1) / (2 * (f2 + 1))
+
+
+def ace(entry_cell, entry_count, n_cells, rare_threshold=RARE_THRESHOLD):
+    """Abundance-based Coverage Estimator (Chao & Lee 1992); NaN when every rare species is a singleton"""
+    rare = entry_count <= rare_threshold
+    s_abund = np.bincount(entry_cell[~rare], minlength=n_cells)
+    s_rare = np.bincount(entry_cell[rare], minlength=n_cells)
+    n_rare = np.bincount(entry_cell[rare], weights=entry_count[rare], minlength=n_cells)
+
+    freq = _frequency_counts(entry_cell, entry_count, n_cells, rare_threshold)
+    k = np.arange(rare_threshold + 1)
+    f1 = freq[:, 1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        coverage = 1 - f1 / n_rare
+        gamma_sq = np.maximum(
+            s_rare / coverage * (freq * k * (k - 1)).sum(axis=1) / (n_rare * (n_rare - 1)) - 1, 0
+        )
+        estimate = s_abund + s_rare / coverage + f1 / coverage * gamma_sq
+    estimate = np.where(coverage > 0, estimate, np.nan)
+    # No rare species: nothing left to extrapolate
+    return np.where(s_rare == 0, s_abund, estimate)
+
+
+def default_sample_size(totals, min_occurrences=20):
+    """Smallest cell total among cells with at least min_occurrences (the usual rarefaction depth)"""
+    eligible = totals[totals >= min_occurrences]
+    return int(eligible.min()) if len(eligible) else int(min_occurrences)
+
+
+def richness_estimates(cells, species, sample_size=None, min_occurrences=20):
+    """Observed, rarefied, Chao1 and ACE richness per cell, from one (cell, species) pair per occurrence"""
+    labels, entry_cell, entry_count = frequency_vectors(cells, species)
+    n_cells = len(labels)
+    totals = np.bincount(entry_cell, weights=entry_count, minlength=n_cells).astype(np.int64)
+    if sample_size is None:
+        sample_size = default_sample_size(totals, min_occurrences)
+    return pd.DataFrame({
+        "occurrences": totals,
+        "species_richness": np.bincount(entry_cell, minlength=n_cells),
+        "rarefied_richness": rarefied_richness(entry_cell, entry_count, n_cells, sample_size),
+        "chao1": chao1(entry_cell, entry_count, n_cells),
+        "ace": ace(entry_cell, entry_count, n_cells),
+        "rarefaction_depth": sample_size,
+    }, index=labels)
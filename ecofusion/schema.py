@@ -0,0 +1,303 @@
+"""
+Declared in-memory schema of every table the dashboard and pipeline load
+Each table lists the compact type of its columns: regions and species codes
+are categoricals (with one dictionary per domain shared across tables), years
+are int16, counts int32 and measured values float32 where the dashboard shows
+at most a few decimals. Coordinates stay float64, because the duplicate
+fingerprints round them to 5 decimals. Columns a table does not declare are
+kept as read.
+
+The schema is enforced when a table is loaded: a value that does not fit its
+declared type (a fractional year, a missing count, an unknown threat level)
+raises SchemaError instead of being silently coerced.
+
+Usage:
+    python -m ecofusion.schema report             # memory per table: default pandas types vs declared schema
+    python -m ecofusion.schema report --columns   # ... and per column
+    python -m ecofusion.schema report --gbif occurrence.txt --birdclef train_metadata.csv
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+class SchemaError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Categorical:
+    """Dictionary-encoded strings; tables that declare the same domain share one dictionary"""
+
+    domain: str
+    categories: tuple = ()  # fixed vocabulary; empty means learned from the data
+
+    def __str__(self):
+        return f"category[{self.domain}]"
+
+
+REGION = Categorical("region")
+SPECIES_CODE = Categorical("species_code")  # eBird codes (BirdCLEF primary_label)
+THREAT_LEVEL = Categorical("threat_level", ("CRITICAL", "HIGH", "MEDIUM", "LOW"))
+
+_RICHNESS = {
+    "year": "int16",
+    "species_richness": "int32",
+    "occurrences": "int32",
+    "species_per_1000_occ": "float32",
+    "species_per_1000_occ_smooth": "float32",
+    "rarefied_richness": "float32",
+    "chao1": "float32",
+    "ace": "float32",
+    "rarefaction_depth": "float32",  # NaN when no year reaches the rarefaction depth
+}
+
+_AUDIO_SUMMARY = {
+    "audio_signal_strength": "float32",
+    "species_stress_index": "float32",
+    "critical_species_stress": "float32",
+    "high_species_stress": "float32",
+    "top5_species_count": "int16",
+}
+
+# --------------------------------------------------
+# Declared schemas: table -> {column: dtype}
+# (dashboard store tables first, then the raw pipeline exports)
+# --------------------------------------------------
+SCHEMAS = {
+    "fusion": {
+        **_RICHNESS,
+        "ndvi_mean": "float32",
+        "ndvi_std": "float32",
+        **_AUDIO_SUMMARY,
+        "eco_stress_index": "float32",
+        "environmental_stress": "float32",
+        "biodiversity_decline": "float32",
+    },
+    "model_results": {"Model": "str", "RMSE": "float64", "R2": "float64"},  # two rows; metrics kept exact
+    "feature_importance": {"importance": "float32"},
+    "audio_species": {"primary_label": SPECIES_CODE, "num_recordings": "int32", "normalized_audio_strength": "float32"},
+    "audio_summary": _AUDIO_SUMMARY,
+    "gbif": _RICHNESS,
+    "species_stress": {
+        "species_code": SPECIES_CODE,
+        "species_name": "str",
+        "recordings": "int32",
+        "audio_strength": "float32",
+        "weight": "float32",
+        "threat_level": THREAT_LEVEL,
+        "species_stress": "float32",
+        "weighted_contribution": "float32",
+    },
+    "ndvi": {"region": REGION, "year": "int16", "ndvi_mean": "float32", "ndvi_std": "float32", "num_samples": "int32"},
+    # Raw exports: only the declared columns are read; blanks are allowed in the nullable integers
+    "gbif_occurrences": {
+        "gbifID": "int64",
+        "species": Categorical("species"),
+        "decimalLatitude": "float64",
+        "decimalLongitude": "float64",
+        "year": "Int16",
+        "month": "Int8",
+        "day": "Int8",
+        "eventDate": "str",
+        "basisOfRecord": Categorical("basis_of_record"),
+        "institutionCode": Categorical("institution"),
+        "recordedBy": Categorical("recordist"),
+        "catalogNumber": "str",
+    },
+    "birdclef_metadata": {
+        "primary_label": SPECIES_CODE,
+        "latitude": "float64",
+        "longitude": "float64",
+        "author": Categorical("recordist"),
+        "date": "str",
+        "rating": "float32",
+        "filename": "str",
+    },
+}
+
+
+def fingerprint(name):
+    """Short hash of a table's declaration (part of the store's staleness check)"""
+    declaration = json.dumps({column: str(dtype) for column, dtype in SCHEMAS[name].items()}, sort_keys=True)
+    return hashlib.sha256(declaration.encode()).hexdigest()[:12]
+
+# --------------------------------------------------
+# Enforcement
+# --------------------------------------------------
+def _integers(values, dtype):
+    numbers = pd.to_numeric(values, errors="coerce" if dtype[0] == "I" else "raise")
+    present = numbers.dropna().to_numpy(np.float64)
+    if dtype[0] == "i" and len(present) < len(numbers):
+        raise SchemaError(f"{len(numbers) - len(present)} missing values in a non-nullable {dtype} column")
+    if not np.all(np.mod(present, 1) == 0):
+        raise SchemaError(f"fractional values in an {dtype} column")
+    limits = np.iinfo(dtype.lower())
+    if len(present) and (present.min() < limits.min or present.max() > limits.max):
+        raise SchemaError(f"values outside the {dtype} range")
+    return numbers.astype(dtype)
+
+
+def _categorical(values, declared):
+    if not declared.categories:
+        return values.astype("category")  # categories sorted, as in a learned dictionary
+    unknown = set(values.dropna().unique()) - set(declared.categories)
+    if unknown:
+        raise SchemaError(f"values outside the {declared.domain} vocabulary: {sorted(map(str, unknown))}")
+    return values.astype(pd.CategoricalDtype(declared.categories))
+
+
+def cast(values, dtype):
+    """One column converted to its declared type"""
+    if isinstance(dtype, Categorical):
+        return _categorical(values, dtype)
+    if dtype == "str":
+        return values.astype("str")
+    if dtype.lower().startswith("int"):
+        return _integers(values, dtype)
+    return pd.to_numeric(values).astype(dtype)
+
+
+def enforce(frame, name):
+    """Frame with every declared column of a table cast to its declared type"""
+    columns = {}
+    for column, dtype in SCHEMAS[name].items():
+        if column not in frame.columns:
+            continue  # required columns are checked by the loader
+        try:
+            columns[column] = cast(frame[column], dtype)
+        except (TypeError, ValueError) as e:
+            raise SchemaError(f"{name}.{column}: {e}") from None
+    return frame.assign(**columns)
+
+
+def read_csv(path, name, **options):
+    """Only the declared columns of a raw export, with strings parsed straight into categoricals"""
+    declared = SCHEMAS[name]
+    text = {column: "category" if isinstance(dtype, Categorical) else "str"
+            for column, dtype in declared.items() if isinstance(dtype, Categorical) or dtype == "str"}
+    frame = pd.read_csv(path, usecols=lambda column: column in declared, dtype=text, low_memory=False, **options)
+    return enforce(frame, name)
+
+
+def share_dictionaries(tables):
+    """Recode categorical columns of the same domain onto one sorted dictionary (in place)
+
+    Each table learns its dictionary when it is built; after this, e.g. the
+    species codes of audio_species and species_stress compare, merge and
+    concatenate as the same categorical type.
+    """
+    domains = {}
+    for name, frame in tables.items():
+        for column, dtype in SCHEMAS.get(name, {}).items():
+            if isinstance(dtype, Categorical) and not dtype.categories and column in frame.columns:
+                domains.setdefault(dtype.domain, []).append((frame, column))
+    for members in domains.values():
+        if len(members) < 2:
+            continue
+        categories = sorted(set().union(*(frame[column].cat.categories for frame, column in members)))
+        shared = pd.CategoricalDtype(pd.Index(categories, dtype="str"))
+        for frame, column in members:
+            # Recode explicitly: astype() to an equal dtype would keep the column's own dictionary
+            values = frame[column].cat
+            codes = shared.categories.get_indexer(values.categories)[values.codes]
+            frame[column] = pd.Categorical.from_codes(np.where(values.codes < 0, -1, codes), dtype=shared)
+    return tables
+
+# --------------------------------------------------
+# Memory report
+# --------------------------------------------------
+def memory_usage(frame, seen=None):
+    """Bytes per column (index included), counting string and dictionary payloads
+
+    A categorical counts its codes plus its dictionary values (not the lookup
+    table pandas builds lazily on first use). With a `seen` set, a dictionary
+    shared between columns is only counted the first time it is met.
+    """
+    usage = frame.memory_usage(deep=True)
+    for column in frame.columns:
+        dtype = frame[column].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            shared = seen is not None and id(dtype.categories) in seen
+            dictionary = 0 if shared else pd.Series(dtype.categories).memory_usage(deep=True, index=False)
+            usage[column] = frame[column].cat.codes.to_numpy().nbytes + dictionary
+            if seen is not None:
+                seen.add(id(dtype.categories))
+    return usage
+
+
+def compare_memory(pairs):
+    """Per-table report for {name: (default_frame, compact_frame)}; shared dictionaries count once"""
+    rows = []
+    seen = set()
+    for name, (default, compact) in pairs.items():
+        before, after = memory_usage(default).sum(), memory_usage(compact, seen).sum()
+        rows.append({"table": name, "rows": len(compact), "columns": compact.shape[1],
+                     "default_bytes": int(before), "compact_bytes": int(after), "ratio": before / max(after, 1)})
+    return pd.DataFrame(rows)
+
+
+def _column_report(default, compact):
+    before, after = memory_usage(default), memory_usage(compact)
+    return pd.DataFrame({
+        "default": default.dtypes.astype(str), "compact": compact.dtypes.astype(str),
+        "default_bytes": before.drop("Index"), "compact_bytes": after.drop("Index"),
+    }).fillna({"compact": "not read", "compact_bytes": 0})
+
+
+def _store_pairs():
+    from ecofusion import store
+
+    pairs = {}
+    for name, (csv_name, read_options) in store.TABLES.items():
+        source = store.DATA_ROOT / csv_name
+        if source.exists():
+            pairs[name] = (pd.read_csv(source, **read_options), store.open_frame(name))
+    frames = share_dictionaries({name: compact for name, (_, compact) in pairs.items()})
+    return {name: (default, frames[name]) for name, (default, _) in pairs.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EcoFusionAI declared table schemas")
+    parser.add_argument("command", choices=["report"])
+    parser.add_argument("--columns", action="store_true", help="break every table down per column")
+    parser.add_argument("--gbif", type=Path, help="also measure a GBIF occurrence export (tab separated)")
+    parser.add_argument("--birdclef", type=Path, help="also measure a BirdCLEF train_metadata.csv")
+    args = parser.parse_args(argv)
+
+    pairs = _store_pairs()
+    if args.gbif:
+        pairs["gbif_occurrences"] = (pd.read_csv(args.gbif, sep="\t", low_memory=False),
+                                     read_csv(args.gbif, "gbif_occurrences", sep="\t"))
+    if args.birdclef:
+        pairs["birdclef_metadata"] = (pd.read_csv(args.birdclef), read_csv(args.birdclef, "birdclef_metadata"))
+
+    report = compare_memory(pairs)
+    print("🧮 In-memory size per table: default pandas types → declared schema")
+    print(f"  {'table':<20}{'rows':>10}{'cols':>6}{'default kB':>13}{'compact kB':>13}{'ratio':>8}")
+    for row in report.itertuples():
+        print(f"  {row.table:<20}{row.rows:>10}{row.columns:>6}{row.default_bytes / 1024:>13.1f}"
+              f"{row.compact_bytes / 1024:>13.1f}{row.ratio:>7.1f}×")
+    total_before, total_after = report["default_bytes"].sum(), report["compact_bytes"].sum()
+    print(f"  {'total':<36}{total_before / 1024:>13.1f}{total_after / 1024:>13.1f}"
+          f"{total_before / max(total_after, 1):>7.1f}×")
+
+    if args.columns:
+        for name, (default, compact) in pairs.items():
+            print(f"\n📋 {name}")
+            columns = _column_report(default, compact)
+            for column, row in columns.iterrows():
+                print(f"  {column:<30}{row['default']:>10} → {row['compact']:<10}"
+                      f"{row['default_bytes'] / 1024:>10.1f} kB → {row['compact_bytes'] / 1024:.1f} kB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
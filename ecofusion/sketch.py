@@ -0,0 +1,268 @@
+"""
+Mergeable NDVI distribution sketches (t-digest) per region and period
+Region-year NDVI is otherwise kept as a mean and std only, which says nothing
+about medians, tails or how much of a region is stressed. A t-digest keeps a
+few dozen weighted centroids per group, dense at the tails and coarse in the
+middle, so any quantile or threshold fraction (e.g. the share of samples with
+NDVI < 0.4) can be read back with small rank error in constant memory.
+
+A DigestSet holds the digests of many groups (e.g. every region × year) as
+flat centroid arrays with per-group offsets, so building, merging and
+querying are vectorized over all groups:
+
+- from_samples: one sort of the samples by (group, value), then every
+  group's centroids at once
+- select: the digests of a subset of groups (e.g. the chosen regions)
+- rollup: re-key the groups (all regions per year, a region over all years,
+  decades, ...) and compress the pooled centroids; merging the digests of an
+  incremental update with the stored ones is a rollup on the same keys
+- quantiles / fraction_below: interpolation between centroid centres, exact
+  min and max at the ends
+
+Saved as one Arrow IPC file: the group keys plus count, min, max and list
+columns of float32 centroid means and weights.
+
+Usage:
+    python -m ecofusion.sketch ndvi_point_samples.csv data/ndvi_sketches_WESTERN_GHATS.arrow --by region year
+"""
+
+import argparse
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from ecofusion.store import PUBLISHED_MODE
+
+SKETCH_PATH = "data/ndvi_sketches_WESTERN_GHATS.arrow"
+COMPRESSION = 100  # t-digest δ: at most ~δ/2 centroids per group
+STRESS_NDVI = 0.4
+SUMMARY_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def _k(q, delta):
+    """t-digest k1 scale function: centroids span at most one unit of k, so tails stay fine-grained"""
+    return delta / (2 * np.pi) * np.arcsin(2 * np.clip(q, 0, 1) - 1)
+
+
+def _compress(codes, means, weights, n_groups, delta):
+    """Merge (group code, mean, weight) points into t-digest centroids; returns offsets, means, weights"""
+    order = np.lexsort((means, codes))
+    codes, means, weights = codes[order], means[order], weights[order]
+    totals = np.bincount(codes, weights=weights, minlength=n_groups)
+    cumulative = np.cumsum(weights)
+    starts = np.searchsorted(codes, np.arange(n_groups))
+    before = np.concatenate([[0.0], cumulative])[starts][codes]  # weight of earlier groups
+    q = (cumulative - before - weights / 2) / totals[codes]
+    bucket = np.floor(_k(q, delta)).astype(np.int64)
+    # A new centroid starts wherever the group or its k bucket changes
+    boundary = np.flatnonzero(np.concatenate([[True], (codes[1:] != codes[:-1]) | (bucket[1:] != bucket[:-1])]))
+    merged_weights = np.add.reduceat(weights, boundary) if len(boundary) else np.empty(0)
+    merged_means = np.add.reduceat(means * weights, boundary) / merged_weights if len(boundary) else np.empty(0)
+    offsets = np.searchsorted(codes[boundary], np.arange(n_groups + 1))
+    return offsets, merged_means, merged_weights
+
+
+def _interpolate(keys, ys, targets):
+    """Piecewise-linear y(x) within each group: keys/targets put every group on its own interval [2g, 2g + 1]"""
+    right = np.clip(np.searchsorted(keys, targets, side="left"), 1, len(keys) - 1)
+    left = right - 1
+    span = keys[right] - keys[left]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.where(span > 0, (targets - keys[left]) / span, 0.0)
+    return ys[left] + t * (ys[right] - ys[left])
+
+
+@dataclass(frozen=True)
+class DigestSet:
+    """t-digests of many groups: centroids of group i are means/weights[offsets[i]:offsets[i + 1]]"""
+
+    keys: pd.DataFrame
+    offsets: np.ndarray
+    means: np.ndarray
+    weights: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    delta: float = COMPRESSION
+
+    @classmethod
+    def from_samples(cls, frame, by, value="ndvi", weight=None, delta=COMPRESSION):
+        """One digest per distinct `by` key of the rows of `frame` (missing values are skipped)"""
+        frame = frame[frame[value].notna() & frame[by].notna().all(axis=1)]
+        weights = frame[weight].to_numpy(np.float64) if weight else np.ones(len(frame))
+        values = frame[value].to_numpy(np.float64)
+        return cls._build(frame[by], values, weights, values, values, delta)
+
+    @classmethod
+    def _build(cls, keys, means, weights, minimum, maximum, delta):
+        if len(keys.columns):
+            groups = keys.groupby(list(keys.columns), sort=True, observed=True)
+            codes, unique = groups.ngroup().to_numpy(), groups.size().index.to_frame(index=False)
+        else:
+            codes, unique = np.zeros(len(keys), np.int64), pd.DataFrame(index=range(min(len(keys), 1)))
+        n_groups = len(unique)
+        offsets, merged_means, merged_weights = _compress(codes, means, weights, n_groups, delta)
+        low = np.full(n_groups, np.inf)
+        high = np.full(n_groups, -np.inf)
+        np.minimum.at(low, codes, minimum)
+        np.maximum.at(high, codes, maximum)
+        return cls(unique, offsets, merged_means, merged_weights, low, high, delta)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def count(self):
+        return np.add.reduceat(self.weights, self.offsets[:-1]) if len(self) else np.empty(0)
+
+    @property
+    def mean(self):
+        return np.add.reduceat(self.means * self.weights, self.offsets[:-1]) / self.count if len(self) else np.empty(0)
+
+    def _group_codes(self):
+        return np.repeat(np.arange(len(self)), np.diff(self.offsets))
+
+    def _positions(self):
+        """Rank of every centroid centre as a fraction of its group's weight"""
+        codes = self._group_codes()
+        cumulative = np.cumsum(self.weights)
+        before = np.concatenate([[0.0], cumulative])[self.offsets[:-1]][codes]
+        return (cumulative - before - self.weights / 2) / self.count[codes]
+
+    def _curve(self, xs, ys, low, high):
+        """Every group's piecewise-linear curve on its own key interval [2g, 2g + 1], with (low, high) at the ends"""
+        starts = 2.0 * np.arange(len(self))
+        keys = np.concatenate([starts, 2.0 * self._group_codes() + xs, starts + 1])
+        order = np.argsort(keys, kind="stable")  # ties keep the start point first and the end point last
+        return keys[order], np.concatenate([low, ys, high])[order]
+
+    def select(self, mask):
+        """Digests of the groups where `mask` (one boolean per group) is true"""
+        groups = np.flatnonzero(mask)
+        sizes = np.diff(self.offsets)[groups]
+        centroids = np.repeat(self.offsets[groups] - np.cumsum(np.concatenate([[0], sizes[:-1]])), sizes) \
+            + np.arange(sizes.sum())
+        return DigestSet(self.keys.iloc[groups].reset_index(drop=True), np.concatenate([[0], np.cumsum(sizes)]),
+                         self.means[centroids], self.weights[centroids], self.minimum[groups],
+                         self.maximum[groups], self.delta)
+
+    def rollup(self, by):
+        """Digests of coarser groups: `by` names key columns, or maps new key names to one value per group"""
+        if isinstance(by, dict):
+            keys = pd.DataFrame({name: np.asarray(values) for name, values in by.items()})
+        else:
+            keys = self.keys[list(by)].reset_index(drop=True)
+        codes = self._group_codes()
+        return DigestSet._build(keys.iloc[codes].reset_index(drop=True), self.means, self.weights,
+                                self.minimum[codes], self.maximum[codes], self.delta)
+
+    def merge(self, other):
+        """Digests of both sets, combined where the keys are equal (e.g. stored digests plus an update)"""
+        columns = list(self.keys.columns)
+        return concat([self, other]).rollup(columns)
+
+    def quantiles(self, qs=SUMMARY_QUANTILES):
+        """(groups × len(qs)) array of quantile estimates"""
+        qs = np.atleast_1d(np.asarray(qs, np.float64))
+        if not len(self):
+            return np.empty((0, len(qs)))
+        keys, values = self._curve(self._positions(), self.means, self.minimum, self.maximum)
+        targets = (2.0 * np.arange(len(self))[:, None] + np.clip(qs, 0, 1)[None, :]).ravel()
+        return _interpolate(keys, values, targets).reshape(len(self), len(qs))
+
+    def fraction_below(self, threshold=STRESS_NDVI):
+        """Estimated share of every group's weight below `threshold` (e.g. stressed NDVI)"""
+        if not len(self):
+            return np.empty(0)
+        codes = self._group_codes()
+        span = np.maximum(self.maximum - self.minimum, 1e-12)
+        scaled = np.clip((self.means - self.minimum[codes]) / span[codes], 0, 1)
+        keys, ranks = self._curve(scaled, self._positions(), np.zeros(len(self)), np.ones(len(self)))
+        targets = 2.0 * np.arange(len(self)) + np.clip((threshold - self.minimum) / span, 0, 1)
+        fraction = _interpolate(keys, ranks, targets)
+        return np.where(threshold <= self.minimum, 0.0, np.where(threshold > self.maximum, 1.0, fraction))
+
+    def summary(self, threshold=STRESS_NDVI, qs=SUMMARY_QUANTILES):
+        """Keys with count, mean, min, quantiles (q05 … q95), max and the share below the threshold"""
+        quantiles = self.quantiles(qs)
+        table = self.keys.reset_index(drop=True).assign(count=self.count, mean=self.mean, min=self.minimum)
+        for i, q in enumerate(qs):
+            table[f"q{round(q * 100):02d}"] = quantiles[:, i]
+        return table.assign(max=self.maximum, share_below=self.fraction_below(threshold))
+
+    def save(self, path=SKETCH_PATH):
+        """Write the digests to one Arrow IPC file (float32 centroids, atomically replaced)"""
+        offsets = pa.array(self.offsets.astype(np.int32))
+        table = pa.Table.from_pandas(self.keys.reset_index(drop=True), preserve_index=False).append_column(
+            "count", pa.array(self.count)).append_column("min", pa.array(self.minimum)).append_column(
+            "max", pa.array(self.maximum)).append_column(
+            "means", pa.ListArray.from_arrays(offsets, pa.array(self.means.astype(np.float32)))).append_column(
+            "weights", pa.ListArray.from_arrays(offsets, pa.array(self.weights.astype(np.float32))))
+        table = table.replace_schema_metadata({"delta": str(self.delta)})
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            os.chmod(tmp_name, PUBLISHED_MODE)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+
+def concat(sets):
+    """All digests of several sets side by side (keys may repeat; rollup/merge combines them)"""
+    sets = [s for s in sets if len(s)]
+    if not sets:
+        raise ValueError("no digests to concatenate")
+    ends = np.cumsum([0] + [s.offsets[-1] for s in sets])
+    return DigestSet(
+        pd.concat([s.keys for s in sets], ignore_index=True),
+        np.concatenate([[0]] + [s.offsets[1:] + end for s, end in zip(sets, ends)]),
+        np.concatenate([s.means for s in sets]),
+        np.concatenate([s.weights for s in sets]),
+        np.concatenate([s.minimum for s in sets]),
+        np.concatenate([s.maximum for s in sets]),
+        sets[0].delta,
+    )
+
+
+def open_sketches(path=SKETCH_PATH):
+    with pa.memory_map(str(path), "r") as source:
+        table = ipc.open_file(source).read_all()
+    means, weights = table.column("means").combine_chunks(), table.column("weights").combine_chunks()
+    keys = table.drop_columns(["count", "min", "max", "means", "weights"]).to_pandas()
+    return DigestSet(keys, means.offsets.to_numpy().astype(np.int64), means.values.to_numpy().astype(np.float64),
+                     weights.values.to_numpy().astype(np.float64), table.column("min").to_numpy(),
+                     table.column("max").to_numpy(), float(table.schema.metadata[b"delta"]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build per-group NDVI t-digests from samples")
+    parser.add_argument("samples", type=Path, help="CSV of samples with the key columns and an ndvi column")
+    parser.add_argument("output", type=Path, nargs="?", default=Path(SKETCH_PATH))
+    parser.add_argument("--by", nargs="+", default=["region", "year"], help="key columns")
+    parser.add_argument("--value", default="ndvi")
+    parser.add_argument("--merge", action="store_true", help="merge into the digests already stored at output")
+    parser.add_argument("--delta", type=float, default=COMPRESSION, help="t-digest compression")
+    args = parser.parse_args(argv)
+
+    samples = pd.read_csv(args.samples, usecols=[*args.by, args.value])
+    digests = DigestSet.from_samples(samples, args.by, args.value, delta=args.delta)
+    if args.merge and args.output.exists():
+        digests = open_sketches(args.output).merge(digests)
+    digests.save(args.output)
+    print(f"✅ {len(digests)} digests ({len(digests.means)} centroids) from {len(samples)} samples → {args.output}")
+    print(digests.summary().head(10).round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+Gridded spatial aggregation
+Occurrence, recording and NDVI coordinates are assigned to integer cell IDs on
+a regular lat/lon or hexagonal grid, then reduced per cell × year with
+np.bincount. Points can be fed in chunks, so binning any number of points is a
+single streaming pass with memory bounded by the grid (plus the distinct
+cell-year-species keys needed for exact richness).
+
+Results are saved as a directory of .npy arrays (cells × years) that the
+dashboard memory-maps directly. An NDVI surface interpolated from point
+samples (ecofusion.interpolate) can be saved into the same directory and then
+takes the place of the binned NDVI means.
+
+Usage:
+    python -m ecofusion.spatial occurrence.txt data/spatial_grid_WESTERN_GHATS --cell-deg 0.25
+"""
+
+import argparse
+import json
+import math
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ecofusion.pipeline import GBIF_YEARS, STRESS_WEIGHTS, WG_LAT_MAX, WG_LAT_MIN, WG_LON_MAX, WG_LON_MIN
+
+GRID_DIR = "data/spatial_grid_WESTERN_GHATS"
+GRID_ARRAYS = ("occurrences", "richness", "ndvi_sum", "ndvi_count", "recordings")
+SURFACE_ARRAYS = ("ndvi_interpolated", "ndvi_kriging_variance")  # optional, see ecofusion.interpolate
+SPECIES_BITS = 24  # low bits of the packed (cell-year, species) keys
+MERGE_MIN_KEYS = 1 << 20
+
+# --------------------------------------------------
+# Grids: (lat, lon) -> integer cell ID, -1 outside the extent
+# --------------------------------------------------
+@dataclass(frozen=True)
+class RegularGrid:
+    lat_min: float = WG_LAT_MIN
+    lat_max: float = WG_LAT_MAX
+    lon_min: float = WG_LON_MIN
+    lon_max: float = WG_LON_MAX
+    cell_deg: float = 0.25
+    kind: str = "regular"
+
+    @property
+    def shape(self):
+        """(rows, cols) of the grid, rows running south → north"""
+        return (math.ceil((self.lat_max - self.lat_min) / self.cell_deg),
+                math.ceil((self.lon_max - self.lon_min) / self.cell_deg))
+
+    @property
+    def n_cells(self):
+        rows, cols = self.shape
+        return rows * cols
+
+    def cell_ids(self, lat, lon):
+        rows, cols = self.shape
+        lat, lon = np.asarray(lat, np.float64), np.asarray(lon, np.float64)
+        inside = (lat >= self.lat_min) & (lat <= self.lat_max) & (lon >= self.lon_min) & (lon <= self.lon_max)
+        # The northern/eastern edges belong to the last row/column
+        row = np.minimum(np.floor((lat - self.lat_min) / self.cell_deg), rows - 1)
+        col = np.minimum(np.floor((lon - self.lon_min) / self.cell_deg), cols - 1)
+        return np.where(inside, row * cols + col, -1).astype(np.int64)
+
+    def cell_centers(self):
+        """(lat, lon) of every cell centre, indexed by cell ID"""
+        rows, cols = self.shape
+        row, col = np.divmod(np.arange(self.n_cells), cols)
+        return self.lat_min + (row + 0.5) * self.cell_deg, self.lon_min + (col + 0.5) * self.cell_deg
+
+
+@dataclass(frozen=True)
+class HexGrid:
+    """Pointy-top hexagons in degree space; cell_deg is the centre-to-vertex size"""
+
+    lat_min: float = WG_LAT_MIN
+    lat_max: float = WG_LAT_MAX
+    lon_min: float = WG_LON_MIN
+    lon_max: float = WG_LON_MAX
+    cell_deg: float = 0.25
+    kind: str = "hex"
+
+    @property
+    def shape(self):
+        """(rows, cols) in odd-row offset coordinates"""
+        return (math.ceil((self.lat_max - self.lat_min) / (1.5 * self.cell_deg)) + 2,
+                math.ceil((self.lon_max - self.lon_min) / (math.sqrt(3) * self.cell_deg)) + 2)
+
+    @property
+    def n_cells(self):
+        rows, cols = self.shape
+        return rows * cols
+
+    def cell_ids(self, lat, lon):
+        lat, lon = np.asarray(lat, np.float64), np.asarray(lon, np.float64)
+        x, y = lon - self.lon_min, lat - self.lat_min
+        # Fractional axial coordinates, then cube rounding to the nearest hexagon
+        q = (math.sqrt(3) / 3 * x - y / 3) / self.cell_deg
+        r = (2 / 3 * y) / self.cell_deg
+        s = -q - r
+        rq, rr, rs = np.round(q), np.round(r), np.round(s)
+        dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+        fix_q = (dq > dr) & (dq > ds)
+        fix_r = ~fix_q & (dr > ds)
+        rq = np.where(fix_q, -rr - rs, rq)
+        rr = np.where(fix_r, -rq - rs, rr)
+
+        row = rr.astype(np.int64)
+        col = rq.astype(np.int64) + (row - (row & 1)) // 2
+        rows, cols = self.shape
+        inside = ((lat >= self.lat_min) & (lat <= self.lat_max) & (lon >= self.lon_min) & (lon <= self.lon_max)
+                  & (row >= 0) & (row < rows) & (col >= 0) & (col < cols))
+        return np.where(inside, row * cols + col, -1)
+
+    def cell_centers(self):
+        rows, cols = self.shape
+        row, col = np.divmod(np.arange(self.n_cells), cols)
+        q = col - (row - (row & 1)) // 2
+        lon = self.lon_min + self.cell_deg * (math.sqrt(3) * q + math.sqrt(3) / 2 * row)
+        lat = self.lat_min + self.cell_deg * 1.5 * row
+        return lat, lon
+
+
+def make_grid(kind="regular", **params):
+    return {"regular": RegularGrid, "hex": HexGrid}[kind](**params)
+
+# --------------------------------------------------
+# Streaming accumulator
+# --------------------------------------------------
+class GridAccumulator:
+    """Per-cell, per-year reductions over chunks of points (cells × years arrays)"""
+
+    def __init__(self, grid, years=GBIF_YEARS):
+        self.grid = grid
+        self.first_year, self.last_year = years
+        self.n_years = self.last_year - self.first_year + 1
+        size = grid.n_cells * self.n_years
+        if size >= 1 << (63 - SPECIES_BITS):
+            raise ValueError(f"{size:,} cell-years are too many to pack with species into int64 keys")
+        self.occurrences = np.zeros(size, np.uint32)
+        self.ndvi_sum = np.zeros(size, np.float64)
+        self.ndvi_count = np.zeros(size, np.uint32)
+        self.recordings = np.zeros(size, np.uint32)
+        self._species_codes = {}
+        self._cell_year_species = np.empty(0, np.int64)  # sorted distinct keys
+        self._pending = []  # distinct keys of chunks not yet merged into _cell_year_species
+        self._pending_size = 0
+
+    def _keys(self, lat, lon, year):
+        """Flat cell × year index of every point, and the mask of points inside grid and period"""
+        cells = self.grid.cell_ids(lat, lon)
+        year = np.asarray(year, np.float64)
+        valid = (cells >= 0) & (year >= self.first_year) & (year <= self.last_year)
+        year_idx = np.where(valid, year - self.first_year, 0).astype(np.int64)
+        return cells * self.n_years + year_idx, valid
+
+    @staticmethod
+    def _sorted_unique(keys):
+        """Distinct values of an int64 array via sort + segment boundaries"""
+        keys = np.sort(keys, kind="stable")  # radix sort for integers
+        return keys[np.concatenate(([True], keys[1:] != keys[:-1]))] if len(keys) else keys
+
+    def _count(self, target, keys, weights=None):
+        target += np.bincount(keys, weights=weights, minlength=len(target)).astype(target.dtype)
+
+    def add_occurrences(self, lat, lon, year, species):
+        keys, valid = self._keys(lat, lon, year)
+        keys = keys[valid]
+        self._count(self.occurrences, keys)
+
+        # Map species names to stable integer codes across chunks
+        codes, uniques = pd.factorize(np.asarray(species)[valid])
+        lookup = np.array([self._species_codes.setdefault(name, len(self._species_codes)) for name in uniques],
+                          np.int64)
+        if len(self._species_codes) >= 1 << SPECIES_BITS:
+            raise ValueError(f"{1 << SPECIES_BITS:,} or more species do not fit the packed cell-year-species keys")
+        species_keys = self._sorted_unique(keys * (1 << SPECIES_BITS) + lookup[codes])
+        self._pending.append(species_keys)
+        self._pending_size += len(species_keys)
+        # Merging only once the pending keys outnumber the merged ones sorts each key O(1) times overall
+        if self._pending_size > max(len(self._cell_year_species), MERGE_MIN_KEYS):
+            self._merge_pending()
+
+    def _merge_pending(self):
+        if self._pending:
+            self._cell_year_species = self._sorted_unique(np.concatenate([self._cell_year_species, *self._pending]))
+            self._pending, self._pending_size = [], 0
+
+    def add_ndvi(self, lat, lon, year, ndvi):
+        keys, valid = self._keys(lat, lon, year)
+        ndvi = np.asarray(ndvi, np.float64)
+        valid &= ~np.isnan(ndvi)
+        self._count(self.ndvi_sum, keys[valid], ndvi[valid])
+        self._count(self.ndvi_count, keys[valid])
+
+    def add_recordings(self, lat, lon, year):
+        keys, valid = self._keys(lat, lon, year)
+        self._count(self.recordings, keys[valid])
+
+    @property
+    def richness(self):
+        """Distinct species per cell × year (sorted-segment count of distinct keys)"""
+        self._merge_pending()
+        return np.bincount(self._cell_year_species >> SPECIES_BITS, minlength=len(self.occurrences)).astype(np.uint32)
+
+    def arrays(self):
+        shape = (self.grid.n_cells, self.n_years)
+        return {
+            "occurrences": self.occurrences.reshape(shape),
+            "richness": self.richness.reshape(shape),
+            "ndvi_sum": self.ndvi_sum.astype(np.float32).reshape(shape),
+            "ndvi_count": self.ndvi_count.reshape(shape),
+            "recordings": self.recordings.reshape(shape),
+        }
+
+    def save(self, directory):
+        """Write the cell × year arrays as .npy files plus grid.json"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, values in self.arrays().items():
+            np.save(directory / f"{name}.npy", values)
+        for name in SURFACE_ARRAYS:  # a surface from an earlier run no longer matches these arrays
+            (directory / f"{name}.npy").unlink(missing_ok=True)
+        meta = {"grid": asdict(self.grid), "years": [self.first_year, self.last_year],
+                "species": len(self._species_codes)}
+        (directory / "grid.json").write_text(json.dumps(meta, indent=2))
+        return directory
+
+# --------------------------------------------------
+# Reading the store
+# --------------------------------------------------
+@dataclass(frozen=True)
+class GridStore:
+    grid: object
+    years: np.ndarray
+    arrays: dict
+
+    def year_index(self, year):
+        return int(year) - int(self.years[0])
+
+    def ndvi_mean(self):
+        """Interpolated NDVI where a surface was saved, else the mean of the samples binned into each cell"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            binned = np.where(self.arrays["ndvi_count"] > 0,
+                              self.arrays["ndvi_sum"] / np.maximum(self.arrays["ndvi_count"], 1), np.nan)
+        if "ndvi_interpolated" not in self.arrays:
+            return binned
+        surface = np.asarray(self.arrays["ndvi_interpolated"], np.float64)
+        return np.where(np.isnan(surface), binned, surface)
+
+    def stress(self, species_stress=0.0, critical_stress=0.0, weights=STRESS_WEIGHTS):
+        """Per-cell eco-stress index (pipeline weights; sampling term normalised per year)"""
+        environment, species, critical, sampling = weights
+        occurrences = self.arrays["occurrences"].astype(np.float64)
+        year_max = occurrences.max(axis=0, keepdims=True)
+        sampling_term = np.divide(occurrences, year_max, out=np.zeros_like(occurrences), where=year_max > 0)
+        return ((1 - self.ndvi_mean()) * environment + species_stress * species
+                + critical_stress * critical + sampling_term * sampling)
+
+    def to_frame(self, values, year):
+        """One year of a cells × years array as (cell, lat, lon, value) rows for non-empty cells"""
+        column = np.asarray(values)[:, self.year_index(year)]
+        lat, lon = self.grid.cell_centers()
+        keep = ~np.isnan(column) & (column != 0) if column.dtype.kind == "f" else column != 0
+        return pd.DataFrame({"cell": np.flatnonzero(keep), "lat": lat[keep], "lon": lon[keep], "value": column[keep]})
+
+
+def open_grid_store(directory):
+    """Memory-map a saved grid store (arrays are read-only views of the .npy files)"""
+    directory = Path(directory)
+    meta = json.loads((directory / "grid.json").read_text())
+    arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in GRID_ARRAYS}
+    arrays.update({name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in SURFACE_ARRAYS
+                   if (directory / f"{name}.npy").exists()})
+    first, last = meta["years"]
+    return GridStore(make_grid(**meta["grid"]), np.arange(first, last + 1), arrays)
+
+
+def bin_gbif_file(path, grid, years=GBIF_YEARS, chunksize=1_000_000):
+    """Single streaming pass over a GBIF occurrence export (tab separated)"""
+    accumulator = GridAccumulator(grid, years)
+    columns = ["decimalLatitude", "decimalLongitude", "year", "species"]
+    for chunk in pd.read_csv(path, sep="\t", usecols=columns, chunksize=chunksize, low_memory=False):
+        chunk = chunk.dropna(subset=columns)
+        accumulator.add_occurrences(
+            pd.to_numeric(chunk["decimalLatitude"], errors="coerce").to_numpy(),
+            pd.to_numeric(chunk["decimalLongitude"], errors="coerce").to_numpy(),
+            pd.to_numeric(chunk["year"], errors="coerce").to_numpy(),
+            chunk["species"].to_numpy(),
+        )
+    return accumulator
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bin GBIF occurrences onto a Western Ghats grid")
+    parser.add_argument("gbif", type=Path, help="GBIF occurrence download (tab separated)")
+    parser.add_argument("output", type=Path, nargs="?", default=Path(GRID_DIR))
+    parser.add_argument("--kind", choices=["regular", "hex"], default="regular")
+    parser.add_argument("--cell-deg", type=float, default=0.25)
+    parser.add_argument("--chunksize", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    grid = make_grid(args.kind, cell_deg=args.cell_deg)
+    accumulator = bin_gbif_file(args.gbif, grid, chunksize=args.chunksize)
+    accumulator.save(args.output)
+    occupied = int((accumulator.occurrences.reshape(grid.n_cells, -1).sum(axis=1) > 0).sum())
+    print(f"✅ {int(accumulator.occurrences.sum())} occurrences in {occupied}/{grid.n_cells} cells → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
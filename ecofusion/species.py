@@ -0,0 +1,167 @@
+"""
+Sparse species × (region, year) occurrence matrix
+Occurrence records are counted into a SciPy CSR matrix with one row per
+species (plus a species dictionary) and one column per region-year, so
+per-species views never need a dense species × year table. Trend slopes,
+occupancy and first/last-seen years for every species come from a handful of
+sparse products and index lookups.
+
+Usage:
+    python -m ecofusion.species data/species_year_matrix_WESTERN_GHATS --limit 20
+"""
+
+import argparse
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+MATRIX_DIR = "data/species_year_matrix_WESTERN_GHATS"
+ALL_REGIONS = "All regions"
+
+
+@dataclass(frozen=True)
+class SpeciesMatrix:
+    """counts[species, region * n_years + year_index] as CSR (sorted indices, no duplicates)"""
+
+    counts: sparse.csr_matrix
+    species: np.ndarray
+    years: np.ndarray
+    regions: tuple
+
+    @property
+    def n_years(self):
+        return len(self.years)
+
+    def species_index(self):
+        """Species name → row (the species dictionary)"""
+        return {name: row for row, name in enumerate(self.species)}
+
+    def by_year(self, region=None):
+        """species × year CSR for one region, or summed over regions (sparse product, never dense)"""
+        n_regions = len(self.regions)
+        if region is not None and region != ALL_REGIONS:
+            r = self.regions.index(region)
+            return self.counts[:, r * self.n_years:(r + 1) * self.n_years].tocsr()
+        # Column aggregator: every region's year column maps onto the same year
+        fold = sparse.csr_matrix((np.ones(n_regions * self.n_years),
+                                  (np.arange(n_regions * self.n_years), np.tile(np.arange(self.n_years), n_regions))),
+                                 shape=(n_regions * self.n_years, self.n_years))
+        return (self.counts @ fold).tocsr()
+
+    def save(self, directory):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        sparse.save_npz(directory / "counts.npz", self.counts)
+        np.save(directory / "species.npy", self.species.astype(str))
+        meta = {"years": [int(self.years[0]), int(self.years[-1])], "regions": list(self.regions)}
+        (directory / "meta.json").write_text(json.dumps(meta, indent=2))
+        return directory
+
+
+def build_species_matrix(species, years, regions=None, year_range=None):
+    """Count occurrences per species × (region, year); one entry per record in the inputs"""
+    years = np.asarray(years, np.float64)
+    species = np.asarray(species, dtype=object)
+    valid = ~np.isnan(years) & pd.notna(species)
+    first, last = year_range or (int(years[valid].min()), int(years[valid].max()))
+    valid &= (years >= first) & (years <= last)
+
+    species_codes, species_names = pd.factorize(species[valid], sort=True)
+    if regions is None:
+        region_codes, region_names = np.zeros(len(species_codes), np.int64), np.array([ALL_REGIONS])
+    else:
+        region_codes, region_names = pd.factorize(np.asarray(regions, dtype=object)[valid], sort=True)
+
+    n_years = last - first + 1
+    columns = region_codes * n_years + (years[valid] - first).astype(np.int64)
+    # COO → CSR sums duplicate (species, column) pairs and sorts the column indices
+    counts = sparse.csr_matrix(
+        (np.ones(len(columns), np.int32), (species_codes, columns)),
+        shape=(len(species_names), len(region_names) * n_years),
+    )
+    counts.sum_duplicates()
+    return SpeciesMatrix(counts, np.asarray(species_names, dtype=str), np.arange(first, last + 1),
+                         tuple(str(r) for r in region_names))
+
+
+def open_species_matrix(directory):
+    directory = Path(directory)
+    meta = json.loads((directory / "meta.json").read_text())
+    first, last = meta["years"]
+    return SpeciesMatrix(sparse.load_npz(directory / "counts.npz").tocsr(), np.load(directory / "species.npy"),
+                         np.arange(first, last + 1), tuple(meta["regions"]))
+
+
+def species_trends(matrix, region=None):
+    """Per-species totals, occupancy, first/last-seen year and reporting-rate trend
+
+    The trend is the OLS slope of each species' share of that year's records
+    (per 1000 occurrences), so changes in overall sampling effort cancel out.
+    Zero years count as observations of a 0 rate.
+    """
+    counts = matrix.by_year(region)
+    counts.sort_indices()
+    n_species, n_years = counts.shape
+    years = matrix.years
+
+    yearly_totals = np.asarray(counts.sum(axis=0)).ravel()
+    sampled = yearly_totals > 0
+    # Reporting rate per 1000 records: scale columns by 1000 / yearly total (stays sparse)
+    rate = counts @ sparse.diags(np.where(sampled, 1000 / np.maximum(yearly_totals, 1), 0.0))
+
+    # Closed-form OLS slope over the sampled years: Σ (t - t̄) y / Σ (t - t̄)²
+    t = np.where(sampled, years - years[sampled].mean(), 0.0) if sampled.any() else np.zeros(n_years)
+    denominator = (t ** 2).sum()
+    slope = rate @ t / denominator if denominator > 0 else np.full(n_species, np.nan)
+    mean_rate = np.asarray(rate.sum(axis=1)).ravel() / max(sampled.sum(), 1)
+
+    nnz = np.diff(counts.indptr)
+    seen = nnz > 0
+    first_seen = np.full(n_species, -1, np.int64)
+    last_seen = np.full(n_species, -1, np.int64)
+    first_seen[seen] = years[counts.indices[counts.indptr[:-1][seen]]]
+    last_seen[seen] = years[counts.indices[counts.indptr[1:][seen] - 1]]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        relative = np.where(mean_rate > 0, slope / mean_rate * 100, np.nan)
+    return pd.DataFrame({
+        "species": matrix.species,
+        "occurrences": np.asarray(counts.sum(axis=1)).ravel().astype(np.int64),
+        "years_present": nnz,
+        "occupancy": nnz / max(sampled.sum(), 1),
+        "first_seen": first_seen,
+        "last_seen": last_seen,
+        "rate_per_1000": mean_rate,
+        "trend_per_year": slope,
+        "trend_pct_per_year": relative,
+    })
+
+
+def declining_species(trends, min_years=3, min_occurrences=10, limit=25):
+    """Fastest-declining species by relative reporting-rate trend, among well-recorded species"""
+    eligible = trends[(trends["years_present"] >= min_years) & (trends["occurrences"] >= min_occurrences)]
+    return eligible[eligible["trend_per_year"] < 0].nsmallest(limit, "trend_pct_per_year")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List the fastest-declining species in a saved species matrix")
+    parser.add_argument("directory", type=Path, nargs="?", default=Path(MATRIX_DIR))
+    parser.add_argument("--region")
+    parser.add_argument("--min-years", type=int, default=3)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    matrix = open_species_matrix(args.directory)
+    counts = matrix.counts
+    print(f"✅ {counts.shape[0]} species × {len(matrix.regions)} regions × {matrix.n_years} years, "
+          f"{counts.nnz} non-zero cells ({counts.data.nbytes + counts.indices.nbytes + counts.indptr.nbytes} bytes)")
+    trends = species_trends(matrix, args.region)
+    print(declining_species(trends, args.min_years, limit=args.limit).round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
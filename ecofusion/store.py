@@ -0,0 +1,249 @@
+"""
+Shared read-only data store
+Source CSVs are converted once to uncompressed Arrow IPC files and memory-mapped
+by every process, so all Streamlit sessions and replicas on a host share one
+physical copy of each table through the OS page cache.
+
+Usage:
+    python -m ecofusion.store build               # (re)build stale Arrow files
+    python -m ecofusion.store report --workers 4  # per-process memory report
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from ecofusion import schema, tracing
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Root the registered CSV paths are resolved against (override to serve e.g. synthetic data)
+DATA_ROOT = Path(os.environ.get("ECOFUSION_DATA_ROOT", REPO_ROOT)).resolve()
+STORE_DIR = Path(os.environ.get("ECOFUSION_STORE_DIR", DATA_ROOT / ".ecofusion_store"))
+# mkstemp creates 0600 files; published files must be readable by replicas running as other users
+PUBLISHED_MODE = 0o644
+
+# --------------------------------------------------
+# Registered tables: name -> (source CSV, pandas read options)
+# --------------------------------------------------
+TABLES = {
+    "fusion": ("fusion_multimodal_dataset.csv", {}),
+    "model_results": ("model_results_summary.csv", {}),
+    "feature_importance": ("feature_importance.csv", {"index_col": 0}),
+    "audio_species": ("data/audio_species_richness_WESTERN_GHATS.csv", {}),
+    "audio_summary": ("data/audio_signal_summary_WESTERN_GHATS.csv", {}),
+    "gbif": ("data/gbif_biodiversity_yearly_WESTERN_GHATS.csv", {}),
+    "species_stress": ("data/species_stress_indicators_WESTERN_GHATS.csv", {}),
+    "ndvi": ("data/ndvi_temporal_dataset_POINT_SAMPLING.csv", {}),
+}
+
+_SOURCE_KEY = b"ecofusion.source"
+
+
+def _source_signature(source, name):
+    stat = source.stat()
+    # The declared schema is part of the signature, so changing it rebuilds the Arrow file
+    return json.dumps({"path": str(source), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                       "schema": schema.fingerprint(name)})
+
+
+def table_path(name):
+    return STORE_DIR / f"{name}.arrow"
+
+
+def _is_current(path, signature):
+    try:
+        with pa.memory_map(str(path), "r") as source:
+            metadata = ipc.open_file(source).schema.metadata or {}
+    except (FileNotFoundError, pa.ArrowInvalid):
+        return False
+    return metadata.get(_SOURCE_KEY) == signature.encode()
+
+
+def build_table(name, force=False):
+    """Convert one registered CSV to an Arrow IPC file (in its declared schema) if it is missing or stale"""
+    csv_name, read_options = TABLES[name]
+    source = DATA_ROOT / csv_name
+    signature = _source_signature(source, name)  # FileNotFoundError if the CSV is missing
+    path = table_path(name)
+    if not force and _is_current(path, signature):
+        return path
+
+    with tracing.span("store.build_table", table=name):
+        table = pa.Table.from_pandas(schema.enforce(pd.read_csv(source, **read_options), name))
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), _SOURCE_KEY: signature.encode()})
+
+    # Write to a private temp file and rename, so concurrent builders and readers never see a partial file
+    STORE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{name}.", suffix=".arrow", dir=STORE_DIR)
+    try:
+        with os.fdopen(fd, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.chmod(tmp_name, PUBLISHED_MODE)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return path
+
+
+def open_table(name):
+    """Memory-mapped Arrow table for a registered dataset (no heap copy of the data buffers)"""
+    path = build_table(name)
+    with pa.memory_map(str(path), "r") as source:
+        # Buffers reference the mapping, which stays alive as long as the table does
+        return ipc.open_file(source).read_all()
+
+
+def open_frame(name):
+    """Read-only DataFrame view over the memory-mapped table
+
+    Numeric columns without nulls become NumPy views of the mapped buffers,
+    strings stay Arrow-backed and dictionary columns become pandas
+    categoricals (only their small codes are copied), so the conversion
+    copies (almost) nothing.
+    Callers must treat the frame as immutable.
+    """
+    with tracing.span("store.open_frame", table=name) as span:
+        frame = open_table(name).to_pandas(split_blocks=True, self_destruct=False)
+        span.set(rows=len(frame))
+    return frame
+
+
+def build_all(force=False):
+    built = {}
+    for name in TABLES:
+        try:
+            built[name] = build_table(name, force=force)
+        except FileNotFoundError:
+            built[name] = None
+    return built
+
+# --------------------------------------------------
+# Memory report
+# --------------------------------------------------
+def _smaps_by_path():
+    """Rss/Pss/shared/private kB per mapped file of this process (Linux only)"""
+    usage = {}
+    current = None
+    try:
+        with open("/proc/self/smaps") as smaps:
+            for line in smaps:
+                fields = line.split()
+                if "-" in fields[0] and len(fields) >= 5:
+                    current = usage.setdefault(fields[5], {}) if len(fields) > 5 else None
+                elif current is not None and fields[0] in (
+                    "Rss:", "Pss:", "Shared_Clean:", "Shared_Dirty:", "Private_Clean:", "Private_Dirty:"
+                ):
+                    key = fields[0].rstrip(":").lower()
+                    current[key] = current.get(key, 0) + int(fields[1])
+    except FileNotFoundError:
+        return None
+    return usage
+
+
+def _process_status():
+    status = {}
+    try:
+        with open("/proc/self/status") as handle:
+            for line in handle:
+                if line.startswith(("VmRSS:", "VmHWM:", "RssAnon:", "RssFile:")):
+                    key, value = line.split(":", 1)
+                    status[key.lower()] = int(value.split()[0])
+    except FileNotFoundError:
+        pass
+    return status
+
+
+def memory_report(frames=None):
+    """Per-process memory report for the store
+
+    For every mapped store file: the Arrow buffer size, whether the DataFrame's
+    numeric columns point into the mapping, and the file's Rss/Pss in this
+    process. Pss shrinks as more processes map the same file, which is the
+    proof that one physical copy is shared.
+    """
+    smaps = _smaps_by_path() or {}
+    tables = {}
+    for name in TABLES:
+        path = table_path(name)
+        if not path.exists():
+            continue
+        entry = {"arrow_bytes": path.stat().st_size}
+        entry.update(smaps.get(str(path.resolve()), {}))
+        if frames is not None and name in frames:
+            entry["zero_copy_columns"] = _zero_copy_columns(frames[name])
+        tables[name] = entry
+    return {"pid": os.getpid(), "process_kb": _process_status(), "tables": tables}
+
+
+def _zero_copy_columns(frame):
+    """Share of numeric columns whose values are views rather than owned arrays"""
+    numeric = [frame[column].to_numpy() for column in frame.columns
+               if pd.api.types.is_numeric_dtype(frame[column].dtype)]
+    views = sum(not array.flags.owndata for array in numeric)
+    return f"{views}/{len(numeric)}"
+
+
+def _touch_all(frames):
+    # Fault in every mapped page, as a session rendering all sections would
+    for frame in frames.values():
+        for column in frame.columns:
+            if pd.api.types.is_numeric_dtype(frame[column].dtype):
+                frame[column].to_numpy().sum()
+
+
+def _worker_report(barrier, reports):
+    frames = {name: open_frame(name) for name in TABLES if table_path(name).exists()}
+    _touch_all(frames)
+    barrier.wait()  # every worker holds its mappings before anyone measures
+    reports.put(memory_report(frames))
+    barrier.wait()
+
+
+def _print_report(report):
+    process = report["process_kb"]
+    print(f"\n🧠 PID {report['pid']}: RSS {process.get('vmrss', 0) / 1024:.1f} MB "
+          f"(file-backed {process.get('rssfile', 0) / 1024:.1f} MB, anon {process.get('rssanon', 0) / 1024:.1f} MB)")
+    print(f"  {'table':<20}{'arrow kB':>10}{'rss kB':>9}{'pss kB':>9}{'shared kB':>11}  zero-copy")
+    for name, entry in report["tables"].items():
+        shared = entry.get("shared_clean", 0) + entry.get("shared_dirty", 0)
+        print(f"  {name:<20}{entry['arrow_bytes'] / 1024:>10.1f}{entry.get('rss', 0):>9}"
+              f"{entry.get('pss', 0):>9}{shared:>11}  {entry.get('zero_copy_columns', '-')}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EcoFusionAI shared Arrow data store")
+    parser.add_argument("command", choices=["build", "report"])
+    parser.add_argument("--force", action="store_true", help="rebuild even if the Arrow files are current")
+    parser.add_argument("--workers", type=int, default=2, help="processes that map the store for the report")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        for name, path in build_all(force=args.force).items():
+            print(f"  {'✅' if path else '⚠️'} {name}: {path or 'source CSV missing'}")
+        return 0
+
+    import multiprocessing
+
+    build_all()
+    context = multiprocessing.get_context("spawn")
+    barrier, reports = context.Barrier(args.workers), context.Queue()
+    workers = [context.Process(target=_worker_report, args=(barrier, reports)) for _ in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    for report in sorted((reports.get() for _ in workers), key=lambda r: r["pid"]):
+        _print_report(report)
+    for worker in workers:
+        worker.join()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,439 @@
+"""
+Seeded synthetic datasets for benchmarking at scale
+Writes a data root with the same layout and columns as the repository's real
+dashboard inputs, with configurable numbers of regions, years and species.
+
+Usage:
+    python -m ecofusion.synthetic /tmp/ecofusion_synth --regions 1000 --years 40
+    python -m ecofusion.synthetic /tmp/ecofusion_inputs --pipeline-inputs --occurrences 10000000 \\
+        --regions 10000 --years 40 --species 50000
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ecofusion import partitioned, pipeline, sketch, spatial, species, store
+
+THREAT_LEVELS = np.array(["CRITICAL", "HIGH", "MEDIUM", "LOW"])
+
+
+def _years(n_years, last_year=2024):
+    return np.arange(last_year - n_years + 1, last_year + 1)
+
+
+def synthetic_ndvi(n_regions, n_years, rng, samples_per_region=30):
+    """Region × year NDVI table: per-region baseline and trend plus noise"""
+    years = _years(n_years)
+    baseline = rng.uniform(0.35, 0.8, n_regions)
+    trend = rng.normal(0.0, 0.004, n_regions)
+    t = np.arange(n_years) - (n_years - 1) / 2
+    ndvi_mean = np.clip(baseline[:, None] + trend[:, None] * t + rng.normal(0, 0.02, (n_regions, n_years)), -0.2, 1)
+    width = len(str(n_regions - 1))
+    return pd.DataFrame({
+        "region": np.repeat([f"Region_{i:0{width}d}" for i in range(n_regions)], n_years),
+        "year": np.tile(years, n_regions),
+        "ndvi_mean": ndvi_mean.ravel(),
+        "ndvi_std": rng.uniform(0.05, 0.15, n_regions * n_years),
+        "num_samples": rng.integers(samples_per_region // 2, samples_per_region + 1, n_regions * n_years),
+    })
+
+
+def synthetic_audio_species(n_species, rng):
+    # Recording counts per species follow a heavy-tailed (Zipf-like) distribution
+    recordings = np.maximum(1, (rng.pareto(1.2, n_species) * 5).astype(int))
+    return pd.DataFrame({
+        "primary_label": [f"sp{i:05d}" for i in range(n_species)],
+        "num_recordings": recordings,
+        "normalized_audio_strength": recordings / recordings.max(),
+    })
+
+
+def synthetic_occurrence_points(n_points, n_species, years, rng, n_clusters=40, effort_sigma=0.8,
+                                centres=None, effort=None):
+    """Clustered GBIF-style occurrences inside the Western Ghats box (survey hotspots)
+
+    Yearly sampling effort is lognormal and species abundances are Zipf-like,
+    so richness saturates with effort as in real collector curves. Pass the
+    same centres/effort to every chunk of a streamed dataset.
+    """
+    if centres is None:
+        centres = (rng.uniform(pipeline.WG_LAT_MIN, pipeline.WG_LAT_MAX, n_clusters),
+                   rng.uniform(pipeline.WG_LON_MIN, pipeline.WG_LON_MAX, n_clusters))
+    centres_lat, centres_lon = centres
+    cluster = rng.integers(0, len(centres_lat), n_points)
+    if effort is None:
+        effort = rng.lognormal(0, effort_sigma, len(years))
+    return pd.DataFrame({
+        "decimalLatitude": np.clip(centres_lat[cluster] + rng.normal(0, 0.3, n_points),
+                                   pipeline.WG_LAT_MIN, pipeline.WG_LAT_MAX),
+        "decimalLongitude": np.clip(centres_lon[cluster] + rng.normal(0, 0.2, n_points),
+                                    pipeline.WG_LON_MIN, pipeline.WG_LON_MAX),
+        "year": rng.choice(years, n_points, p=effort / effort.sum()),
+        "species": np.minimum(rng.zipf(1.5, n_points), n_species) - 1,
+    })
+
+
+def synthetic_fusion(gbif, ndvi, audio_signal_strength, rng):
+    """Hotspot-level fusion table built with the pipeline's fusion stages"""
+    audio = pd.DataFrame({
+        "audio_signal_strength": [audio_signal_strength],
+        "species_stress_index": [1 - audio_signal_strength],
+        "critical_species_stress": [rng.uniform(0, 0.1)],
+        "high_species_stress": [rng.uniform(0, 0.1)],
+    })
+    years = (gbif["year"].min(), gbif["year"].max())
+    fusion = pipeline.fuse_modalities(gbif, pipeline.ndvi_yearly(ndvi), audio, years=years)
+    return pipeline.add_stress_indicators(fusion)
+
+
+def write_dashboard_dataset(root, n_regions=3, n_years=7, n_species=163, seed=42, n_points=100_000):
+    """Write every registered dashboard table under root (same relative paths as the repo)"""
+    rng = np.random.default_rng(seed)
+    root = Path(root)
+    (root / "data").mkdir(parents=True, exist_ok=True)
+
+    ndvi = synthetic_ndvi(n_regions, n_years, rng)
+    years = _years(n_years)
+    points = synthetic_occurrence_points(n_points, n_species, years, rng)
+    gbif = pipeline.gbif_yearly_biodiversity(points)
+    audio_species = synthetic_audio_species(n_species, rng)
+    audio_signal_strength = float(audio_species["normalized_audio_strength"].mean())
+    fusion = synthetic_fusion(gbif, ndvi, audio_signal_strength, rng)
+
+    n_stress = min(n_species, 5)
+    stress_strength = rng.uniform(0.5, 1.0, n_stress)
+    weights = rng.dirichlet(np.ones(n_stress))
+    tables = {
+        "ndvi": ndvi,
+        "gbif": gbif,
+        "audio_species": audio_species,
+        "audio_summary": pd.DataFrame({"audio_signal_strength": [audio_signal_strength]}),
+        "fusion": fusion,
+        "model_results": pd.DataFrame({
+            "Model": ["Linear Regression", "Random Forest"],
+            "RMSE": rng.uniform(0.01, 0.05, 2),
+            "R2": rng.uniform(-1, 1, 2),
+        }),
+        "feature_importance": pd.Series(
+            rng.dirichlet(np.ones(4)), index=["ndvi_mean", "occurrences", "ndvi_std", "audio_signal_strength"],
+            name="importance"
+        ).to_frame(),
+        "species_stress": pd.DataFrame({
+            "species_code": audio_species["primary_label"].iloc[:n_stress].to_numpy(),
+            "species_name": [f"Synthetic species {i}" for i in range(n_stress)],
+            "recordings": rng.integers(10, 60, n_stress),
+            "audio_strength": stress_strength,
+            "weight": weights,
+            "threat_level": THREAT_LEVELS[rng.integers(0, len(THREAT_LEVELS), n_stress)],
+            "species_stress": (1 - stress_strength) * weights,
+            "weighted_contribution": stress_strength * weights,
+        }),
+    }
+
+    for name, frame in tables.items():
+        csv_name, read_options = store.TABLES[name]
+        frame.to_csv(root / csv_name, index="index_col" in read_options)
+
+    # Gridded occurrences and NDVI samples for the spatial view
+    grid = spatial.GridAccumulator(spatial.RegularGrid(), years=(int(years[0]), int(years[-1])))
+    grid.add_occurrences(points["decimalLatitude"], points["decimalLongitude"], points["year"], points["species"])
+    samples = points.sample(min(n_points, 20_000), random_state=seed)
+    # Greener towards the wetter southern ranges
+    ndvi = 0.8 - 0.02 * (samples["decimalLatitude"] - pipeline.WG_LAT_MIN) + rng.normal(0, 0.05, len(samples))
+    grid.add_ndvi(samples["decimalLatitude"], samples["decimalLongitude"], samples["year"], np.clip(ndvi, -0.2, 1))
+    grid.save(root / spatial.GRID_DIR)
+
+    # NDVI distribution sketches: 5,000 pixels per region-year, with a tail of degraded patches
+    regional = tables["ndvi"]
+    rows = np.repeat(np.arange(len(regional)), 5_000)
+    degraded = rng.random(len(rows)) < 0.15
+    values = regional["ndvi_mean"].to_numpy()[rows] + regional["ndvi_std"].to_numpy()[rows] * np.where(
+        degraded, -2 - rng.exponential(1, len(rows)), rng.normal(0, 0.8, len(rows)))
+    point_samples = regional.iloc[rows][["region", "year"]].assign(ndvi=np.clip(values, -0.2, 1))
+    sketch.DigestSet.from_samples(point_samples, ["region", "year"]).save(root / sketch.SKETCH_PATH)
+
+    # Partitioned datasets (hotspot/region/year) read by the per-region views
+    root_datasets = root / partitioned.DATASET_DIR
+    regions = pipeline.assign_ndvi_region(points["decimalLatitude"], points["decimalLongitude"])
+    partitioned.write_dataset(points.assign(region=regions), "occurrences", root_datasets, sort_by=["species"])
+    partitioned.write_dataset(pipeline.gbif_region_yearly_richness(points), "gbif_region_yearly", root_datasets)
+
+    # Sparse species × (region, year) counts for the species trend table
+    pipeline.species_matrix(points.assign(species="Synthetic species " + points["species"].astype(str)),
+                            years=(int(years[0]), int(years[-1]))).save(root / species.MATRIX_DIR)
+    return root
+
+
+# --------------------------------------------------
+# Raw pipeline inputs at scale (GBIF DwC, BirdCLEF, NDVI composites)
+# --------------------------------------------------
+HERBARIA = np.array(["FRLH", "MH", "CAL", "BLAT", "JCB"])
+INDIA_BOX = (6.0, 68.0, 30.0, 90.0)  # lat_min, lon_min, lat_max, lon_max: records the Western Ghats filter drops
+
+
+def _iso_dates(year, month, day):
+    return (pd.Series(year).astype(str) + "-" + pd.Series(month).astype(str).str.zfill(2) + "-" +
+            pd.Series(day).astype(str).str.zfill(2)).to_numpy()
+
+
+def synthetic_gbif_records(n_records, n_species, years, rng, centres, effort, first_id=0,
+                           duplicate_rate=0.02, outside_rate=0.1):
+    """GBIF Darwin Core occurrence rows: clustered points, specimen/observation mix and herbarium duplicates
+
+    duplicate_rate of the specimens are re-filed at a second herbarium with a new
+    catalog number (same species, place, date and collector); outside_rate of the
+    records fall elsewhere in India.
+    """
+    points = synthetic_occurrence_points(n_records, n_species, years, rng, centres=centres, effort=effort)
+    outside = rng.random(n_records) < outside_rate
+    lat_min, lon_min, lat_max, lon_max = INDIA_BOX
+    points.loc[outside, "decimalLatitude"] = rng.uniform(lat_min, lat_max, outside.sum())
+    points.loc[outside, "decimalLongitude"] = rng.uniform(lon_min, lon_max, outside.sum())
+
+    basis = np.where(rng.random(n_records) < 0.35, "PRESERVED_SPECIMEN", "HUMAN_OBSERVATION")
+    specimen = basis == "PRESERVED_SPECIMEN"
+    institution = np.where(specimen, HERBARIA[rng.integers(0, len(HERBARIA), n_records)],
+                           np.where(rng.random(n_records) < 0.7, "iNaturalist", "eBird"))
+    month, day = rng.integers(1, 13, n_records), rng.integers(1, 29, n_records)
+    ids = np.arange(first_id, first_id + n_records)
+    records = pd.DataFrame({
+        "gbifID": ids,
+        "species": "Synthetic species " + points["species"].astype(str),
+        "decimalLatitude": points["decimalLatitude"].round(5),
+        "decimalLongitude": points["decimalLongitude"].round(5),
+        "year": points["year"],
+        "month": month,
+        "day": day,
+        "eventDate": _iso_dates(points["year"], month, day),
+        "basisOfRecord": basis,
+        "institutionCode": institution,
+        "recordedBy": "Collector " + (np.minimum(rng.zipf(1.3, n_records), 5000)).astype(str),
+        "catalogNumber": np.char.add(np.char.add(institution.astype(str), "-"), ids.astype(str)),
+    })
+
+    duplicates = records[specimen & (rng.random(n_records) < duplicate_rate)].copy()
+    duplicates["institutionCode"] = HERBARIA[rng.integers(0, len(HERBARIA), len(duplicates))]
+    duplicates["gbifID"] += 10 ** 12  # distinct id space for the re-filed sheets
+    duplicates["catalogNumber"] = np.char.add(np.char.add(duplicates["institutionCode"].to_numpy().astype(str), "-D"),
+                                              duplicates["gbifID"].to_numpy().astype(str))
+    return pd.concat([records, duplicates], ignore_index=True)
+
+
+def write_gbif_occurrences(path, n_records, n_species, years, rng, chunksize=1_000_000, n_clusters=400):
+    """Stream a tab-separated GBIF export in chunks (memory stays bounded by one chunk)"""
+    centres = (rng.uniform(pipeline.WG_LAT_MIN, pipeline.WG_LAT_MAX, n_clusters),
+               rng.uniform(pipeline.WG_LON_MIN, pipeline.WG_LON_MAX, n_clusters))
+    effort = rng.lognormal(0, 0.8, len(years))
+    written = 0
+    with open(path, "w", newline="") as sink:
+        for start in range(0, n_records, chunksize):
+            chunk = synthetic_gbif_records(min(chunksize, n_records - start), n_species, years, rng, centres, effort,
+                                           first_id=start)
+            chunk.to_csv(sink, sep="\t", index=False, header=start == 0)
+            written += len(chunk)
+    return written
+
+
+def synthetic_birdclef_metadata(n_recordings, n_species, years, rng, duplicate_rate=0.01):
+    """BirdCLEF train_metadata rows; duplicate_rate of the recordings are uploaded twice under a new file name"""
+    labels = np.minimum(rng.zipf(1.4, n_recordings), n_species) - 1
+    lat_min, lon_min, lat_max, lon_max = INDIA_BOX
+    inside = rng.random(n_recordings) < 0.6
+    metadata = pd.DataFrame({
+        "primary_label": np.char.add("sp", np.char.zfill(labels.astype(str), 5)),
+        "latitude": np.where(inside, rng.uniform(pipeline.WG_LAT_MIN, pipeline.WG_LAT_MAX, n_recordings),
+                             rng.uniform(lat_min, lat_max, n_recordings)).round(4),
+        "longitude": np.where(inside, rng.uniform(pipeline.WG_LON_MIN, pipeline.WG_LON_MAX, n_recordings),
+                              rng.uniform(lon_min, lon_max, n_recordings)).round(4),
+        "author": "Recordist " + np.minimum(rng.zipf(1.5, n_recordings), 2000).astype(str),
+        "date": _iso_dates(rng.choice(years, n_recordings), rng.integers(1, 13, n_recordings),
+                           rng.integers(1, 29, n_recordings)),
+        "rating": rng.choice([2.5, 3.0, 3.5, 4.0, 4.5, 5.0], n_recordings),
+    })
+    metadata["filename"] = metadata["primary_label"] + "/XC" + np.arange(n_recordings).astype(str) + ".ogg"
+    duplicates = metadata[rng.random(n_recordings) < duplicate_rate].copy()
+    duplicates["filename"] = duplicates["filename"].str.replace(".ogg", "_reupload.ogg", regex=False)
+    return pd.concat([metadata, duplicates], ignore_index=True)
+
+
+def region_names(n_regions):
+    """The pipeline's NDVI regions first (so its region joins match), then Region_xx"""
+    known = [*pipeline.NDVI_REGIONS, pipeline.OTHER_REGION][:n_regions]
+    extra = n_regions - len(known)
+    width = len(str(max(extra - 1, 0)))
+    return np.array(known + [f"Region_{i:0{width}d}" for i in range(extra)])
+
+
+def synthetic_ndvi_composite(n_regions, n_years, rng, cloud_rate=0.35):
+    """Monthly region × year × month NDVI composites with a post-monsoon peak and cloudy monsoon gaps"""
+    years = _years(n_years)
+    n_rows = n_regions * n_years * 12
+    region = np.repeat(np.arange(n_regions), n_years * 12)
+    year_index = np.tile(np.repeat(np.arange(n_years), 12), n_regions)
+    month = np.tile(np.arange(1, 13), n_regions * n_years)
+    baseline = rng.uniform(0.35, 0.8, n_regions)
+    trend = rng.normal(0.0, 0.004, n_regions)
+    amplitude = rng.uniform(0.03, 0.12, n_regions)
+    ndvi = (baseline[region] + trend[region] * (year_index - (n_years - 1) / 2)
+            + amplitude[region] * np.cos(2 * np.pi * (month - 10) / 12) + rng.normal(0, 0.02, n_rows))
+    monsoon = (month >= 6) & (month <= 9)
+    cloudy = monsoon & (rng.random(n_rows) < cloud_rate)
+    return pd.DataFrame({
+        "region": region_names(n_regions)[region],
+        "year": years[year_index],
+        "month": month,
+        "ndvi": np.where(cloudy, np.nan, np.clip(ndvi, -0.2, 1)),
+        "valid_pixels": np.where(cloudy, 0, rng.integers(20, 400, n_rows)),
+    })
+
+
+def synthetic_ndvi_points(n_points, years, rng, n_patches=60):
+    """Point NDVI samples (region, year, lat, lon, ndvi) over the Western Ghats box, n_points per year
+
+    NDVI is a smooth field of forest and degraded patches with a yearly
+    drift, sampled at random locations as notebook 1 does, plus pixel noise.
+    """
+    lat_min, lat_max = pipeline.WG_LAT_MIN, pipeline.WG_LAT_MAX
+    lon_min, lon_max = pipeline.WG_LON_MIN, pipeline.WG_LON_MAX
+    centres = np.column_stack([rng.uniform(lat_min, lat_max, n_patches), rng.uniform(lon_min, lon_max, n_patches)])
+    amplitude = rng.normal(0, 0.15, n_patches)
+    width = rng.uniform(0.2, 0.8, n_patches)
+    drift = rng.normal(0.0, 0.003, n_patches)
+
+    n_rows = n_points * len(years)
+    lat, lon = rng.uniform(lat_min, lat_max, n_rows), rng.uniform(lon_min, lon_max, n_rows)
+    year = np.repeat(years, n_points)
+    t = year - years.mean()
+    ndvi = np.full(n_rows, 0.6)
+    for (c_lat, c_lon), a, w, d in zip(centres, amplitude, width, drift):
+        ndvi += (a + d * t) * np.exp(-((lat - c_lat) ** 2 + (lon - c_lon) ** 2) / (2 * w ** 2))
+    return pd.DataFrame({
+        "region": pipeline.assign_ndvi_region(lat, lon),
+        "year": year,
+        "lat": lat,
+        "lon": lon,
+        "ndvi": np.clip(ndvi + rng.normal(0, 0.03, n_rows), -0.2, 1),
+    })
+
+
+def synthetic_ndvi_cube(n_times, height, width, rng, cloud_rate=0.25, periods_per_year=23):
+    """(time, y, x) float32 NDVI stack of 16-day composites: smooth landscape, seasonality, clouds as NaN
+
+    The landscape and cloud masks are low-resolution noise upsampled to the
+    raster, so neighbouring pixels are correlated as in MOD13Q1 scenes.
+    """
+    from scipy.ndimage import zoom
+
+    def smooth(shape, factor):
+        coarse = rng.normal(0, 1, (max(2, shape[0] // factor), max(2, shape[1] // factor)))
+        return zoom(coarse, (shape[0] / coarse.shape[0], shape[1] / coarse.shape[1]), order=1)[:shape[0], :shape[1]]
+
+    landscape = np.clip(0.6 + 0.12 * smooth((height, width), 64) + 0.05 * smooth((height, width), 8), 0.05, 0.9)
+    amplitude = 0.08 + 0.04 * smooth((height, width), 32)
+    water = smooth((height, width), 48) < -1.8
+    stack = np.empty((n_times, height, width), np.float32)
+    for t in range(n_times):
+        season = np.cos(2 * np.pi * (t % periods_per_year - 18) / periods_per_year)  # post-monsoon peak
+        values = landscape + amplitude * season + rng.normal(0, 0.02, (height, width))
+        cloudy = smooth((height, width), 16) > np.quantile(rng.normal(0, 1, 1000), 1 - cloud_rate)
+        stack[t] = np.where(water, -0.05, np.where(cloudy, np.nan, np.clip(values, -0.2, 1)))
+    return stack
+
+
+def ndvi_region_yearly(composite):
+    """Region-year table in the notebook 1 layout (mean/std over the cloud-free months)"""
+    table = composite.dropna(subset=["ndvi"]).groupby(["region", "year"]).agg(
+        ndvi_mean=("ndvi", "mean"), ndvi_std=("ndvi", "std"), num_samples=("ndvi", "size")
+    )
+    return table.reset_index()
+
+
+def synthetic_region_fusion_inputs(ndvi, n_species, rng):
+    """Region-year fusion rows (NDVI, sampling, richness, audio) for training and the feature store at region scale"""
+    regions, codes = np.unique(ndvi["region"].to_numpy(), return_inverse=True)
+    effort = rng.lognormal(5, 1, len(regions))[codes] * rng.lognormal(0, 0.3, len(ndvi))
+    occurrences = np.maximum(1, effort).astype(int)
+    # Greener regions hold more species; richness saturates with effort
+    capacity = n_species * (0.2 + ndvi["ndvi_mean"].clip(0, 1).to_numpy())
+    richness = np.maximum(1, capacity * (1 - np.exp(-occurrences / capacity)) * rng.lognormal(0, 0.1, len(ndvi)))
+    richness = richness.astype(int)
+    inat = rng.binomial(occurrences, 0.4)
+    return ndvi[["region", "year", "ndvi_mean", "ndvi_std"]].assign(
+        occurrences=occurrences,
+        species_richness=richness,
+        species_per_1000_occ=richness / occurrences * 1000,
+        audio_signal_strength=rng.uniform(0.2, 1.0, len(regions))[codes],
+        bird_recordings=rng.integers(0, 500, len(regions))[codes],
+        inat_occurrences=inat,
+        inat_species=np.minimum(richness, np.ceil(richness * inat / occurrences)).astype(int),
+    )
+
+
+def write_pipeline_inputs(root, n_occurrences=1_000_000, n_regions=100, n_years=40, n_species=10_000,
+                          n_recordings=50_000, seed=42, chunksize=1_000_000, n_ndvi_points=5_000):
+    """Write raw pipeline inputs under root; returns {name: path}"""
+    rng = np.random.default_rng(seed)
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    years = _years(n_years)
+    paths = {
+        "gbif": root / "gbif_occurrences.txt",
+        "birdclef": root / "birdclef_train_metadata.csv",
+        "ndvi_composite": root / "ndvi_composite_monthly.csv",
+        "ndvi": root / "ndvi_region_yearly.csv",
+        "ndvi_points": root / "ndvi_point_samples.csv",
+        "region_fusion": root / "fusion_inputs_region_yearly.csv",
+        "enhanced_audio": root / "enhanced_audio_summary.csv",
+    }
+    write_gbif_occurrences(paths["gbif"], n_occurrences, n_species, years, rng, chunksize)
+    synthetic_birdclef_metadata(n_recordings, n_species, years, rng).to_csv(paths["birdclef"], index=False)
+    composite = synthetic_ndvi_composite(n_regions, n_years, rng)
+    composite.to_csv(paths["ndvi_composite"], index=False)
+    ndvi = ndvi_region_yearly(composite)
+    ndvi.to_csv(paths["ndvi"], index=False)
+    synthetic_region_fusion_inputs(ndvi, n_species, rng).to_csv(paths["region_fusion"], index=False)
+    synthetic_ndvi_points(n_ndvi_points, years, rng).to_csv(paths["ndvi_points"], index=False)
+    strength = rng.uniform(0.6, 0.95)
+    pd.DataFrame({
+        "audio_signal_strength": [strength],
+        "species_stress_index": [1 - strength],
+        "top5_species_count": [5],
+        "critical_species_stress": [rng.uniform(0, 0.1)],
+        "high_species_stress": [rng.uniform(0, 0.1)],
+    }).to_csv(paths["enhanced_audio"], index=False)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic EcoFusionAI data root")
+    parser.add_argument("root", type=Path)
+    parser.add_argument("--regions", type=int, default=3)
+    parser.add_argument("--years", type=int, default=7)
+    parser.add_argument("--species", type=int, default=163)
+    parser.add_argument("--points", type=int, default=100_000, help="occurrence points for the spatial grid")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--pipeline-inputs", action="store_true",
+                        help="write raw GBIF / BirdCLEF / NDVI pipeline inputs instead of dashboard tables")
+    parser.add_argument("--occurrences", type=int, default=1_000_000, help="GBIF records (--pipeline-inputs)")
+    parser.add_argument("--recordings", type=int, default=50_000, help="BirdCLEF recordings (--pipeline-inputs)")
+    args = parser.parse_args(argv)
+
+    if args.pipeline_inputs:
+        paths = write_pipeline_inputs(args.root, args.occurrences, args.regions, args.years, args.species,
+                                      args.recordings, args.seed)
+        print(f"✅ Synthetic pipeline inputs written to {args.root}")
+        print(f"   python -m ecofusion.pipeline --gbif {paths['gbif']} --audio {paths['birdclef']} "
+              f"--ndvi {paths['ndvi']} --ndvi-points {paths['ndvi_points']} "
+              f"--enhanced-audio {paths['enhanced_audio']}")
+        return
+
+    root = write_dashboard_dataset(args.root, args.regions, args.years, args.species, args.seed, args.points)
+    print(f"✅ Synthetic dashboard data written to {root}")
+    print(f"   Run the dashboard on it with: ECOFUSION_DATA_ROOT={root} streamlit run app.py")
+
+
+if __name__ == "__main__":
+    main()
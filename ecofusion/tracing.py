@@ -0,0 +1,242 @@
+"""
+Lightweight hot-path tracing
+Spans are opened with the span() context manager or the @traced decorator and
+aggregated into per-name log2 latency histograms. Finished spans can be
+exported as JSON lines or as a Chrome trace (chrome://tracing, Perfetto).
+
+Tracing is off unless ECOFUSION_TRACE=1 (or enable() is called) or a
+capture() is active in the current context. When off, span() returns a shared
+no-op object and @traced calls straight through after one flag check.
+
+Environment:
+    ECOFUSION_TRACE=1              record spans process-wide
+    ECOFUSION_TRACE_JSONL=<path>   append finished spans as JSON lines at exit
+    ECOFUSION_TRACE_CHROME=<path>  write a Chrome trace file at exit
+"""
+
+import atexit
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+_enabled = os.environ.get("ECOFUSION_TRACE", "") not in ("", "0")
+_capture = contextvars.ContextVar("ecofusion_trace_capture", default=None)
+_stack = contextvars.ContextVar("ecofusion_trace_stack", default=())
+_lock = threading.Lock()
+_epoch_ns = time.perf_counter_ns()
+
+MAX_EVENTS = 200_000  # ring buffer for export; histograms keep every span
+N_BUCKETS = 40        # bucket i holds durations in [2**i, 2**(i+1)) µs
+
+_histograms = {}
+_events = deque(maxlen=MAX_EVENTS)
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("name", "attrs", "start_ns", "_token")
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+
+    def set(self, **attrs):
+        """Attach attributes discovered while the span is open (e.g. row counts)"""
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        parents = _stack.get()
+        self._token = _stack.set(parents + (self.name,))
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        parents = _stack.get()[:-1]
+        _stack.reset(self._token)
+        _record(self, end_ns, parents, exc_type)
+        return False
+
+
+def span(name, **attrs):
+    """Context manager timing a block: with span("trends.figure"): ..."""
+    if not _enabled and _capture.get() is None:
+        return _NOOP
+    return _Span(name, attrs)
+
+
+def traced(name=None):
+    """Decorator timing every call; usable as @traced or @traced("stage.name")"""
+    def decorate(fn, label):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled and _capture.get() is None:
+                return fn(*args, **kwargs)
+            with _Span(label, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    if callable(name):
+        return decorate(name, f"{name.__module__}.{name.__qualname__}")
+    return lambda fn: decorate(fn, name or f"{fn.__module__}.{fn.__qualname__}")
+
+
+def _record(span_, end_ns, parents, exc_type):
+    duration_ns = end_ns - span_.start_ns
+    event = {
+        "name": span_.name,
+        "ts_us": (span_.start_ns - _epoch_ns) / 1000,
+        "dur_us": duration_ns / 1000,
+        "tid": threading.get_ident(),
+        "depth": len(parents),
+        "parent": parents[-1] if parents else None,
+    }
+    if span_.attrs:
+        event["attrs"] = span_.attrs
+    if exc_type is not None:
+        event["error"] = exc_type.__name__
+
+    captured = _capture.get()
+    if captured is not None:
+        captured.append(event)
+    if _enabled:
+        bucket = min(max((duration_ns // 1000).bit_length() - 1, 0), N_BUCKETS - 1)
+        with _lock:
+            stats = _histograms.get(span_.name)
+            if stats is None:
+                stats = _histograms[span_.name] = {"count": 0, "total_ns": 0, "max_ns": 0, "buckets": [0] * N_BUCKETS}
+            stats["count"] += 1
+            stats["total_ns"] += duration_ns
+            stats["max_ns"] = max(stats["max_ns"], duration_ns)
+            stats["buckets"][bucket] += 1
+            _events.append(event)
+
+
+@contextlib.contextmanager
+def capture(enabled=True):
+    """Collect the spans finished in this context (e.g. one Streamlit rerun) into a list"""
+    if not enabled:
+        yield []
+        return
+    spans = []
+    token = _capture.set(spans)
+    try:
+        yield spans
+    finally:
+        _capture.reset(token)
+
+# --------------------------------------------------
+# Aggregates and export
+# --------------------------------------------------
+def _bucket_quantile(buckets, count, q):
+    """Upper bound (ms) of the histogram bucket containing quantile q"""
+    target = q * count
+    seen = 0
+    for i, n in enumerate(buckets):
+        seen += n
+        if seen >= target and n:
+            return (2 ** (i + 1)) / 1000
+    return float("nan")
+
+
+def summary():
+    """Per-span-name count, total/mean/max and approximate p50/p95/p99 (ms)"""
+    with _lock:
+        snapshot = {name: dict(stats, buckets=list(stats["buckets"])) for name, stats in _histograms.items()}
+    report = {}
+    for name, stats in sorted(snapshot.items(), key=lambda item: -item[1]["total_ns"]):
+        count = stats["count"]
+        report[name] = {
+            "count": count,
+            "total_ms": stats["total_ns"] / 1e6,
+            "mean_ms": stats["total_ns"] / count / 1e6,
+            "max_ms": stats["max_ns"] / 1e6,
+            "p50_ms": _bucket_quantile(stats["buckets"], count, 0.50),
+            "p95_ms": _bucket_quantile(stats["buckets"], count, 0.95),
+            "p99_ms": _bucket_quantile(stats["buckets"], count, 0.99),
+            "histogram_us_log2": stats["buckets"],
+        }
+    return report
+
+
+def slowest(spans, limit=10):
+    return sorted(spans, key=lambda event: -event["dur_us"])[:limit]
+
+
+def export_jsonl(path, clear=True):
+    """Append buffered span events to a JSON lines file"""
+    with _lock:
+        events = list(_events)
+        if clear:
+            _events.clear()
+    with open(path, "a") as handle:
+        for event in events:
+            handle.write(json.dumps(event, default=str) + "\n")
+    return len(events)
+
+
+def export_chrome_trace(path):
+    """Write buffered span events in Chrome trace-event format"""
+    with _lock:
+        events = list(_events)
+    pid = os.getpid()
+    trace = [
+        {"name": e["name"], "ph": "X", "ts": e["ts_us"], "dur": e["dur_us"], "pid": pid, "tid": e["tid"],
+         "args": e.get("attrs", {})}
+        for e in events
+    ]
+    with open(path, "w") as handle:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, handle, default=str)
+    return len(trace)
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+        _events.clear()
+
+
+def _export_at_exit():
+    chrome_path = os.environ.get("ECOFUSION_TRACE_CHROME")
+    if chrome_path:
+        export_chrome_trace(chrome_path)
+    jsonl_path = os.environ.get("ECOFUSION_TRACE_JSONL")
+    if jsonl_path:
+        export_jsonl(jsonl_path)
+
+
+atexit.register(_export_at_exit)
@@ -0,0 +1,160 @@
+"""
+Versioned data/model snapshots with background hot-reload
+A watcher thread polls the dashboard tables under the data root and data/.
+When any of them changes it loads and validates a complete new snapshot off
+the request path, then swaps the active snapshot with a single
+reference assignment. Readers that already hold a snapshot keep using it
+unchanged, so an in-flight rerun never mixes old and new tables.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+from ecofusion import schema, store, tracing
+from ecofusion.ndvi import build_ndvi_regional_summary
+
+RELOAD_INTERVAL = float(os.environ.get("ECOFUSION_RELOAD_INTERVAL", "5"))
+
+REQUIRED_TABLES = ["fusion", "model_results", "feature_importance", "audio_species", "audio_summary", "gbif"]
+OPTIONAL_TABLES = ["species_stress", "ndvi"]
+
+# Columns the dashboard relies on; a snapshot missing any of them is rejected
+REQUIRED_COLUMNS = {
+    "fusion": ["year", "species_per_1000_occ", "ndvi_mean", "audio_signal_strength", "occurrences", "eco_stress_index"],
+    "model_results": ["Model", "RMSE", "R2"],
+    "feature_importance": ["importance"],
+    "audio_summary": ["audio_signal_strength"],
+    "gbif": ["year", "species_per_1000_occ"],
+    "ndvi": ["region", "year", "ndvi_mean", "ndvi_std", "num_samples"],
+}
+
+
+class SnapshotValidationError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class DataSnapshot:
+    """Immutable, self-consistent set of tables and derived tables"""
+
+    version: str
+    tables: dict
+    ndvi_regional_summary: object
+    load_seconds: float
+    loaded_at: float = field(default_factory=time.time)
+
+    def table(self, name):
+        if name not in self.tables:
+            raise FileNotFoundError(f"{store.TABLES[name][0]} is not available in data version {self.version}")
+        return self.tables[name]
+
+
+def watched_files():
+    """Source files whose changes trigger a reload (models are not served by the dashboard, so not watched)"""
+    return [store.DATA_ROOT / csv_name for csv_name, _ in store.TABLES.values()]
+
+
+def input_signature():
+    """Cheap stat-based fingerprint of every watched input (missing files included)"""
+    entries = []
+    for path in watched_files():
+        try:
+            stat = path.stat()
+            entries.append((str(path), stat.st_size, stat.st_mtime_ns))
+        except FileNotFoundError:
+            entries.append((str(path), None, None))
+    return hashlib.sha1(json.dumps(entries).encode()).hexdigest()[:10]
+
+
+def _validate(tables):
+    for name, columns in REQUIRED_COLUMNS.items():
+        if name not in tables:
+            continue
+        missing = [column for column in columns if column not in tables[name].columns]
+        if missing:
+            raise SnapshotValidationError(f"{name}: missing columns {missing}")
+        if name in REQUIRED_TABLES and len(tables[name]) == 0:
+            raise SnapshotValidationError(f"{name}: table is empty")
+
+
+@tracing.traced("versions.load_snapshot")
+def load_snapshot(version=None):
+    """Build, load and validate a complete snapshot of the current inputs"""
+    start = time.perf_counter()
+    version = version or input_signature()
+    tables = {name: store.open_frame(name) for name in REQUIRED_TABLES}  # FileNotFoundError if missing
+    for name in OPTIONAL_TABLES:
+        try:
+            tables[name] = store.open_frame(name)
+        except FileNotFoundError:
+            pass
+    _validate(tables)
+    schema.share_dictionaries(tables)
+    with tracing.span("versions.ndvi_regional_summary"):
+        summary = build_ndvi_regional_summary(tables["ndvi"]) if "ndvi" in tables else None
+    return DataSnapshot(
+        version=version,
+        tables=tables,
+        ndvi_regional_summary=summary,
+        load_seconds=time.perf_counter() - start,
+    )
+
+
+class DataManager:
+    """Holds the active snapshot and reloads it in the background when inputs change"""
+
+    def __init__(self, interval=RELOAD_INTERVAL):
+        self.interval = interval
+        self.last_error = None
+        self._active = None
+        self._rejected_version = None
+        self._lock = threading.Lock()  # serialises reloads; readers never take it
+        self._stop = threading.Event()
+        self._thread = None
+
+    def current(self):
+        snapshot = self._active
+        if snapshot is None:
+            # First request (or inputs still missing): load synchronously
+            snapshot = self.reload()
+        return snapshot
+
+    def reload(self):
+        with self._lock:
+            version = input_signature()
+            active = self._active
+            if active is not None and version in (active.version, self._rejected_version):
+                return active
+            try:
+                snapshot = load_snapshot(version)
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                if active is None:
+                    raise
+                self._rejected_version = version  # don't retry until the inputs change again
+                return active  # keep serving the last good version
+            self.last_error = None
+            self._rejected_version = None
+            self._active = snapshot  # atomic swap
+            return snapshot
+
+    def start(self):
+        if self._thread is None and self.interval > 0:
+            self._thread = threading.Thread(target=self._watch, name="ecofusion-data-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            try:
+                if self._active is not None and input_signature() != self._active.version:
+                    self.reload()
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
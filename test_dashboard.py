@@ -25,6 +25,16 @@ def test_dashboard_startup():
             print(result.stderr)
             return False
         
+        result = subprocess.run([sys.executable, '-m', 'compileall', '-q', 'ecofusion'], 
+                              capture_output=True, text=True)
+        
+        if result.returncode == 0:
+            print("  ✅ ecofusion package syntax is valid")
+        else:
+            print("  ❌ ecofusion package has syntax errors:")
+            print(result.stdout + result.stderr)
+            return False
+        
         # Test that required model files exist
         models_dir = Path("models")
         required_files = [